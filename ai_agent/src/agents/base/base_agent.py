@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 import json
 import logging
+import orjson
 import pprint
 from typing import Dict, Any, List, Optional, Union
 from typing import Dict, Any, List, Optional, Union, Type
 from pydantic import BaseModel, Field
 import traceback
+from langchain.agents import create_structured_chat_agent
+from langchain.agents.output_parsers import JSONAgentOutputParser
 from langchain.tools import StructuredTool
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnableSequence
+from langchain_core.utils.json import parse_json_markdown
 
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.consts.agent_type import AgentType
@@ -15,7 +28,120 @@ from data.embedding.vector_log import VectorLogEntry
 from data.models.conversation.conversation_model import HistoryItem
 from data.models.conversation.conversation_ops import get_conversation_history
 from data.models.simulation.simulation_model import get_simulation
-from data.models.topology.world_model import get_topology_from_redis
+from data.models.topology.world_model import WorldModal, get_topology_from_redis
+
+
+_embedding_util: Optional[EmbeddingUtil] = None
+
+
+def _get_embedding_util() -> EmbeddingUtil:
+    """Return the process-wide EmbeddingUtil, creating it on first use."""
+    global _embedding_util
+    if _embedding_util is None:
+        _embedding_util = EmbeddingUtil()
+    return _embedding_util
+
+
+# Topologies fetched during the current request, by world id. None outside a request scope.
+_request_topologies: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_topologies", default=None
+)
+
+
+@contextmanager
+def topology_request_scope():
+    """Reuse world topologies fetched within the block instead of re-reading Redis.
+
+    The scope is per task context, so concurrent requests never share entries,
+    and tool calls offloaded with asyncio.to_thread inherit it.
+    """
+    token = _request_topologies.set({})
+    try:
+        yield
+    finally:
+        _request_topologies.reset(token)
+
+
+@lru_cache(maxsize=None)
+def get_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON schema of a model, generated once per process."""
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def get_format_instructions(model: Type[BaseModel]) -> str:
+    """Output-parser format instructions for a model, generated once per process."""
+    return PydanticOutputParser(pydantic_object=model).get_format_instructions()
+
+
+def dump_prompt_json(obj: Any) -> str:
+    """Serialize a value for a prompt as JSON with sorted keys, so equal values render identically."""
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str).decode()
+
+
+@lru_cache(maxsize=1)
+def get_world_schema() -> str:
+    """WorldModal field schema used in prompts, generated once per process."""
+    return WorldModal.schema_for_fields()
+
+
+class MultiActionJSONAgentOutputParser(JSONAgentOutputParser):
+    """JSON agent output parser that also accepts a list of tool calls.
+
+    A single action blob parses exactly as with JSONAgentOutputParser. A list
+    of blobs becomes a list of AgentActions, which AgentExecutor runs
+    concurrently on its async path and records in order. A "Final Answer"
+    anywhere in the list finishes the run without calling the other tools.
+    """
+
+    def parse(self, text: str) -> Union[AgentAction, List[AgentAction], AgentFinish]:
+        try:
+            response = parse_json_markdown(text)
+        except Exception as e:
+            raise OutputParserException(f"Could not parse LLM output: {text}") from e
+
+        items = response if isinstance(response, list) else [response]
+        if not items:
+            raise OutputParserException(f"Could not parse LLM output: {text}")
+        try:
+            for item in items:
+                if item["action"] == "Final Answer":
+                    return AgentFinish({"output": item["action_input"]}, text)
+            # Only the first action carries the log so the scratchpad holds it once
+            actions = [
+                AgentAction(item["action"], item.get("action_input") or {}, text if i == 0 else "")
+                for i, item in enumerate(items)
+            ]
+        except (KeyError, TypeError) as e:
+            raise OutputParserException(f"Could not parse LLM output: {text}") from e
+        return actions[0] if len(actions) == 1 else actions
+
+
+AGENT_CACHE_SIZE = 32
+_agent_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def get_structured_chat_agent(llm, tools: List[StructuredTool], prompt):
+    """Return the structured chat agent graph for an llm/tools/prompt combination.
+
+    The graph is immutable, so it is built once and shared. Entries are keyed
+    by the identity of the llm and prompt plus the tool names, and hold
+    references to the llm and prompt so those ids cannot be reused while the
+    entry is cached. The least recently used entry is evicted first.
+    """
+    key = (id(llm), tuple(tool.name for tool in tools), id(prompt))
+    entry = _agent_cache.get(key)
+    if entry is None:
+        agent = create_structured_chat_agent(llm.bind_tools(tools), tools, prompt)
+        # Swap the single-action parser for one that allows parallel tool calls
+        agent = RunnableSequence(*agent.steps[:-1], MultiActionJSONAgentOutputParser())
+        entry = (llm, prompt, agent)
+        _agent_cache[key] = entry
+        if len(_agent_cache) > AGENT_CACHE_SIZE:
+            _agent_cache.popitem(last=False)
+    else:
+        _agent_cache.move_to_end(key)
+    return entry[2]
 
 
 class AgentInputSchema(BaseModel):
@@ -44,8 +170,8 @@ class AgentTask(BaseModel):
         return f"""
         Task: {self.task_id.value}
         Description: {self.description}
-        Input: {self.input_schema.model_json_schema()}
-        Output: {self.output_schema.model_json_schema()}
+        Input: {get_json_schema(self.input_schema)}
+        Output: {get_json_schema(self.output_schema)}
         
         Examples: {self.examples}
         """
@@ -54,42 +180,62 @@ class AgentTask(BaseModel):
 class BaseAgent(ABC):
     """Base class for all agents in the system."""
 
+    # (method name, description) of the tools every agent exposes.
+    _BASE_TOOL_SPECS = (
+        ("_get_relevant_logs", "Retrieve relevant logs for analysis"),
+        (
+            "_get_topology_by_simulation",
+            "Retrieves the detailed network topology configuration for a given simulation ID.",
+        ),
+        (
+            "_get_topology_by_world_id",
+            "Retrieves the detailed network topology configuration for a given world ID.",
+        ),
+        ("_get_chat_history", "Retrieves the chat history for a given conversation ID."),
+    )
+
+    # Maximum number of concurrent runs in run_batch
+    batch_concurrency = 4
+
     def __init__(self, agent_id: AgentType, description: str):
         self.logger = logging.getLogger(f"Agent {__class__.__name__}")
         self.agent_id = agent_id.value
         self.description = description
         self.tasks = self._register_tasks()
 
-        self._get_relevant_logs_tool = StructuredTool.from_function(
-            func=self._get_relevant_logs,
-            name="_get_relevant_logs",
-            description="Retrieve relevant logs for analysis",
-        )
+        self.tools = self._build_tools()
 
-        self._get_topology_by_simulation_tool = StructuredTool.from_function(
-            func=self._get_topology_by_simulation,
-            name="_get_topology_by_simulation",
-            description="Retrieves the detailed network topology configuration for a given simulation ID.",
-        )
+        self.embedding_util = _get_embedding_util()
 
-        self._get_topology_by_world_id_tool = StructuredTool.from_function(
-            func=self._get_topology_by_world_id,
-            name="_get_topology_by_world_id",
-            description="Retrieves the detailed network topology configuration for a given world ID.",
-        )
-        self._get_chat_history_tool = StructuredTool.from_function(
-            func=self._get_chat_history,
-            name="_get_chat_history",
-            description="Retrieves the chat history for a given conversation ID.",
-        )
-        self.tools = [
-            self._get_relevant_logs_tool,
-            self._get_topology_by_simulation_tool,
-            self._get_topology_by_world_id_tool,
-            self._get_chat_history_tool,
-        ]
+    @classmethod
+    def _tool_arg_schemas(cls) -> Dict[str, Type[BaseModel]]:
+        """Per-subclass cache of the argument schemas inferred for each tool."""
+        if "_cached_tool_arg_schemas" not in cls.__dict__:
+            cls._cached_tool_arg_schemas = {}
+        return cls._cached_tool_arg_schemas
+
+    def _build_tools(self) -> List[StructuredTool]:
+        """Wrap the base tool methods, reusing argument schemas across instances.
 
-        self.embedding_util = EmbeddingUtil()
+        Signature introspection only happens for the first instance of each
+        subclass; later instances bind their methods to the cached schemas.
+        Each tool is also exposed as ``self.<method name>_tool`` and is backed
+        by the ``_a<method name>`` coroutine when invoked asynchronously.
+        """
+        arg_schemas = self._tool_arg_schemas()
+        tools = []
+        for name, description in self._BASE_TOOL_SPECS:
+            tool = StructuredTool.from_function(
+                func=getattr(self, name),
+                coroutine=getattr(self, f"_a{name[1:]}"),
+                name=name,
+                description=description,
+                args_schema=arg_schemas.get(name),
+            )
+            arg_schemas.setdefault(name, tool.args_schema)
+            setattr(self, f"{name}_tool", tool)
+            tools.append(tool)
+        return tools
 
     @abstractmethod
     def _register_tasks(self) -> Dict[str, AgentTask]:
@@ -121,25 +267,56 @@ class BaseAgent(ABC):
         """Execute a specific task with the given input data."""
         pass
 
-    def validate_input(
-        self, task_id: str, input_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Validate input data against the task's input schema."""
+    async def run_batch(
+        self, task_id: str, inputs: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Run the same task for several inputs concurrently.
+
+        At most ``batch_concurrency`` runs are in flight at once. Results are
+        returned in input order; a failed run yields its exception instead of
+        cancelling the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def bounded_run(input_data):
+            async with semaphore:
+                return await self.run(task_id, input_data)
+
+        return await asyncio.gather(
+            *(bounded_run(input_data) for input_data in inputs),
+            return_exceptions=True,
+        )
+
+    def validate_input_model(
+        self, task_id: str, input_data: Union[Dict[str, Any], BaseModel]
+    ) -> BaseModel:
+        """Validate input data and return it as an instance of the task's input schema."""
         task = self.get_task_details(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not supported by this agent")
 
         # Validate using Pydantic
         if isinstance(input_data, task.input_schema):
-            validated = input_data
+            return input_data
         elif isinstance(input_data, dict):
-            validated = task.input_schema(**input_data)
-        return validated.model_dump()
+            return task.input_schema.model_validate(input_data)
+        raise TypeError(
+            f"input_data is of type {type(input_data)}, expected dict or {task.input_schema}"
+        )
 
-    def validate_output(
-        self, task_id: str, output_data: Union[Dict[str, Any], BaseModel]
+    def validate_input(
+        self, task_id: str, input_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Validate output data against the task's output schema."""
+        """Validate input data against the task's input schema."""
+        return self.validate_input_model(task_id, input_data).model_dump()
+
+    def validate_output_model(
+        self, task_id: str, output_data: Union[Dict[str, Any], BaseModel]
+    ) -> BaseModel:
+        """Validate output data and return it as an instance of the task's output schema.
+
+        Instances of the output schema are returned as-is rather than revalidated.
+        """
         task = self.get_task_details(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not supported by this agent")
@@ -149,14 +326,10 @@ class BaseAgent(ABC):
                 raise Exception(
                     f"output_data is of type {type(output_data)}, expected type ({task.output_schema})"
                 )
-            else:
-                return output_data.model_dump()
+            return output_data
         elif isinstance(output_data, dict):
             # Validate using Pydantic
-            validated = task.output_schema(**output_data)
-            return validated.model_dump()
-        elif isinstance(output_data, task.output_schema):
-            return output_data.model_dump()
+            return task.output_schema.model_validate(output_data)
         else:
             print(f"Unsupported output data type: {type(output_data)}")
             print(
@@ -171,6 +344,12 @@ class BaseAgent(ABC):
             traceback.print_exc()
             raise ValueError("Unsupported output data type")
 
+    def validate_output(
+        self, task_id: str, output_data: Union[Dict[str, Any], BaseModel]
+    ) -> Dict[str, Any]:
+        """Validate output data against the task's output schema."""
+        return self.validate_output_model(task_id, output_data).model_dump()
+
     def save_agent_response(self, response):
         try:
             with open(f"{self.agent_id}_response.json", "w") as f:
@@ -214,12 +393,19 @@ class BaseAgent(ABC):
 
     def _get_topology_by_world_id(self, world_id: str):
         """Retrieve the topology of a world using vector similarity"""
+        fetched = _request_topologies.get()
+        if fetched is not None and world_id in fetched:
+            return fetched[world_id]
+
         self.logger.debug(f"Retrieving topology for world {world_id}")
         world = get_topology_from_redis(world_id)
         if not world:
             self.logger.error(f"No topology found for world {world_id}")
             return None
-        return world.model_dump()
+        topology = world.model_dump()
+        if fetched is not None:
+            fetched[world_id] = topology
+        return topology
 
     def _get_chat_history(
         self, conversation_id: str, limit: int = 10, skip: int = 0
@@ -236,3 +422,29 @@ class BaseAgent(ABC):
         )
 
         return message_history
+
+    # The storage clients are synchronous, so the async variants run the
+    # lookups in a worker thread. Callers can await several of them with
+    # asyncio.gather instead of paying each round-trip in sequence.
+    async def _aget_relevant_logs(
+        self, simulation_id: str, query: Optional[str] = "*", limit: int = 100
+    ):
+        """Retrieve logs relevant to a question using vector similarity"""
+        return await asyncio.to_thread(
+            self._get_relevant_logs, simulation_id, query, limit
+        )
+
+    async def _aget_topology_by_simulation(self, simulation_id: str):
+        """Retrieve the topology of a simulation using vector similarity"""
+        return await asyncio.to_thread(self._get_topology_by_simulation, simulation_id)
+
+    async def _aget_topology_by_world_id(self, world_id: str):
+        """Retrieve the topology of a world using vector similarity"""
+        return await asyncio.to_thread(self._get_topology_by_world_id, world_id)
+
+    async def _aget_chat_history(
+        self, conversation_id: str, limit: int = 10, skip: int = 0
+    ) -> str:
+        return await asyncio.to_thread(
+            self._get_chat_history, conversation_id, limit, skip
+        )
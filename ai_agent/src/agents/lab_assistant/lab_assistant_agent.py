@@ -1,12 +1,26 @@
+import ast
+import asyncio
+from contextlib import aclosing
+from functools import lru_cache
+import hashlib
 import logging
+import threading
 import traceback
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from fastapi import HTTPException
-from ai_agent.src.agents.base.base_agent import AgentTask, BaseAgent
+import orjson
+from ai_agent.src.agents.base.base_agent import (
+    AgentTask,
+    BaseAgent,
+    dump_prompt_json,
+    get_structured_chat_agent,
+)
 from ai_agent.src.agents.lab_assistant.prompt import (
     LAB_CODE_ASSIST_PROMPT,
     LAB_PEER_PROMPT,
+    PEER_FORMAT_INSTRUCTIONS,
+    VIBE_FORMAT_INSTRUCTIONS,
 )
 from ai_agent.src.agents.lab_assistant.solution_code import SOLUTION_CODE_LAB_4
 from ai_agent.src.agents.lab_assistant.structures import (
@@ -18,24 +32,103 @@ from ai_agent.src.agents.lab_assistant.structures import (
 from ai_agent.src.consts.agent_type import AgentType
 
 from langchain_openai import ChatOpenAI
+from langchain_core.agents import AgentFinish
 from langchain_core.prompts import (
     ChatPromptTemplate,
     HumanMessagePromptTemplate,
     SystemMessagePromptTemplate,
 )
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain.agents import create_structured_chat_agent, AgentExecutor
+from langchain.agents import AgentExecutor
 
 from ai_agent.src.agents.base.base_structures import BaseAgentInput
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.exceptions.llm_exception import LLMDoesNotExists, LLMError
+from config.config import get_config
 from data.models.topology.summarizer import generate_topology_summary
 
 
+TOPOLOGY_SUMMARY_CACHE_SIZE = 256
+_topology_summaries: Dict[str, str] = {}
+# Summaries are computed in worker threads, so cache updates are serialized
+_topology_summaries_lock = threading.Lock()
+
+
+def _summarize_topology(topology: Optional[Dict[str, Any]]) -> str:
+    """Summarize a topology, reusing the summary of an identical topology if cached."""
+    if not topology:
+        return 'No topology created yet!'
+    key = hashlib.blake2b(
+        orjson.dumps(topology, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+    summary = _topology_summaries.get(key)
+    if summary is None:
+        summary = generate_topology_summary(topology)
+        with _topology_summaries_lock:
+            if len(_topology_summaries) >= TOPOLOGY_SUMMARY_CACHE_SIZE:
+                # Evict the oldest entry
+                del _topology_summaries[next(iter(_topology_summaries))]
+            _topology_summaries[key] = summary
+    return summary
+
+
+# Lines of context kept around the target function when trimming student code
+STUDENT_CODE_CONTEXT_LINES = 5
+
+
+@lru_cache(maxsize=128)
+def _function_spans(student_code: str) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """(start, end) line spans of every function in the code, or None if it does not parse."""
+    try:
+        tree = ast.parse(student_code)
+    except SyntaxError:
+        return None
+    return tuple(
+        sorted(
+            (node.lineno, node.end_lineno)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        )
+    )
+
+
+def _trim_student_code(student_code: str, cursor_line_number: int) -> str:
+    """Keep only the function around the cursor plus a few lines of context.
+
+    The target is the innermost function containing the cursor, else the
+    closest one defined above it. Code that does not parse, or has no such
+    function, is returned whole. The returned snippet is prefixed with its
+    line range so line numbers still refer to the full file.
+    """
+    spans = _function_spans(student_code)
+    if not spans:
+        return student_code
+
+    target = None
+    for start, end in spans:
+        if start > cursor_line_number:
+            break
+        if end >= cursor_line_number or target is None or target[1] < cursor_line_number:
+            target = (start, end)
+    if target is None:
+        return student_code
+
+    lines = student_code.splitlines()
+    first = max(target[0] - STUDENT_CODE_CONTEXT_LINES, 1)
+    last = min(target[1] + STUDENT_CODE_CONTEXT_LINES, len(lines))
+    if first == 1 and last == len(lines):
+        return student_code
+    snippet = "\n".join(lines[first - 1 : last])
+    return f"# (lines {first}-{last} of {len(lines)}; line numbers refer to the full file)\n{snippet}"
+
+
 class LabAssistantAgent(BaseAgent):
 
     logger = logging.getLogger(__name__)
 
+    # Lab peer requests are small and independent, so a classroom batch can fan out wider
+    batch_concurrency = 8
+
     def __init__(self, llm=None):
         super().__init__(
             agent_id=AgentType.LOG_SUMMARIZER,
@@ -43,6 +136,80 @@ class LabAssistantAgent(BaseAgent):
         )
         self.llm: ChatOpenAI = llm
 
+        # Prompts are static per agent, build them once instead of per request.
+        # Static content (instructions, solution code) leads each prompt and the
+        # per-request fields come last so the provider can cache the prefix.
+        self._code_prompt = self._build_prompt(
+            LAB_CODE_ASSIST_PROMPT, VIBE_FORMAT_INSTRUCTIONS
+        ).partial(solution_code=SOLUTION_CODE_LAB_4)
+        self._peer_prompt = self._build_prompt(LAB_PEER_PROMPT, PEER_FORMAT_INSTRUCTIONS)
+        self._executors = {}
+        self._task_handlers = {
+            AgentTaskType.LAB_CODE_ASSIST: self._lab_code_assist,
+            AgentTaskType.LAB_PEER: self._lab_peer_agent,
+        }
+
+    @staticmethod
+    def _build_prompt(
+        system_template: str, format_instructions: str
+    ) -> ChatPromptTemplate:
+        system_message_prompt = SystemMessagePromptTemplate.from_template(
+            system_template
+        )
+        human_message_prompt = HumanMessagePromptTemplate.from_template(
+            "{input}\n\n{agent_scratchpad}"
+        )
+        prompt = ChatPromptTemplate.from_messages(
+            [system_message_prompt, human_message_prompt]
+        )
+        return prompt.partial(format_instructions=format_instructions)
+
+    def _get_executor(self, llm, tools, prompt: ChatPromptTemplate) -> AgentExecutor:
+        """Return a reusable AgentExecutor for this llm/tools/prompt.
+
+        The executor keeps no per-call state, so one instance can serve every
+        request. Construction is synchronous, so concurrent coroutines cannot
+        race on the first build.
+        """
+        key = (id(llm), tuple(tool.name for tool in tools), id(prompt))
+        agent_executor = self._executors.get(key)
+        if agent_executor is None:
+            debug = get_config().agents.debug
+            agent_executor = AgentExecutor(
+                agent=get_structured_chat_agent(llm, tools, prompt),
+                tools=tools,
+                verbose=debug,
+                return_intermediate_steps=debug,
+                handle_parsing_errors="Make sure 'Response Format' are followed. 'action' and 'action_input' fields should be present",
+                max_iterations=5,
+                early_stopping_method="force",
+            )
+            self._executors[key] = agent_executor
+        return agent_executor
+
+    async def _ainvoke_until_final_answer(
+        self, agent_executor: AgentExecutor, agent_input: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run the executor as an event stream and return as soon as the agent finishes.
+
+        Returns the same ``{"output": ...}`` shape as ``ainvoke``. Closing the
+        stream on the first AgentFinish cancels any generation still in flight.
+        """
+        response = {}
+        async with aclosing(
+            agent_executor.astream_events(agent_input, version="v2")
+        ) as events:
+            async for event in events:
+                if not event["event"].endswith("_end"):
+                    continue
+                output = event["data"].get("output")
+                if isinstance(output, AgentFinish):
+                    return output.return_values
+                if not event.get("parent_ids") and isinstance(output, dict):
+                    # Root executor finished without an AgentFinish being surfaced
+                    response = output
+        return response
+
     def _register_tasks(self):
         return {
             AgentTaskType.LAB_CODE_ASSIST: AgentTask(
@@ -67,14 +234,13 @@ class LabAssistantAgent(BaseAgent):
     async def run(
         self, task_id: AgentTaskType, input_data: Union[Dict[str, Any], BaseAgentInput]
     ):
-        validated_input = self.validate_input(task_id, input_data)
-        if task_id == AgentTaskType.LAB_CODE_ASSIST:
-            result = await self._lab_code_assist(validated_input)
-        if task_id == AgentTaskType.LAB_PEER:
-            result = await self._lab_peer_agent(validated_input)
-        else:
+        handler = self._task_handlers.get(task_id)
+        if handler is None:
             raise ValueError(f"Task {task_id} not supported")
 
+        validated_input = self.validate_input(task_id, input_data)
+        result = await handler(validated_input)
+
         # Validate output
         return self.validate_output(task_id, result)
 
@@ -86,46 +252,17 @@ class LabAssistantAgent(BaseAgent):
                 detail={"message": "No code provided"},
             )
 
-        output_parser = PydanticOutputParser(pydantic_object=VibeCodeFunctionOutput)
-
-        system_template = LAB_CODE_ASSIST_PROMPT
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            system_template
-        )
-        human_message_prompt = HumanMessagePromptTemplate.from_template(
-            "{input}\n\n{agent_scratchpad}"
-        )
-        prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-
-        prompt = prompt.partial(
-            format_instructions=output_parser.get_format_instructions()
-        )
-
         if self.llm and self.tools:
-            llm_with_tools = self.llm.bind_tools(self.tools)
-
-            agent = create_structured_chat_agent(llm_with_tools, self.tools, prompt)
-
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                verbose=True,
-                return_intermediate_steps=True,
-                handle_parsing_errors="Make sure 'Response Format' are followed. 'action' and 'action_input' fields should be present",
-                max_iterations=5,
-                early_stopping_method="force",
-            )
+            agent_executor = self._get_executor(self.llm, self.tools, self._code_prompt)
 
             try:
                 response = await agent_executor.ainvoke(
                     {
-                        "student_code": input_data.get("student_code"),
+                        "student_code": _trim_student_code(
+                            input_code, input_data.get("cursor_line_number")
+                        ),
                         "query": input_data.get("user_query"),
                         "cursor_line_number": input_data.get("cursor_line_number"),
-                        "solution_code": SOLUTION_CODE_LAB_4,
                         "input": input_data.get("user_query"),
                     }
                 )
@@ -150,47 +287,23 @@ class LabAssistantAgent(BaseAgent):
             # Fallback to using the main model
             lite_llm = self.llm
 
-        output_parser = PydanticOutputParser(pydantic_object=LabPeerAgentOutput)
-        system_template = LAB_PEER_PROMPT
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            system_template
-        )
-        human_message_prompt = HumanMessagePromptTemplate.from_template(
-            "{input}\n\n{agent_scratchpad}"
-        )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-
-        prompt = prompt.partial(
-            format_instructions=output_parser.get_format_instructions()
-        )
         tools = [self._get_chat_history_tool]
 
         if lite_llm and tools:
-            llm_with_tools = lite_llm.bind_tools(tools)
-
-            agent = create_structured_chat_agent(llm_with_tools, tools, prompt)
-
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=tools,
-                verbose=True,
-                return_intermediate_steps=True,
-                handle_parsing_errors="Make sure 'Response Format' are followed. 'action' and 'action_input' fields should be present",
-                max_iterations=5,
-                early_stopping_method="force",
-            )
-
-            chat_history = self._get_chat_history(input_data.get("conversation_id"), 2)
+            agent_executor = self._get_executor(lite_llm, tools, self._peer_prompt)
 
             try:
-                response = await agent_executor.ainvoke(
+                # Fetch the history and summarize the topology concurrently, both off the event loop
+                chat_history, topology_summary = await asyncio.gather(
+                    self._aget_chat_history(input_data.get("conversation_id"), 2),
+                    asyncio.to_thread(_summarize_topology, input_data.get("current_topology")),
+                )
+
+                response = await self._ainvoke_until_final_answer(
+                    agent_executor,
                     dict(
-                        LAB_JSON=input_data.get("lab_instructions"),
-                        CURRENT_TOPOLOGY=generate_topology_summary(input_data.get("current_topology")) if input_data.get("current_topology") else 'No topology created yet!',
+                        LAB_JSON=dump_prompt_json(input_data.get("lab_instructions")),
+                        CURRENT_TOPOLOGY=topology_summary,
                         CONVERSATION_HISTORY=chat_history,
                         input=input_data.get("user_query"),
                     )
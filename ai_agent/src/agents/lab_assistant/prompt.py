@@ -11,22 +11,13 @@ You have access to the following tool:
 
 You will be given the following information:
 
-*   **Student's Code:** The full code file the student is currently editing.
-    ```python
-    {student_code}
-    ```
-
-*   **Student's Query:** The question the student asked.
-    `{query}`
-
-*   **Cursor Position:** The line number where the student's cursor is located.
-    `{cursor_line_number}`
-
 *   **Correct Solution Code:** The complete and correct code for the entire lab.
     ```python
     {solution_code}
     ```
 
+*   **Student's Code**, **Student's Query** and **Cursor Position**: provided in the STUDENT REQUEST section at the end of this message.
+
 ### INSTRUCTIONS
 
 Follow these steps to generate your response:
@@ -70,6 +61,21 @@ You MUST strictly adhere to the following JSON formats for your responses.
 
     Schema Definition for the `action_input` object:
     {format_instructions}
+
+---
+
+### STUDENT REQUEST
+
+*   **Student's Code:** The part of the file the student is currently editing, centred on the cursor. When only part of the file is shown, its first line states which lines are included; line numbers always refer to the full file.
+    ```python
+    {student_code}
+    ```
+
+*   **Student's Query:** The question the student asked.
+    `{query}`
+
+*   **Cursor Position:** The line number where the student's cursor is located.
+    `{cursor_line_number}`
 """
 
 
@@ -87,26 +93,6 @@ You have access to the following tools:
 {tools}
 {tool_names}
 ---
-### **CONTEXT**
-
-**1. Current Lab Definition:**
-This is the full description of the lab the student is currently attempting. It includes the goals, required components, step-by-step instructions, and helpful tips.
-
-```json
-{LAB_JSON}
-```
-
-2. Student's Current Lab State:
-This is the current topology of the simulation canvas as created by the student.
-
-{CURRENT_TOPOLOGY}
-
-
-3. Conversation History:
-This is the ongoing dialogue between you (the AI Lab Peer) and the student. It provides context for the student's current query.
-{CONVERSATION_HISTORY}
-
-
 **Response Format:**
 You MUST strictly adhere to the following JSON formats for your responses.
 
@@ -129,4 +115,50 @@ You MUST strictly adhere to the following JSON formats for your responses.
 
     Schema Definition for the `action_input` object:
     {format_instructions}
-"""
\ No newline at end of file
+
+---
+### **CONTEXT**
+
+**1. Current Lab Definition:**
+This is the full description of the lab the student is currently attempting. It includes the goals, required components, step-by-step instructions, and helpful tips.
+
+```json
+{LAB_JSON}
+```
+
+2. Student's Current Lab State:
+This is the current topology of the simulation canvas as created by the student.
+
+{CURRENT_TOPOLOGY}
+
+
+3. Conversation History:
+This is the ongoing dialogue between you (the AI Lab Peer) and the student. It provides context for the student's current query.
+{CONVERSATION_HISTORY}
+"""
+
+# Hand-trimmed replacements for the auto-generated Pydantic schemas of
+# VibeCodeFunctionOutput and LabPeerAgentOutput; keep them in sync with structures.py.
+VIBE_FORMAT_INSTRUCTIONS = """
+A JSON object with these fields:
+- "function_name" (string): name of the target function, e.g. "create_bell_pair".
+- "start_line_number" (integer >= 1): line where the function's `def` begins in the student's code.
+- "generated_code" (string): the full, correctly-indented function from `def` to its last line. Empty string if the query is not about code generation.
+- "explanation" (string): student-facing explanation of the code's logic and purpose.
+- "confidence_score" (number 0.0-1.0, optional): confidence in the response.
+
+Example:
+{"function_name": "create_bell_pair", "start_line_number": 12, "generated_code": "def create_bell_pair():\\n    ...", "explanation": "This function ...", "confidence_score": 0.9}
+"""
+
+
+PEER_FORMAT_INSTRUCTIONS = """
+A JSON object with these fields:
+- "response" (string): your reply to the student.
+- "thought_process" (string): the reasoning that led to the reply.
+- "response_type" (one of "direct_answer", "guided_discovery", "hint"; default "direct_answer").
+- "confidence_score" (number 0.0-1.0, optional): confidence in the response.
+
+Example:
+{"response": "Let's check how the hosts are connected...", "thought_process": "The student has no channel between ...", "response_type": "guided_discovery", "confidence_score": 0.8}
+"""
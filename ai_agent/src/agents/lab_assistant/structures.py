@@ -51,11 +51,11 @@ class VibeCodeFunctionOutput(BaseModel):
         description="A user-facing explanation of the provided code's logic and purpose."
     )
     
+    # Range (0.0-1.0) is stated in the prompt rather than enforced here, so a
+    # slightly out-of-range score from the LLM does not fail the whole response.
     confidence_score: Optional[float] = Field(
         None,
-        ge=0.0,
-        le=1.0,
-        description="The agent's confidence in the accuracy and relevance of the response."
+        description="The agent's confidence (0.0-1.0) in the accuracy and relevance of the response."
     )
 
 
@@ -66,6 +66,6 @@ class LabPeerAgentInput(BaseAgentInput):
 
 class LabPeerAgentOutput(BaseModel):
     response: str = Field(..., description="Response to the peer's question.")
-    confidence_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="The agent's confidence in the accuracy and relevance of the response.")
+    confidence_score: Optional[float] = Field(None, description="The agent's confidence (0.0-1.0) in the accuracy and relevance of the response.")
     thought_process: str = Field(..., description="The agent's thought process leading to the answer.")
     response_type: Literal["direct_answer", "guided_discovery", "hint"] = Field("direct_answer", description="Type of response provided by the agent.")
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import traceback
@@ -37,7 +38,7 @@ from ai_agent.src.consts.agent_type import AgentType
 from ai_agent.src.exceptions.llm_exception import LLMDoesNotExists, LLMError
 from data.embedding.embedding_util import EmbeddingUtil
 from data.embedding.langchain_integration import SimulationLogRetriever
-from ai_agent.src.agents.base.base_agent import BaseAgent, AgentTask
+from ai_agent.src.agents.base.base_agent import BaseAgent, AgentTask, dump_prompt_json
 from data.models.topology.world_model import WorldModal
 
 from langchain_ollama import ChatOllama
@@ -112,14 +113,14 @@ class LogSummarizationAgent(BaseAgent):
     ) -> Dict[str, Any]:
         """Execute a specific task with the given input data."""
         # Validate input
-        validated_input = self.validate_input(task_id, input_data)
+        validated_input = self.validate_input_model(task_id, input_data)
 
         if task_id == AgentTaskType.LOG_SUMMARIZATION:
-            result = await self._summarize_logs(validated_input)
+            result = await self._summarize_logs(validated_input.model_dump())
         elif task_id == AgentTaskType.LOG_QNA:
             result = await self.log_qna(validated_input)
         elif task_id == AgentTaskType.EXTRACT_PATTERNS:
-            result = await self._extract_patterns(validated_input)
+            result = await self._extract_patterns(validated_input.model_dump())
         elif task_id == AgentTaskType.REALTIME_LOG_SUMMARY:
             result = await self.realtime_log_summary(validated_input)
         else:
@@ -132,7 +133,7 @@ class LogSummarizationAgent(BaseAgent):
         """Summarize log entries."""
         simulation_id = input_data.get("simulation_id")
         if simulation_id:
-            logs = self._get_relevant_logs(simulation_id, "*")
+            logs = await self._aget_relevant_logs(simulation_id, "*")
         else:
             logs = input_data.get("logs", [])
 
@@ -244,22 +245,22 @@ class LogSummarizationAgent(BaseAgent):
             )
 
             try:
+                topology_data, last_5_messages = await asyncio.gather(
+                    self._aget_topology_by_simulation(input_data.simulation_id),
+                    self._aget_chat_history(input_data.conversation_id, 5),
+                )
                 agent_input = {
                     "simulation_id": input_data.simulation_id,
-                    "topology_data": self._get_topology_by_simulation(
-                        input_data.simulation_id
-                    ),
+                    "topology_data": dump_prompt_json(topology_data),
                     "conversation_id": input_data.conversation_id,
                     "optional_instructions": input_data.optional_instructions
                     or "None provided. Apply general optimization principles.",
                     "answer_instructions": format_instructions,
                     "user_question": input_data.user_query,
-                    "last_5_messages": self._get_chat_history(
-                        input_data.conversation_id, 5
-                    ),
+                    "last_5_messages": last_5_messages,
                     "input": f"Answer the following question about the logs of simulation {input_data.simulation_id}: {input_data.user_query}",
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
@@ -357,7 +358,7 @@ class LogSummarizationAgent(BaseAgent):
                     "answer_instructions": format_instructions,
                     "input": "Summarize delta logs from the simulation and append delta summary to previous summary.",
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
@@ -0,0 +1,89 @@
+"""In-process semantic cache for topology QnA answers."""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import orjson
+
+from ai_agent.src.agents.topology_agent.structure import TopologyQnAOutput
+
+
+def topology_version(topology: Optional[Dict[str, Any]]) -> str:
+    """Return a digest identifying the exact contents of a topology."""
+    return hashlib.blake2b(
+        orjson.dumps(topology, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+
+
+class _CacheEntry:
+    __slots__ = ("embedding", "version", "output", "expires_at")
+
+    def __init__(self, embedding: np.ndarray, version: str, output: TopologyQnAOutput, expires_at: float):
+        self.embedding = embedding
+        self.version = version
+        self.output = output
+        self.expires_at = expires_at
+
+
+class SemanticQnACache:
+    """
+    Cache QnA answers per world, matched by cosine similarity of the question
+    embedding. An entry only matches while the world's topology version is
+    unchanged, so saving a modified world invalidates its answers.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.92, ttl_seconds: int = 3600, max_entries_per_world: int = 64):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_world = max_entries_per_world
+        self._entries: Dict[str, List[_CacheEntry]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def get(self, world_id: str, version: str, embedding: Sequence[float]) -> Optional[TopologyQnAOutput]:
+        """Return a copy of the best cached answer above the threshold, if any."""
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entries = [
+                entry for entry in self._entries.get(world_id, [])
+                if entry.expires_at > now and entry.version == version
+            ]
+            if entries:
+                self._entries[world_id] = entries
+            else:
+                self._entries.pop(world_id, None)
+                return None
+
+        similarities = np.stack([entry.embedding for entry in entries]) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return entries[best].output.model_copy(deep=True)
+
+    def put(self, world_id: str, version: str, embedding: Sequence[float], output: TopologyQnAOutput):
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        entry = _CacheEntry(vector, version, output.model_copy(deep=True), time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            entries = self._entries.setdefault(world_id, [])
+            entries.append(entry)
+            if len(entries) > self.max_entries_per_world:
+                # Drop the oldest entries
+                del entries[: len(entries) - self.max_entries_per_world]
@@ -1,24 +1,37 @@
+import asyncio
+import hashlib
 from logging import getLogger
-import traceback
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import (
     ChatPromptTemplate,
     HumanMessagePromptTemplate,
     SystemMessagePromptTemplate,
 )
-from langchain.agents import create_structured_chat_agent, AgentExecutor
-
-from ai_agent.src.agents.base.base_agent import AgentTask, BaseAgent
+from langchain.agents import AgentExecutor
+import orjson
+
+from ai_agent.src.agents.base.base_agent import (
+    AgentTask,
+    BaseAgent,
+    dump_prompt_json,
+    get_format_instructions,
+    get_structured_chat_agent,
+    get_world_schema,
+    topology_request_scope,
+)
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.agents.topology_agent.examples import SYNTHESIZE_EXAMPLES, TOPOLOGY_OPTIMIZE_EXAMPLES
 from ai_agent.src.agents.topology_agent.prompt import (
     TOPOLOGY_GENERATOR_AGENT,
+    TOPOLOGY_GENERATOR_INPUT,
+    TOPOLOGY_OPTIMIZER_INPUT,
     TOPOLOGY_OPTIMIZER_PROMPT,
+    TOPOLOGY_QNA_INPUT,
     TOPOLOGY_QNA_PROMPT,
 )
+from ai_agent.src.agents.topology_agent.qna_cache import SemanticQnACache, topology_version
 from ai_agent.src.agents.topology_agent.structure import (
     OptimizeTopologyOutput,
     OptimizeTopologyRequest,
@@ -27,19 +40,63 @@ from ai_agent.src.agents.topology_agent.structure import (
     TopologyQnAOutput,
     TopologyQnARequest,
 )
-from ai_agent.src.agents.validation_agent.structures import TopologyValidationResult, ValidationStatus
+from ai_agent.src.agents.validation_agent.structures import ValidationStatus
 from ai_agent.src.agents.validation_agent.validation_agent import ValidationAgent
 from ai_agent.src.consts.agent_type import AgentType
 from ai_agent.src.exceptions.llm_exception import LLMError
 from config.config import get_config
+from config.llm_config import QnACacheConfig
 from data.models.conversation.conversation_model import AgentExecutionStatus
 from data.models.conversation.conversation_ops import finish_agent_turn, start_agent_turn
 from data.models.topology.world_model import WorldModal, save_world_to_redis
 
+_qna_cache: Optional[SemanticQnACache] = None
+
+# Background world saves, referenced here so they are not garbage collected mid-flight
+_pending_world_saves: Set[asyncio.Task] = set()
+
+
+def _get_qna_cache(cache_config: QnACacheConfig) -> Optional[SemanticQnACache]:
+    """Return the process-wide QnA cache, or None when it is disabled."""
+    global _qna_cache
+    if not cache_config.enabled:
+        return None
+    if _qna_cache is None:
+        _qna_cache = SemanticQnACache(
+            similarity_threshold=cache_config.similarity_threshold,
+            ttl_seconds=cache_config.ttl_seconds,
+            max_entries_per_world=cache_config.max_entries_per_world,
+        )
+    return _qna_cache
+
 
 class TopologyAgent(BaseAgent):
     logger = getLogger(__name__)
 
+    # Static system prompt, per-request input template, output schema and the
+    # prompt variable that receives the schema's format instructions, per task.
+    # The static prompt is sent first so repeated requests share a cacheable prefix.
+    _TASK_PROMPTS = {
+        AgentTaskType.SYNTHESIZE_TOPOLOGY: (
+            TOPOLOGY_GENERATOR_AGENT,
+            TOPOLOGY_GENERATOR_INPUT,
+            SynthesisTopologyOutput,
+            "answer_instructions",
+        ),
+        AgentTaskType.OPTIMIZE_TOPOLOGY: (
+            TOPOLOGY_OPTIMIZER_PROMPT,
+            TOPOLOGY_OPTIMIZER_INPUT,
+            OptimizeTopologyOutput,
+            "format_instructions",
+        ),
+        AgentTaskType.TOPOLOGY_QNA: (
+            TOPOLOGY_QNA_PROMPT,
+            TOPOLOGY_QNA_INPUT,
+            TopologyQnAOutput,
+            "answer_instructions",
+        ),
+    }
+
     def __init__(self, llm=None):
         super().__init__(
             agent_id=AgentType.TOPOLOGY_DESIGNER,
@@ -51,6 +108,48 @@ class TopologyAgent(BaseAgent):
 
         self.llm: ChatOpenAI = llm
         self.validation_agent = ValidationAgent(llm)
+        # Read once; clear_config_cache() only takes effect for agents created afterwards
+        self.validation_config = get_config().agents.agent_validation
+        self.qna_cache = _get_qna_cache(get_config().agents.qna_cache)
+        self._executors: Dict[AgentTaskType, AgentExecutor] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._dispatch = {
+            AgentTaskType.OPTIMIZE_TOPOLOGY: self.update_topology,
+            AgentTaskType.SYNTHESIZE_TOPOLOGY: self._synthesize_and_validate,
+            AgentTaskType.TOPOLOGY_QNA: self.topology_qna,
+        }
+
+    def _get_executor(self, task_id: AgentTaskType) -> AgentExecutor:
+        """Return the AgentExecutor for a task, building its prompt and agent on first use."""
+        agent_executor = self._executors.get(task_id)
+        if agent_executor is None:
+            system_prompt, input_prompt, output_schema, instructions_key = self._TASK_PROMPTS[task_id]
+            human_message_prompt = HumanMessagePromptTemplate.from_template(
+                "{input}\n\n{agent_scratchpad}"
+            )
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    SystemMessagePromptTemplate.from_template(system_prompt),
+                    SystemMessagePromptTemplate.from_template(input_prompt),
+                    human_message_prompt,
+                ]
+            )
+            static_variables = {instructions_key: get_format_instructions(output_schema)}
+            if "world_instructions" in prompt.input_variables:
+                static_variables["world_instructions"] = get_world_schema()
+            prompt = prompt.partial(**static_variables)
+
+            agent_executor = AgentExecutor(
+                agent=get_structured_chat_agent(self.llm, self.tools, prompt),
+                tools=self.tools,
+                verbose=True,
+                return_intermediate_steps=True,
+                handle_parsing_errors=True,
+                max_iterations=5,
+                early_stopping_method="force",
+            )
+            self._executors[task_id] = agent_executor
+        return agent_executor
 
     def _register_tasks(self):
         return {
@@ -83,46 +182,14 @@ class TopologyAgent(BaseAgent):
     async def run(
         self, task_id: AgentTaskType, input_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        validated_input = self.validate_input(task_id, input_data)
-        turn = start_agent_turn(input_data['conversation_id'], self.agent_id, task_id, validated_input)
-        if task_id == AgentTaskType.OPTIMIZE_TOPOLOGY:
-            result = await self.update_topology(validated_input)
-        elif task_id == AgentTaskType.SYNTHESIZE_TOPOLOGY:
-            result = await self.synthesize_topology(validated_input)
-            config = get_config()
-
-
-            if config.agents.agent_validation.enabled:
-                # validate the synthesis result with the validation agent
-                errors = await self.validation_agent.run(AgentTaskType.VALIDATE_TOPOLOGY, {'generate_response': result})
-                
-                errors = TopologyValidationResult(**errors)
-                # Handle validation errors
-                if errors.validation_status == ValidationStatus.FAILED:
-                    result.success = False
-                    result.error =','.join(errors.static_errors)
-                    result.overall_feedback = "Synthesis failed due to validation errors."
-                elif errors.validation_status == ValidationStatus.FAILED_WITH_ERRORS:
-                    result.success = False
-                    result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
-                    result.overall_feedback = "Synthesis failed due to validation errors."
-                elif errors.validation_status == ValidationStatus.PASSED_WITH_WARNINGS:
-                    result.success = True
-                    result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
-                elif errors.validation_status == ValidationStatus.FAILED_RETRY_RECOMMENDED:
-                    # Recommend retry with specific feedback if enabled
-                    if config.agents.agent_validation.regenerate_on_invalid:
-                        validated_input['regeneration_feedback'] = errors.regeneration_feedback
-                        result = await self.synthesize_topology(validated_input)
-                    else:
-                        result.success = False
-                        result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
-                        result.overall_feedback = "Synthesis failed due to validation errors."
-                
-        elif task_id == AgentTaskType.TOPOLOGY_QNA:
-            result = await self.topology_qna(validated_input)
-        else:
-            raise ValueError(f"Unsupported task ID: {task_id}")
+        validated_input = self.validate_input_model(task_id, input_data)
+        turn = start_agent_turn(validated_input.conversation_id, self.agent_id, task_id, validated_input.model_dump())
+        with topology_request_scope():
+            if task_id != AgentTaskType.TOPOLOGY_QNA:
+                # Generated worlds are mutated and saved per caller, so they are never shared
+                result = await self._execute_task(task_id, validated_input)
+            else:
+                result = await self._run_coalesced(task_id, validated_input)
 
         # Validate output
         validated_output =  self.validate_output(task_id, result)
@@ -133,55 +200,150 @@ class TopologyAgent(BaseAgent):
 
             if task_id == AgentTaskType.SYNTHESIZE_TOPOLOGY:
                 result.generated_topology.temporary_world = True
-                result.generated_topology = save_world_to_redis(result.generated_topology)
+                self._save_world_in_background(result.generated_topology)
             elif task_id == AgentTaskType.OPTIMIZE_TOPOLOGY:
                 result.optimized_topology.temporary_world = True
-                result.optimized_topology = save_world_to_redis(result.optimized_topology)
+                self._save_world_in_background(result.optimized_topology)
         return validated_output
 
-    async def synthesize_topology(
-        self, input_data: Union[Dict[str, Any], SynthesisTopologyRequest]
-    ):
-        if isinstance(input_data, Dict):
-            # Implement the logic to optimize the topology based on the provided instructions
-            input_data = SynthesisTopologyRequest(**input_data)
-        parser = PydanticOutputParser(pydantic_object=SynthesisTopologyOutput)
-        format_instructions = parser.get_format_instructions()
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            TOPOLOGY_GENERATOR_AGENT
-        )
+    def _save_world_in_background(self, world: WorldModal):
+        """Persist a generated world without holding up the response.
+
+        The world's pk is assigned when the model is built, so the response
+        already carries the id the saved record will have.
+        """
+        task = asyncio.create_task(asyncio.to_thread(save_world_to_redis, world))
+        _pending_world_saves.add(task)
+        task.add_done_callback(self._on_world_saved)
+
+    def _on_world_saved(self, task: asyncio.Task):
+        _pending_world_saves.discard(task)
+        if not task.cancelled() and task.exception():
+            self.logger.error("Failed to save generated world", exc_info=task.exception())
+
+    def _inflight_key(self, task_id: AgentTaskType, validated_input) -> str:
+        """Key identifying semantically equal requests for coalescing."""
+        return hashlib.blake2b(
+            orjson.dumps(
+                [task_id.value, validated_input.model_dump(mode="json")],
+                option=orjson.OPT_SORT_KEYS,
+                default=str,
+            ),
+            digest_size=16,
+        ).hexdigest()
+
+    async def _run_coalesced(self, task_id: AgentTaskType, validated_input):
+        """Run a task, sharing one execution between concurrent identical requests."""
+        key = self._inflight_key(task_id, validated_input)
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._execute_task(task_id, validated_input))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the shared work
+        return await asyncio.shield(pending)
+
+    async def _execute_task(self, task_id: AgentTaskType, validated_input):
+        handler = self._dispatch.get(task_id)
+        if handler is None:
+            raise ValueError(f"Unsupported task ID: {task_id}")
+        return await handler(validated_input)
 
-        human_message_prompt = HumanMessagePromptTemplate.from_template(
-            "{input}\n\n{agent_scratchpad}"
-        )
+    async def _synthesize_and_validate(self, validated_input: SynthesisTopologyRequest):
+        """Synthesize a topology and, if enabled, check it with the validation agent."""
+        result = await self.synthesize_topology(validated_input)
+        validation_config = self.validation_config
 
-        prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
+        if validation_config.enabled:
+            speculative_retry = None
+            if validation_config.regenerate_on_invalid and validation_config.speculative_retry:
+                # Overlap a candidate retry with validation instead of running it afterwards
+                speculative_retry = asyncio.create_task(self.synthesize_topology(validated_input))
 
-        if self.llm:
-            llm_with_tools = self.llm.bind_tools(self.tools)
+            # validate the synthesis result with the validation agent
+            try:
+                errors = await self.validation_agent.validate_topology(result)
+            except BaseException:
+                if speculative_retry:
+                    speculative_retry.cancel()
+                raise
+            if speculative_retry and errors.validation_status != ValidationStatus.FAILED_RETRY_RECOMMENDED:
+                speculative_retry.cancel()
+                speculative_retry = None
+
+            # Handle validation errors
+            if errors.validation_status == ValidationStatus.FAILED:
+                result.success = False
+                result.error =','.join(errors.static_errors)
+                result.overall_feedback = "Synthesis failed due to validation errors."
+            elif errors.validation_status == ValidationStatus.FAILED_WITH_ERRORS:
+                result.success = False
+                result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
+                result.overall_feedback = "Synthesis failed due to validation errors."
+            elif errors.validation_status == ValidationStatus.PASSED_WITH_WARNINGS:
+                result.success = True
+                result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
+            elif errors.validation_status == ValidationStatus.FAILED_RETRY_RECOMMENDED:
+                # Recommend retry with specific feedback if enabled
+                if speculative_retry:
+                    result = await speculative_retry
+                elif validation_config.regenerate_on_invalid:
+                    validated_input = validated_input.model_copy(
+                        update={'regeneration_feedback': errors.regeneration_feedback}
+                    )
+                    result = await self.synthesize_topology(validated_input, previous_result=result)
+                else:
+                    result.success = False
+                    result.error = [f"{i.issue_type}: {i.description}" for i in errors.issues_found]
+                    result.overall_feedback = "Synthesis failed due to validation errors."
 
-            agent = create_structured_chat_agent(llm_with_tools, self.tools, prompt)
+        return result
 
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                verbose=True,
-                return_intermediate_steps=True,
-                handle_parsing_errors=True,
-                max_iterations=5,
-                early_stopping_method="force",
+    async def run_grouped_batch(
+        self, items: List[Tuple[AgentTaskType, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Run a mixed list of ``(task_id, input_data)`` requests concurrently.
+
+        Requests are grouped by task so each group shares one cached executor
+        and goes through ``run_batch``. Results are returned in input order.
+        """
+        groups: Dict[AgentTaskType, List[int]] = {}
+        for index, (task_id, _) in enumerate(items):
+            groups.setdefault(task_id, []).append(index)
+
+        group_results = await asyncio.gather(
+            *(
+                self.run_batch(task_id, [items[i][1] for i in indices])
+                for task_id, indices in groups.items()
             )
+        )
+
+        results: List[Union[Dict[str, Any], BaseException]] = [None] * len(items)
+        for indices, outputs in zip(groups.values(), group_results):
+            for index, output in zip(indices, outputs):
+                results[index] = output
+        return results
+
+    async def synthesize_topology(
+        self,
+        input_data: Union[Dict[str, Any], SynthesisTopologyRequest],
+        previous_result: Optional[SynthesisTopologyOutput] = None,
+    ):
+        input_data = self.validate_input_model(AgentTaskType.SYNTHESIZE_TOPOLOGY, input_data)
+
+        if self.llm:
+            agent_executor = self._get_executor(AgentTaskType.SYNTHESIZE_TOPOLOGY)
             try:
                 agent_input = {
                     "user_instructions": input_data.user_query,
-                    "answer_instructions": format_instructions,
                     "input": input_data.user_query,
                     'regeneration_feedback_from_validation': input_data.regeneration_feedback,
+                    # On a retry the model revises its previous topology rather than starting over
+                    'previous_attempt': previous_result.generated_topology.model_dump_json()
+                    if previous_result
+                    else None,
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
@@ -189,79 +351,49 @@ class TopologyAgent(BaseAgent):
                     parsed_output = SynthesisTopologyOutput.model_validate(
                         final_output_data
                     )
-                    print("--- Synthesis Topology Proposal Generated ---")
+                    self.logger.debug("Synthesis topology generated: %r", parsed_output)
                     return parsed_output
                 else:
-                    print(
-                        f"ERROR: Agent returned unexpected final output format: {type(final_output_data)}"
+                    self.logger.error(
+                        "Agent returned unexpected final output format=%s raw=%r",
+                        type(final_output_data),
+                        final_output_data,
                     )
-                    print(f"Raw output: {final_output_data}")
                     # Attempt to parse if it's a string containing JSON (shouldn't happen with correct prompt)
                     if isinstance(final_output_data, str):
                         try:
                             parsed_output = SynthesisTopologyOutput.model_validate_json(
                                 final_output_data
                             )
-                            print(
-                                "--- Optimization Proposal Generated (Parsed from String) ---"
-                            )
+                            self.logger.debug("Parsed final output from string: %r", parsed_output)
                             return parsed_output
                         except Exception as e_parse:
-                            print(
-                                f"ERROR: Failed to parse string output as JSON: {e_parse}"
-                            )
+                            self.logger.error("Failed to parse string output as JSON: %s", e_parse)
 
                     return None  # Failed
             except Exception as e:
-                traceback.print_exc()
-                self.logger.exception(f"Exception during agent execution!")
+                self.logger.exception(
+                    "Agent execution failed",
+                    extra={"task_id": AgentTaskType.SYNTHESIZE_TOPOLOGY.value},
+                )
                 raise LLMError(f"Error during agent execution: {e}")
 
     async def update_topology(
         self, input_data: Union[Dict[str, Any], OptimizeTopologyRequest]
     ):
-        if isinstance(input_data, Dict):
-            # Implement the logic to optimize the topology based on the provided instructions
-            input_data = OptimizeTopologyRequest(**input_data)
-        parser = PydanticOutputParser(pydantic_object=OptimizeTopologyOutput)
-        format_instructions = parser.get_format_instructions()
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            TOPOLOGY_OPTIMIZER_PROMPT
-        )
-
-        human_message_prompt = HumanMessagePromptTemplate.from_template(
-            "{input}\n\n{agent_scratchpad}"
-        )
-        prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
+        input_data = self.validate_input_model(AgentTaskType.OPTIMIZE_TOPOLOGY, input_data)
 
         if self.llm and self.tools:
-            llm_with_tools = self.llm.bind_tools(self.tools)
-
-            agent = create_structured_chat_agent(llm_with_tools, self.tools, prompt)
-
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                verbose=True,
-                return_intermediate_steps=True,
-                handle_parsing_errors=True,
-                max_iterations=5,
-                early_stopping_method="force",
-            )
+            agent_executor = self._get_executor(AgentTaskType.OPTIMIZE_TOPOLOGY)
 
             try:
                 agent_input = {
                     "world_id": input_data.world_id,
                     "optional_instructions": input_data.optional_instructions
                     or "None provided. Apply general optimization principles.",  # Provide default text if None
-                    "format_instructions": format_instructions,
-                    "world_instructions": WorldModal.schema_for_fields(),
                     "input": f"Optimize topology for world {input_data.world_id} with instructions: {input_data.optional_instructions or 'default principles'}",
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
@@ -269,83 +401,81 @@ class TopologyAgent(BaseAgent):
                     parsed_output = OptimizeTopologyOutput.model_validate(
                         final_output_data
                     )
-                    print("--- Optimization Proposal Generated ---")
+                    self.logger.debug("Optimization proposal generated: %r", parsed_output)
                     return parsed_output
                 else:
-                    print(
-                        f"ERROR: Agent returned unexpected final output format: {type(final_output_data)}"
+                    self.logger.error(
+                        "Agent returned unexpected final output format=%s raw=%r",
+                        type(final_output_data),
+                        final_output_data,
                     )
-                    print(f"Raw output: {final_output_data}")
                     # Attempt to parse if it's a string containing JSON (shouldn't happen with correct prompt)
                     if isinstance(final_output_data, str):
                         try:
                             parsed_output = OptimizeTopologyOutput.model_validate_json(
                                 final_output_data
                             )
-                            print(
-                                "--- Optimization Proposal Generated (Parsed from String) ---"
-                            )
+                            self.logger.debug("Parsed final output from string: %r", parsed_output)
                             return parsed_output
                         except Exception as e_parse:
-                            print(
-                                f"ERROR: Failed to parse string output as JSON: {e_parse}"
-                            )
+                            self.logger.error("Failed to parse string output as JSON: %s", e_parse)
 
                     return None  # Failed
             except Exception as e:
-                traceback.print_exc()
-                self.logger.exception(f"Exception during agent execution!")
+                self.logger.exception(
+                    "Agent execution failed",
+                    extra={"task_id": AgentTaskType.OPTIMIZE_TOPOLOGY.value, "world_id": input_data.world_id},
+                )
                 raise LLMError(f"Error during agent execution: {e}")
         else:
             raise Exception("LLM not available, logs invalid, or no tools defined")
 
+    async def _aembed_question(self, question: str) -> Optional[List[float]]:
+        """Embed a question for the QnA cache, or None if embedding fails so the request runs uncached."""
+        try:
+            return await asyncio.to_thread(self.embedding_util.generate_embedding, question)
+        except Exception:
+            self.logger.warning("QnA cache skipped: question embedding failed", exc_info=True)
+            return None
+
     async def topology_qna(self, input_data: Union[Dict[str, Any], TopologyQnARequest]):
-        if isinstance(input_data, Dict):
-            # Implement the logic to optimize the topology based on the provided instructions
-            input_data = TopologyQnARequest(**input_data)
-        parser = PydanticOutputParser(pydantic_object=TopologyQnAOutput)
-        format_instructions = parser.get_format_instructions()
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            TOPOLOGY_QNA_PROMPT
-        )
+        input_data = self.validate_input_model(AgentTaskType.TOPOLOGY_QNA, input_data)
 
-        human_message_prompt = HumanMessagePromptTemplate.from_template(
-            "{input}\n\n{agent_scratchpad}"
-        )
-        prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-        
         if self.llm and self.tools:
-            llm_with_tools = self.llm.bind_tools(self.tools)
-
-            agent = create_structured_chat_agent(llm_with_tools, self.tools, prompt)
-
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                verbose=True,
-                return_intermediate_steps=True,
-                handle_parsing_errors=True,
-                max_iterations=5,
-                early_stopping_method="force",
-            )
+            agent_executor = self._get_executor(AgentTaskType.TOPOLOGY_QNA)
 
             try:
+                qna_cache = self.qna_cache
+                if qna_cache:
+                    topology_data, last_5_messages, question_embedding = await asyncio.gather(
+                        self._aget_topology_by_world_id(input_data.world_id),
+                        self._aget_chat_history(input_data.conversation_id, 5),
+                        self._aembed_question(input_data.user_query),
+                    )
+                    if question_embedding is None:
+                        qna_cache = None
+                    else:
+                        world_version = topology_version(topology_data)
+                        cached_output = qna_cache.get(input_data.world_id, world_version, question_embedding)
+                        if cached_output:
+                            self.logger.debug("QnA cache hit for world %s", input_data.world_id)
+                            return cached_output
+                else:
+                    topology_data, last_5_messages = await asyncio.gather(
+                        self._aget_topology_by_world_id(input_data.world_id),
+                        self._aget_chat_history(input_data.conversation_id, 5),
+                    )
                 agent_input = {
                     "world_id": input_data.world_id,
-                    'topology_data': self._get_topology_by_world_id(input_data.world_id),
+                    'topology_data': dump_prompt_json(topology_data),
                     'conversation_id': input_data.conversation_id,
                     "optional_instructions": input_data.optional_instructions
                     or "None provided. Apply general optimization principles.",
-                    "answer_instructions": format_instructions,
-                    "world_instructions": WorldModal.schema_for_fields(),
                     'user_question': input_data.user_query,
-                    'last_5_messages': self._get_chat_history(input_data.conversation_id, 5),
+                    'last_5_messages': last_5_messages,
                     "input": f'Answer the following question about the topology of world {input_data.world_id}: {input_data.user_query}',
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
@@ -353,32 +483,33 @@ class TopologyAgent(BaseAgent):
                     parsed_output = TopologyQnAOutput.model_validate(
                         final_output_data
                     )
-                    print("--- Optimization Proposal Generated ---")
+                    if qna_cache and parsed_output.status == "answered":
+                        qna_cache.put(input_data.world_id, world_version, question_embedding, parsed_output)
+                    self.logger.debug("Topology QnA answer generated: %r", parsed_output)
                     return parsed_output
                 else:
-                    print(
-                        f"ERROR: Agent returned unexpected final output format: {type(final_output_data)}"
+                    self.logger.error(
+                        "Agent returned unexpected final output format=%s raw=%r",
+                        type(final_output_data),
+                        final_output_data,
                     )
-                    print(f"Raw output: {final_output_data}")
                     # Attempt to parse if it's a string containing JSON (shouldn't happen with correct prompt)
                     if isinstance(final_output_data, str):
                         try:
                             parsed_output = TopologyQnAOutput.model_validate_json(
                                 final_output_data
                             )
-                            print(
-                                "--- Optimization Proposal Generated (Parsed from String) ---"
-                            )
+                            self.logger.debug("Parsed final output from string: %r", parsed_output)
                             return parsed_output
                         except Exception as e_parse:
-                            print(
-                                f"ERROR: Failed to parse string output as JSON: {e_parse}"
-                            )
+                            self.logger.error("Failed to parse string output as JSON: %s", e_parse)
 
                     return None  # Failed
             except Exception as e:
-                traceback.print_exc()
-                self.logger.exception(f"Exception during agent execution!")
+                self.logger.exception(
+                    "Agent execution failed",
+                    extra={"task_id": AgentTaskType.TOPOLOGY_QNA.value, "world_id": input_data.world_id},
+                )
                 raise LLMError(f"Error during agent execution: {e}")
         else:
             raise Exception("LLM not available, logs invalid, or no tools defined")
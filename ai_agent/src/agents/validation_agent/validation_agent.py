@@ -3,7 +3,7 @@ import traceback
 from typing import Any, Dict, Union
 
 from langchain_openai import ChatOpenAI
-from ai_agent.src.agents.base.base_agent import AgentTask, BaseAgent
+from ai_agent.src.agents.base.base_agent import AgentTask, BaseAgent, get_world_schema
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.agents.topology_agent.structure import SynthesisTopologyOutput
 from ai_agent.src.agents.validation_agent.prompt import TOPOLOGY_VALIDATION_AGENT_PROMPT
@@ -12,7 +12,6 @@ from ai_agent.src.agents.validation_agent.world_validation import validate_world
 from ai_agent.src.consts.agent_type import AgentType
 from langchain_core.output_parsers import PydanticOutputParser
 from ai_agent.src.exceptions.llm_exception import LLMError
-from data.models.topology.world_model import WorldModal
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
@@ -55,17 +54,21 @@ class ValidationAgent(BaseAgent):
     ):
         if task_id == AgentTaskType.VALIDATE_TOPOLOGY:
             # Implement the logic to validate the topology
-            result = self.validate_generated_topology(input_data["generate_response"])
+            result = await self.validate_topology(input_data["generate_response"])
         else:
             raise ValueError(f"Unsupported task type: {task_id}")
-        
-        # Validate output
-        validated_output =  self.validate_output(task_id, result)
 
-        return validated_output
-        
+        return result.model_dump()
+
+    async def validate_topology(
+        self, generate_response: Union[SynthesisTopologyOutput, Dict[str, Any]]
+    ) -> TopologyValidationResult:
+        """Validate a synthesis result and return the checked TopologyValidationResult model."""
+        result = await self.validate_generated_topology(generate_response)
+        return self.validate_output_model(AgentTaskType.VALIDATE_TOPOLOGY, result)
+
 
-    def validate_generated_topology(self, generate_response: Union[SynthesisTopologyOutput, Dict[str, Any]]) -> TopologyValidationResult:
+    async def validate_generated_topology(self, generate_response: Union[SynthesisTopologyOutput, Dict[str, Any]]) -> TopologyValidationResult:
         if isinstance(generate_response, Dict):
             generate_response = SynthesisTopologyOutput(**generate_response)
 
@@ -106,14 +109,14 @@ class ValidationAgent(BaseAgent):
             
             try:
                 agent_input = {
-                    'world_instructions': WorldModal.schema_for_fields(),
+                    'world_instructions': get_world_schema(),
                     "original_user_query": generate_response.input_query,
                     "generated_topology_json": generate_response.generated_topology.model_dump_json(),
                     "generating_agent_thought_process": generate_response.thought_process,
                     'answer_instructions':format_instructions,
                     'input': f'Validate the topology and provide feedback for the generating agent.',
                 }
-                result = agent_executor.invoke(agent_input)
+                result = await agent_executor.ainvoke(agent_input)
                 final_output_data = result.get("output")
 
                 if isinstance(final_output_data, dict):
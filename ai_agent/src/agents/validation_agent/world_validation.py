@@ -1,326 +1,359 @@
 
-from typing import Dict, List, Set, Tuple
+import hashlib
+from itertools import chain
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
 from data.models.topology.node_model import HostModal, NetworkModal
 from data.models.topology.world_model import WorldModal
 
 
-def _add_error(errors_list: List[str], context: str, item_identifier: str, issue: str):
-    """Helper to format and add error messages."""
-    errors_list.append(f"[{context}] '{item_identifier}': {issue}")
+_CLASSICAL_HOST_TYPES = frozenset({"ClassicalHost", "ClassicalRouter", "InternetExchange", "ClassicToQuantumConverter"}) # Add others as needed
+_QUANTUM_HOST_TYPES = frozenset({"QuantumHost", "QuantumRepeater", "QuantumToClassicConverter"}) # Add others as needed
+# 'QuantumAdapter' is a type for HostModal in HOST_TYPES, but we have AdapterModal.
+# This suggests a HostModal should not typically be of type 'QuantumAdapter'.
+# It could represent the physical presence of an adapter *as a host node* in a network.
+# If so, then the classical and quantum host types might include 'QuantumAdapter'
+# depending on which side of the adapter is being represented as a host.
+# For simplicity, let's assume 'QuantumAdapter' host type is for hosts that *are* adapters,
+# and accept it on either side.
+_CLASSICAL_OK_FOR_ADAPTER = _CLASSICAL_HOST_TYPES | {"QuantumAdapter"}
+_QUANTUM_OK_FOR_ADAPTER = _QUANTUM_HOST_TYPES | {"QuantumAdapter"}
+_PROBLEMATIC_HOST_TYPES = frozenset({"ClassicalNetwork", "Zone"})
 
+# Adapter endpoints: (side, network field, host field, expected network type, accepted host types)
+_ADAPTER_SIDES = (
+    ("classical", "classicalNetwork", "classicalHost", "CLASSICAL_NETWORK", _CLASSICAL_OK_FOR_ADAPTER),
+    ("quantum", "quantumNetwork", "quantumHost", "QUANTUM_NETWORK", _QUANTUM_OK_FOR_ADAPTER),
+)
 
-def _validate_uniqueness(world: WorldModal, errors: List[str]):
-    """
-    Validates uniqueness constraints for names and addresses.
-    - Zone names unique globally.
-    - Network names unique within a zone.
-    - Adapter names unique within a zone.
-    - Host names unique within a network.
-    - Connection names unique within a network.
-    - Addresses (Host, Adapter, Network) unique globally where defined.
-    """
-    zone_names: Set[str] = set()
-    all_host_addresses: Set[str] = set()
-    all_adapter_addresses: Set[str] = set()
-    all_network_addresses: Set[str] = set()
+# Rendered once for the type-consistency messages
+_CLASSICAL_HOST_TYPES_TEXT = str(set(_CLASSICAL_HOST_TYPES))
+_QUANTUM_HOST_TYPES_TEXT = str(set(_QUANTUM_HOST_TYPES))
 
-    for zone in world.zones:
-        # Zone name uniqueness
-        if zone.name in zone_names:
-            _add_error(errors, "Uniqueness-Zone", zone.name, "Duplicate zone name.")
-        zone_names.add(zone.name)
 
-        network_names_in_zone: Set[str] = set()
-        adapter_names_in_zone: Set[str] = set()
+# Results for recently validated worlds, keyed by a digest of their JSON
+VALIDATION_CACHE_SIZE = 128
+_validation_cache: Dict[bytes, Tuple[str, ...]] = {}
 
-        for network in zone.networks:
-            # Network name uniqueness (within zone)
-            if network.name in network_names_in_zone:
-                _add_error(errors, f"Uniqueness-Network (Zone {zone.name})", network.name, "Duplicate network name within this zone.")
-            network_names_in_zone.add(network.name)
+# Containment for at least this many items is computed with numpy
+_VECTORIZE_MIN_ITEMS = 256
 
-            if network.address and network.address in all_network_addresses:
-                _add_error(errors, f"Uniqueness-NetworkAddress (Zone {zone.name})", network.name, f"Address '{network.address}' is already in use.")
-            if network.address:
-                all_network_addresses.add(network.address)
+# Networks with at least this many connections check all endpoints in bulk first
+_BULK_REFERENCE_CHECK_MIN_CONNECTIONS = 256
 
-            host_names_in_network: Set[str] = set()
-            connection_names_in_network: Set[str] = set()
-            for host in network.hosts:
-                # Host name uniqueness (within network)
-                if host.name in host_names_in_network:
-                    _add_error(errors, f"Uniqueness-Host (Network {network.name}, Zone {zone.name})", host.name, "Duplicate host name within this network.")
-                host_names_in_network.add(host.name)
 
-                if host.address and host.address in all_host_addresses:
-                    _add_error(errors, f"Uniqueness-HostAddress (Network {network.name}, Zone {zone.name})", host.name, f"Address '{host.address}' is already in use.")
-                if host.address:
-                    all_host_addresses.add(host.address)
+def _outside_zone(items: Sequence, zx: float, zy: float, zx2: float, zy2: float) -> List[bool]:
+    """Per item, whether its location falls outside the zone rectangle."""
+    if len(items) < _VECTORIZE_MIN_ITEMS:
+        return [not (zx <= x <= zx2 and zy <= y <= zy2) for x, y in (item.location for item in items)]
+    locations = np.array([item.location for item in items], dtype=np.float64)
+    xs, ys = locations[:, 0], locations[:, 1]
+    return (~((zx <= xs) & (xs <= zx2) & (zy <= ys) & (ys <= zy2))).tolist()
 
-            for connection in network.connections:
-                # Connection name uniqueness (within network)
-                if connection.name in connection_names_in_network:
-                     _add_error(errors, f"Uniqueness-Connection (Network {network.name}, Zone {zone.name})", connection.name, "Duplicate connection name within this network.")
-                connection_names_in_network.add(connection.name)
 
+# Context labels are only built when an error is actually reported
+def _zone_context(zone_name: str, zone_idx: int) -> str:
+    return f"Zone '{zone_name}' (idx {zone_idx})"
 
-        for adapter in zone.adapters:
-            # Adapter name uniqueness (within zone)
-            if adapter.name in adapter_names_in_zone:
-                _add_error(errors, f"Uniqueness-Adapter (Zone {zone.name})", adapter.name, "Duplicate adapter name within this zone.")
-            adapter_names_in_zone.add(adapter.name)
 
-            if adapter.address and adapter.address in all_adapter_addresses:
-                 _add_error(errors, f"Uniqueness-AdapterAddress (Zone {zone.name})", adapter.name, f"Address '{adapter.address}' is already in use.")
-            if adapter.address:
-                all_adapter_addresses.add(adapter.address)
+def _network_context(net_name: str, net_idx: int, zone_name: str, zone_idx: int) -> str:
+    return f"Network '{net_name}' (idx {net_idx}, {_zone_context(zone_name, zone_idx)})"
+
+
+def _host_context(host: HostModal, host_idx: int, network_context: str) -> str:
+    return f"Host '{host.name}' (idx {host_idx}, {network_context})"
+
 
+def _connection_context(connection, conn_idx: int, network_context: str) -> str:
+    return f"Connection '{connection.name}' (idx {conn_idx}, {network_context})"
 
-def _validate_referential_integrity(world: WorldModal, errors: List[str]):
+
+def _adapter_context(adapter, adapter_idx: int, zone_context: str) -> str:
+    return f"Adapter '{adapter.name}' (idx {adapter_idx}, {zone_context})"
+
+
+def _validate_world_size(world: WorldModal, errors: List[str]):
+    """Validates that the world size is positive."""
+    add = errors.append
+    if world.size[0] <= 0 or world.size[1] <= 0:
+        add(f"[World '{world.name}'] 'size': World size dimensions ({world.size}) must be positive.")
+
+
+def _validate_world(world: WorldModal, errors: List[str]):
     """
-    Validates that all references between entities are valid.
+    Validates the world in a single traversal of zones, networks, hosts,
+    connections and adapters.
+
+    Uniqueness:
+    - Zone names unique globally.
+    - Network names unique within a zone.
+    - Adapter names unique within a zone.
+    - Host names unique within a network.
+    - Connection names unique within a network.
+    - Addresses (Host, Adapter, Network) unique globally where defined.
+
+    Referential integrity:
     - Connection from/to_node must exist in the same network.
     - Adapter's classical/quantum hosts and networks must exist and be consistent.
-    """
-    for zone_idx, zone in enumerate(world.zones):
-        zone_context = f"Zone '{zone.name}' (idx {zone_idx})"
-
-        # Create a map of networks and their hosts within this zone for quick lookup
-        networks_in_zone: Dict[str, NetworkModal] = {net.name: net for net in zone.networks}
-        hosts_in_networks_in_zone: Dict[Tuple[str, str], HostModal] = {} # (network_name, host_name) -> HostModal
-        for net_name, network_obj in networks_in_zone.items():
-            for host in network_obj.hosts:
-                hosts_in_networks_in_zone[(net_name, host.name)] = host
 
-        for net_idx, network in enumerate(zone.networks):
-            network_context = f"Network '{network.name}' (idx {net_idx}, {zone_context})"
-            hosts_in_current_network: Set[str] = {host.name for host in network.hosts}
-
-            for conn_idx, connection in enumerate(network.connections):
-                conn_context = f"Connection '{connection.name}' (idx {conn_idx}, {network_context})"
-                if connection.from_node not in hosts_in_current_network:
-                    _add_error(errors, conn_context, connection.from_node, "from_node does not refer to a host in this network.")
-                if connection.to_node not in hosts_in_current_network:
-                    _add_error(errors, conn_context, connection.to_node, "to_node does not refer to a host in this network.")
-                if connection.from_node == connection.to_node:
-                    _add_error(errors, conn_context, connection.from_node, "Connection cannot connect a node to itself.")
-
-        for adapter_idx, adapter in enumerate(zone.adapters):
-            adapter_context = f"Adapter '{adapter.name}' (idx {adapter_idx}, {zone_context})"
-
-            # Check classical network and host
-            classical_net_name = adapter.classicalNetwork
-            if classical_net_name not in networks_in_zone:
-                _add_error(errors, adapter_context, classical_net_name, "Referenced classicalNetwork not found in this zone.")
-            else:
-                if (classical_net_name, adapter.classicalHost) not in hosts_in_networks_in_zone:
-                    _add_error(errors, adapter_context, adapter.classicalHost, f"Referenced classicalHost not found in classicalNetwork '{classical_net_name}'.")
-
-            # Check quantum network and host
-            quantum_net_name = adapter.quantumNetwork
-            if quantum_net_name not in networks_in_zone:
-                _add_error(errors, adapter_context, quantum_net_name, "Referenced quantumNetwork not found in this zone.")
-            else:
-                if (quantum_net_name, adapter.quantumHost) not in hosts_in_networks_in_zone:
-                    _add_error(errors, adapter_context, adapter.quantumHost, f"Referenced quantumHost not found in quantumNetwork '{quantum_net_name}'.")
-
-
-def _validate_spatial_logic(world: WorldModal, errors: List[str]):
-    """
-    Validates spatial constraints and containment.
+    Spatial logic:
     - World size positive.
     - Zones fit within the world and have positive size.
     - Adapters and Hosts are located within their parent zone's boundaries.
     - Locations/positions are non-negative.
+
+    Type consistency:
+    - Adapter's classicalNetwork is CLASSICAL_NETWORK, quantumNetwork is QUANTUM_NETWORK.
+    - Adapter's classicalHost is classical type, quantumHost is quantum type.
+    - Hosts in CLASSICAL_NETWORK are classical types, hosts in QUANTUM_NETWORK are quantum types.
+    - HostModal.type should not be abstract types like 'ClassicalNetwork' or 'Zone'.
     """
-    world_context = f"World '{world.name}'"
-    if world.size[0] <= 0 or world.size[1] <= 0:
-        _add_error(errors, world_context, "size", f"World size dimensions ({world.size}) must be positive.")
+    zone_names: Set[str] = set()
+    all_host_addresses: Set[str] = set()
+    all_adapter_addresses: Set[str] = set()
+    all_network_addresses: Set[str] = set()
+
+    _validate_world_size(world, errors)
+    world_w, world_h = world.size
+    get_attr = getattr
 
     for zone_idx, zone in enumerate(world.zones):
-        zone_context = f"Zone '{zone.name}' (idx {zone_idx})"
+        zone_name = zone.name
+        zone_position, zone_size = zone.position, zone.size
+        # Issues for this zone are collected locally and appended in one go
+        # Messages read "[context] 'item': issue"
+        zone_errors: List[str] = []
+        add = zone_errors.append
+
+        # Zone name uniqueness. Here and below a set that does not grow on
+        # set.add() already held the name, so each check costs a single hash.
+        known = len(zone_names)
+        zone_names.add(zone_name)
+        if len(zone_names) == known:
+            add(f"[Uniqueness-Zone] '{zone_name}': Duplicate zone name.")
+
+        # Zone bounds, used by every containment check in this zone
+        zx, zy = zone_position
+        zw, zh = zone_size
+        zx2, zy2 = zx + zw, zy + zh
 
         # Zone size and position
-        if zone.size[0] <= 0 or zone.size[1] <= 0:
-            _add_error(errors, zone_context, "size", f"Zone size dimensions ({zone.size}) must be positive.")
-        if zone.position[0] < 0 or zone.position[1] < 0:
-            _add_error(errors, zone_context, "position", f"Zone position coordinates ({zone.position}) must be non-negative.")
+        if zw <= 0 or zh <= 0:
+            add(f"[{_zone_context(zone_name, zone_idx)}] 'size': Zone size dimensions ({zone_size}) must be positive.")
+        # With a non-negative zone origin every location inside the zone is
+        # non-negative too, so the sign checks below only run when an item
+        # fails containment.
+        zone_non_negative = zx >= 0 and zy >= 0
+        if not zone_non_negative:
+            add(f"[{_zone_context(zone_name, zone_idx)}] 'position': Zone position coordinates ({zone_position}) must be non-negative.")
 
         # Zone containment in world
-        if (zone.position[0] + zone.size[0] > world.size[0] or
-            zone.position[1] + zone.size[1] > world.size[1]):
-            _add_error(errors, zone_context, "boundaries", f"Zone (pos {zone.position}, size {zone.size}) exceeds world boundaries ({world.size}).")
-
-        for net_idx, network in enumerate(zone.networks):
-            network_context = f"Network '{network.name}' (idx {net_idx}, {zone_context})"
-            if network.location[0] < 0 or network.location[1] < 0:
-                 _add_error(errors, network_context, "location", f"Network location coordinates ({network.location}) must be non-negative.")
-            # Network location within zone (conceptual, as network itself doesn't have a size)
-            if (network.location[0] < zone.position[0] or
-                network.location[1] < zone.position[1] or
-                network.location[0] > zone.position[0] + zone.size[0] or
-                network.location[1] > zone.position[1] + zone.size[1]):
-                 _add_error(errors, network_context, "location", f"Network location ({network.location}) is outside its zone boundaries (pos {zone.position}, size {zone.size}).")
-
-
-            for host_idx, host in enumerate(network.hosts):
-                host_context = f"Host '{host.name}' (idx {host_idx}, {network_context})"
-                if host.location[0] < 0 or host.location[1] < 0:
-                    _add_error(errors, host_context, "location", f"Host location coordinates ({host.location}) must be non-negative.")
-                if (host.location[0] < zone.position[0] or
-                    host.location[1] < zone.position[1] or
-                    host.location[0] > zone.position[0] + zone.size[0] or
-                    host.location[1] > zone.position[1] + zone.size[1]):
-                    _add_error(errors, host_context, "location", f"Host location ({host.location}) is outside its zone boundaries (pos {zone.position}, size {zone.size}).")
-
-        for adapter_idx, adapter in enumerate(zone.adapters):
-            adapter_context = f"Adapter '{adapter.name}' (idx {adapter_idx}, {zone_context})"
-            if adapter.location[0] < 0 or adapter.location[1] < 0:
-                _add_error(errors, adapter_context, "location", f"Adapter location coordinates ({adapter.location}) must be non-negative.")
-            if (adapter.location[0] < zone.position[0] or
-                adapter.location[1] < zone.position[1] or
-                adapter.location[0] > zone.position[0] + zone.size[0] or
-                adapter.location[1] > zone.position[1] + zone.size[1]):
-                 _add_error(errors, adapter_context, "location", f"Adapter location ({adapter.location}) is outside its zone boundaries (pos {zone.position}, size {zone.size}).")
-    
-    # Zone overlap (optional, more complex to implement efficiently)
-    # For N zones, this is O(N^2).
-    # For each pair of zones (zone_i, zone_j where i < j):
-    #   rect1 = (zone_i.position[0], zone_i.position[1], zone_i.size[0], zone_i.size[1])
-    #   rect2 = (zone_j.position[0], zone_j.position[1], zone_j.size[0], zone_j.size[1])
-    #   If rect1 overlaps rect2:
-    #     _add_error(errors, f"Spatial-ZoneOverlap", f"{zone_i.name} and {zone_j.name}", "Zones spatially overlap.")
+        if zx2 > world_w or zy2 > world_h:
+            add(f"[{_zone_context(zone_name, zone_idx)}] 'boundaries': Zone (pos {zone_position}, size {zone_size}) exceeds world boundaries ({world.size}).")
+
+        # Lookup maps for the adapter reference and type checks, filled in
+        # while the networks are walked so no separate indexing pass is needed.
+        # A repeated network name shadows the earlier network for lookups and
+        # the host reference check. The host type check still sees hosts of
+        # every network with that name.
+        networks_in_zone: Dict[str, NetworkModal] = {}
+        host_names_by_network: Dict[str, Set[str]] = {}
+        hosts_in_networks_in_zone: Dict[Tuple[str, str], HostModal] = {}
 
+        network_names_in_zone: Set[str] = set()
+        adapter_names_in_zone: Set[str] = set()
 
-def _validate_type_consistency(world: WorldModal, errors: List[str]):
-    """
-    Validates type consistency between related entities.
-    - Adapter's classicalNetwork is CLASSICAL_NETWORK, quantumNetwork is QUANTUM_NETWORK.
-    - Adapter's classicalHost is classical type, quantumHost is quantum type.
-    - Hosts in CLASSICAL_NETWORK are classical types, hosts in QUANTUM_NETWORK are quantum types.
-    - HostModal.type should not be abstract types like 'ClassicalNetwork' or 'Zone'.
-    """
-    classical_host_types = {"ClassicalHost", "ClassicalRouter", "InternetExchange", "ClassicToQuantumConverter"} # Add others as needed
-    quantum_host_types = {"QuantumHost", "QuantumRepeater", "QuantumToClassicConverter"} # Add others as needed
-    # 'QuantumAdapter' is a type for HostModal in HOST_TYPES, but we have AdapterModal.
-    # This suggests a HostModal should not typically be of type 'QuantumAdapter'.
-    # It could represent the physical presence of an adapter *as a host node* in a network.
-    # If so, then classical_host_types and quantum_host_types might include 'QuantumAdapter'
-    # depending on which side of the adapter is being represented as a host.
-    # For simplicity, let's assume 'QuantumAdapter' host type is for hosts that *are* adapters.
+        for net_idx, network in enumerate(zone.networks):
+            net_name, net_type = network.name, network.type
+            net_location = network.location
+            nx, ny = net_location
+            hosts = network.hosts
+            networks_in_zone[net_name] = network
 
-    problematic_host_types = {"ClassicalNetwork", "Zone"}
+            # Network name uniqueness (within zone)
+            known = len(network_names_in_zone)
+            network_names_in_zone.add(net_name)
+            if len(network_names_in_zone) == known:
+                add(f"[Uniqueness-Network (Zone {zone_name})] '{net_name}': Duplicate network name within this zone.")
 
-    for zone_idx, zone in enumerate(world.zones):
-        zone_context = f"Zone '{zone.name}' (idx {zone_idx})"
-        networks_in_zone: Dict[str, NetworkModal] = {net.name: net for net in zone.networks}
-        hosts_in_networks_in_zone: Dict[Tuple[str, str], HostModal] = {
-            (net.name, host.name): host
-            for net in zone.networks
-            for host in net.hosts
-        }
+            if (net_address := network.address):
+                known = len(all_network_addresses)
+                all_network_addresses.add(net_address)
+                if len(all_network_addresses) == known:
+                    add(f"[Uniqueness-NetworkAddress (Zone {zone_name})] '{net_name}': Address '{net_address}' is already in use.")
 
-        for net_idx, network in enumerate(zone.networks):
-            network_context = f"Network '{network.name}' (idx {net_idx}, {zone_context})"
-            for host_idx, host in enumerate(network.hosts):
-                host_context = f"Host '{host.name}' (idx {host_idx}, {network_context})"
-
-                if host.type in problematic_host_types:
-                    _add_error(errors, host_context, "type", f"Host type '{host.type}' is not appropriate for a host entity (it's a container type).")
-
-                if network.type == "CLASSICAL_NETWORK":
-                    if host.type not in classical_host_types and host.type != "QuantumAdapter": # Allowing adapter endpoint
-                        _add_error(errors, host_context, "type", f"Host type '{host.type}' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {classical_host_types} or QuantumAdapter endpoint.")
-                elif network.type == "QUANTUM_NETWORK":
-                    if host.type not in quantum_host_types and host.type != "QuantumAdapter": # Allowing adapter endpoint
-                        _add_error(errors, host_context, "type", f"Host type '{host.type}' is not a typical quantum host type for a QUANTUM_NETWORK. Expected one of {quantum_host_types} or QuantumAdapter endpoint.")
-
-        for adapter_idx, adapter in enumerate(zone.adapters):
-            adapter_context = f"Adapter '{adapter.name}' (idx {adapter_idx}, {zone_context})"
-
-            # Adapter's classical network type
-            classical_net_name = adapter.classicalNetwork
-            if classical_net_name in networks_in_zone:
-                classical_network = networks_in_zone[classical_net_name]
-                if classical_network.type != "CLASSICAL_NETWORK":
-                    _add_error(errors, adapter_context, classical_net_name, f"Referenced classicalNetwork is of type '{classical_network.type}', expected 'CLASSICAL_NETWORK'.")
-
-                # Adapter's classical host type
-                classical_host_key = (classical_net_name, adapter.classicalHost)
-                if classical_host_key in hosts_in_networks_in_zone:
-                    chost = hosts_in_networks_in_zone[classical_host_key]
-                    if chost.type not in classical_host_types and chost.type != "QuantumAdapter":
-                         _add_error(errors, adapter_context, adapter.classicalHost, f"Referenced classicalHost '{chost.name}' in network '{classical_net_name}' has type '{chost.type}', not a typical classical type for adapter connection.")
-
-            # Adapter's quantum network type
-            quantum_net_name = adapter.quantumNetwork
-            if quantum_net_name in networks_in_zone:
-                quantum_network = networks_in_zone[quantum_net_name]
-                if quantum_network.type != "QUANTUM_NETWORK":
-                    _add_error(errors, adapter_context, quantum_net_name, f"Referenced quantumNetwork is of type '{quantum_network.type}', expected 'QUANTUM_NETWORK'.")
-
-                # Adapter's quantum host type
-                quantum_host_key = (quantum_net_name, adapter.quantumHost)
-                if quantum_host_key in hosts_in_networks_in_zone:
-                    qhost = hosts_in_networks_in_zone[quantum_host_key]
-                    if qhost.type not in quantum_host_types and qhost.type != "QuantumAdapter":
-                         _add_error(errors, adapter_context, adapter.quantumHost, f"Referenced quantumHost '{qhost.name}' in network '{quantum_net_name}' has type '{qhost.type}', not a typical quantum type for adapter connection.")
-
-
-def _validate_value_sanity(world: WorldModal, errors: List[str]):
-    """
-    Validates sanity of specific numeric values.
-    - Connection parameters (bandwidth, latency, length, loss_per_km).
-    - Locations/Sizes are positive (partially covered by spatial, but good for direct checks on values).
-    """
-    for zone_idx, zone in enumerate(world.zones):
-        zone_context = f"Zone '{zone.name}' (idx {zone_idx})"
-        # Zone size/pos already checked in spatial for non-negativity and positive size.
+            # Network location within zone (conceptual, as network itself doesn't have a size)
+            if not (zx <= nx <= zx2 and zy <= ny <= zy2):
+                if nx < 0 or ny < 0:
+                    add(f"[{_network_context(net_name, net_idx, zone_name, zone_idx)}] 'location': Network location coordinates ({net_location}) must be non-negative.")
+                add(f"[{_network_context(net_name, net_idx, zone_name, zone_idx)}] 'location': Network location ({net_location}) is outside its zone boundaries (pos {zone_position}, size {zone_size}).")
+            elif not zone_non_negative and (nx < 0 or ny < 0):
+                add(f"[{_network_context(net_name, net_idx, zone_name, zone_idx)}] 'location': Network location coordinates ({net_location}) must be non-negative.")
 
-        for net_idx, network in enumerate(zone.networks):
-            network_context = f"Network '{network.name}' (idx {net_idx}, {zone_context})"
-            # Network location already checked in spatial for non-negativity.
+            host_names_in_network: Set[str] = set()
+            host_names_by_network[net_name] = host_names_in_network
+            hosts_outside_zone = _outside_zone(hosts, zx, zy, zx2, zy2)
+            for host_idx, host in enumerate(hosts):
+                host_name, host_type = host.name, host.type
+                host_location = host.location
+                hosts_in_networks_in_zone[(net_name, host_name)] = host
 
-            for host_idx, host in enumerate(network.hosts):
-                host_context = f"Host '{host.name}' (idx {host_idx}, {network_context})"
-                # Host location already checked in spatial for non-negativity.
+                # Host name uniqueness (within network)
+                known = len(host_names_in_network)
+                host_names_in_network.add(host_name)
+                if len(host_names_in_network) == known:
+                    add(f"[Uniqueness-Host (Network {net_name}, Zone {zone_name})] '{host_name}': Duplicate host name within this network.")
+
+                if (host_address := host.address):
+                    known = len(all_host_addresses)
+                    all_host_addresses.add(host_address)
+                    if len(all_host_addresses) == known:
+                        add(f"[Uniqueness-HostAddress (Network {net_name}, Zone {zone_name})] '{host_name}': Address '{host_address}' is already in use.")
+
+                if hosts_outside_zone[host_idx]:
+                    if host_location[0] < 0 or host_location[1] < 0:
+                        add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'location': Host location coordinates ({host_location}) must be non-negative.")
+                    add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'location': Host location ({host_location}) is outside its zone boundaries (pos {zone_position}, size {zone_size}).")
+                elif not zone_non_negative and (host_location[0] < 0 or host_location[1] < 0):
+                    add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'location': Host location coordinates ({host_location}) must be non-negative.")
+
+                if host_type in _PROBLEMATIC_HOST_TYPES:
+                    add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'type': Host type '{host_type}' is not appropriate for a host entity (it's a container type).")
+
+                if net_type == "CLASSICAL_NETWORK":
+                    if host_type not in _CLASSICAL_OK_FOR_ADAPTER: # Allowing adapter endpoint
+                        add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'type': Host type '{host_type}' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {_CLASSICAL_HOST_TYPES_TEXT} or QuantumAdapter endpoint.")
+                elif net_type == "QUANTUM_NETWORK":
+                    if host_type not in _QUANTUM_OK_FOR_ADAPTER: # Allowing adapter endpoint
+                        add(f"[{_host_context(host, host_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'type': Host type '{host_type}' is not a typical quantum host type for a QUANTUM_NETWORK. Expected one of {_QUANTUM_HOST_TYPES_TEXT} or QuantumAdapter endpoint.")
+
+            # host_names_in_network now holds every host name in the network
+            is_host_in_network = host_names_in_network.__contains__
+            connections = network.connections
+            # On large networks a single subset test usually proves every
+            # endpoint exists, and the per-connection probes can be skipped
+            check_endpoints = (
+                len(connections) < _BULK_REFERENCE_CHECK_MIN_CONNECTIONS
+                or not host_names_in_network.issuperset(
+                    chain.from_iterable((connection.from_node, connection.to_node) for connection in connections)
+                )
+            )
+            connection_names_in_network: Set[str] = set()
+            for conn_idx, connection in enumerate(connections):
+                conn_name = connection.name
+                from_node, to_node = connection.from_node, connection.to_node
 
-            for conn_idx, connection in enumerate(network.connections):
-                conn_context = f"Connection '{connection.name}' (idx {conn_idx}, {network_context})"
-                # Allow -1 for infinite values for now.
+                # Connection name uniqueness (within network)
+                known = len(connection_names_in_network)
+                connection_names_in_network.add(conn_name)
+                if len(connection_names_in_network) == known:
+                     add(f"[Uniqueness-Connection (Network {net_name}, Zone {zone_name})] '{conn_name}': Duplicate connection name within this network.")
+
+                if check_endpoints:
+                    if not is_host_in_network(from_node):
+                        add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] '{from_node}': from_node does not refer to a host in this network.")
+                    if not is_host_in_network(to_node):
+                        add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] '{to_node}': to_node does not refer to a host in this network.")
+                if from_node == to_node:
+                    add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] '{from_node}': Connection cannot connect a node to itself.")
+
+                # Value sanity: allow -1 for infinite values for now.
                 # TODO: Revisit this logic if we want to handle infinite bandwidth/latency differently.
                 # if connection.bandwidth <= 0:
-                #     _add_error(errors, conn_context, "bandwidth", f"Bandwidth ({connection.bandwidth} Mbps) must be positive.")
+                #     add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'bandwidth': Bandwidth ({connection.bandwidth} Mbps) must be positive.")
                 # if connection.latency < 0:
-                #     _add_error(errors, conn_context, "latency", f"Latency ({connection.latency} ms) must be non-negative.")
+                #     add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'latency': Latency ({connection.latency} ms) must be non-negative.")
                 # if connection.length <= 0: # Length usually implies physical existence
-                #     _add_error(errors, conn_context, "length", f"Length ({connection.length} km) must be positive.")
+                #     add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'length': Length ({connection.length} km) must be positive.")
                 # if connection.loss_per_km < 0:
-                #     _add_error(errors, conn_context, "loss_per_km", f"Loss per km ({connection.loss_per_km}) must be non-negative.")
+                #     add(f"[{_connection_context(connection, conn_idx, _network_context(net_name, net_idx, zone_name, zone_idx))}] 'loss_per_km': Loss per km ({connection.loss_per_km}) must be non-negative.")
 
-        # Adapter location already checked in spatial for non-negativity.
+        adapters = zone.adapters
+        adapters_outside_zone = _outside_zone(adapters, zx, zy, zx2, zy2)
+        for adapter_idx, adapter in enumerate(adapters):
+            adapter_name = adapter.name
+            adapter_location = adapter.location
+
+            # Adapter name uniqueness (within zone)
+            known = len(adapter_names_in_zone)
+            adapter_names_in_zone.add(adapter_name)
+            if len(adapter_names_in_zone) == known:
+                add(f"[Uniqueness-Adapter (Zone {zone_name})] '{adapter_name}': Duplicate adapter name within this zone.")
+
+            if (adapter_address := adapter.address):
+                known = len(all_adapter_addresses)
+                all_adapter_addresses.add(adapter_address)
+                if len(all_adapter_addresses) == known:
+                    add(f"[Uniqueness-AdapterAddress (Zone {zone_name})] '{adapter_name}': Address '{adapter_address}' is already in use.")
+
+            if adapters_outside_zone[adapter_idx]:
+                if adapter_location[0] < 0 or adapter_location[1] < 0:
+                    add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] 'location': Adapter location coordinates ({adapter_location}) must be non-negative.")
+                add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] 'location': Adapter location ({adapter_location}) is outside its zone boundaries (pos {zone_position}, size {zone_size}).")
+            elif not zone_non_negative and (adapter_location[0] < 0 or adapter_location[1] < 0):
+                add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] 'location': Adapter location coordinates ({adapter_location}) must be non-negative.")
+
+            # Check the classical and quantum network and host
+            for side, net_attr, host_attr, expected_net_type, ok_host_types in _ADAPTER_SIDES:
+                ref_net_name, ref_host_name = get_attr(adapter, net_attr), get_attr(adapter, host_attr)
+                ref_network = networks_in_zone.get(ref_net_name)
+                if ref_network is None:
+                    add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] '{ref_net_name}': Referenced {net_attr} not found in this zone.")
+                    continue
+
+                ref_net_type = ref_network.type
+                if ref_net_type != expected_net_type:
+                    add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] '{ref_net_name}': Referenced {net_attr} is of type '{ref_net_type}', expected '{expected_net_type}'.")
+
+                if ref_host_name not in host_names_by_network[ref_net_name]:
+                    add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] '{ref_host_name}': Referenced {host_attr} not found in {net_attr} '{ref_net_name}'.")
+                ref_host = hosts_in_networks_in_zone.get((ref_net_name, ref_host_name))
+                if ref_host is not None:
+                    ref_host_type = ref_host.type
+                    if ref_host_type not in ok_host_types:
+                         add(f"[{_adapter_context(adapter, adapter_idx, _zone_context(zone_name, zone_idx))}] '{ref_host_name}': Referenced {host_attr} '{ref_host.name}' in network '{ref_net_name}' has type '{ref_host_type}', not a typical {side} type for adapter connection.")
+
+        errors.extend(zone_errors)
+
+    # Zone overlap (optional, more complex to implement efficiently)
+    # For N zones, this is O(N^2).
+    # For each pair of zones (zone_i, zone_j where i < j):
+    #   rect1 = (zone_i.position[0], zone_i.position[1], zone_i.size[0], zone_i.size[1])
+    #   rect2 = (zone_j.position[0], zone_j.position[1], zone_j.size[0], zone_j.size[1])
+    #   If rect1 overlaps rect2:
+    #     errors.append(f"[Spatial-ZoneOverlap] '{zone_i.name} and {zone_j.name}': Zones spatially overlap.")
 
 
 def validate_world_topology_static_logic(world: WorldModal) -> List[str]:
     """
     Main function to perform logical validation on the entire WorldModal.
     Returns a list of error and warning messages. An empty list means no issues found.
+    Results are cached per world content, so revalidating an unchanged world is cheap.
     """
     errors_and_warnings: List[str] = []
 
     if not world:
         errors_and_warnings.append("World data is None or empty.")
         return errors_and_warnings
+
     if not world.zones:
         # This might be valid for an empty world, or a warning could be issued.
         # errors_and_warnings.append("World contains no zones.")
-        pass # Assuming an empty world is valid.
+        # Assuming an empty world is valid, only its own size needs checking.
+        _validate_world_size(world, errors_and_warnings)
+        return errors_and_warnings
+
+    key = hashlib.blake2b(world.model_dump_json().encode(), digest_size=16).digest()
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        return list(cached)
 
-    # Call sub-validators
-    _validate_uniqueness(world, errors_and_warnings)
-    _validate_referential_integrity(world, errors_and_warnings)
-    _validate_spatial_logic(world, errors_and_warnings)
-    _validate_type_consistency(world, errors_and_warnings)
-    _validate_value_sanity(world, errors_and_warnings)
+    _validate_world(world, errors_and_warnings)
 
+    if len(_validation_cache) >= VALIDATION_CACHE_SIZE:
+        # Evict the oldest entry
+        _validation_cache.pop(next(iter(_validation_cache)))
+    _validation_cache[key] = tuple(errors_and_warnings)
     return errors_and_warnings
\ No newline at end of file
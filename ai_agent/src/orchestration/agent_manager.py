@@ -2,6 +2,7 @@ import json
 import logging
 import os
 from typing import Dict, List, Any, Union
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models import BaseChatModel
 from ai_agent.src.agents.base.base_agent import BaseAgent
@@ -41,17 +42,37 @@ class AgentManager:
         """Initialize the language model client."""
         api_key = os.getenv("OPENAI_API_KEY") or self.config.llm.api_key
         try:
+            # One keep-alive pool shared by both models, so requests reuse
+            # open connections instead of paying a TLS handshake each time
+            limits = httpx.Limits(
+                max_connections=self.config.llm.max_connections,
+                max_keepalive_connections=self.config.llm.max_keepalive_connections,
+            )
+            timeout = httpx.Timeout(
+                self.config.llm.timeout, connect=self.config.llm.connect_timeout
+            )
+            http_client = httpx.Client(
+                http2=self.config.llm.http2, limits=limits, timeout=timeout
+            )
+            http_async_client = httpx.AsyncClient(
+                http2=self.config.llm.http2, limits=limits, timeout=timeout
+            )
+
             llm = MultiModelChatOpenAI(
                 model_name=self.config.llm.model,
                 temperature=self.config.llm.temperature,
                 api_key=api_key,
                 base_url=self.config.llm.base_url,
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
             lite_llm = ChatOpenAI(
                 model_name=self.config.llm.lite_model or self.config.llm.model,
                 temperature=self.config.llm.temperature,
                 api_key=api_key,
                 base_url=self.config.llm.base_url,
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
             llm.add_sub_model("lite", lite_llm)
             local_llm = ChatOllama(
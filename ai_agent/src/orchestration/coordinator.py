@@ -1,30 +1,54 @@
+import threading
 import traceback
-from typing import Dict, Any
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Any, Optional
 import logging
 
 from ai_agent.src.agents.base.enums import AgentTaskType
+from ai_agent.src.agents.lab_assistant.lab_assistant_agent import LabAssistantAgent
+from ai_agent.src.agents.log_summarization.log_summarization_agent import LogSummarizationAgent
+from ai_agent.src.agents.router.router_agent import RouterAgent
 from ai_agent.src.agents.router.structure import RoutingOutput
+from ai_agent.src.agents.topology_agent.topology_agent import TopologyAgent
 from ai_agent.src.consts.agent_type import AgentType
 from ai_agent.src.consts.workflow_type import WorkflowType
 from ai_agent.src.exceptions.llm_exception import LLMError
 from config.config import get_config
 from .agent_manager import AgentManager
 
-class Coordinator:
-    """Central coordinator for the AI agent system."""
-    
-    _instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(Coordinator, cls).__new__(cls, *args, **kwargs)
-        return cls._instance
+@dataclass(slots=True)
+class WorkflowState:
+    """Status of a workflow run tracked by the coordinator."""
+    status: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+
+
+# Agents registered when the system is initialized
+_CORE_AGENTS = (
+    (AgentType.LOG_SUMMARIZER, LogSummarizationAgent),
+    (AgentType.TOPOLOGY_DESIGNER, TopologyAgent),
+    (AgentType.ORCHESTRATOR, RouterAgent),
+    (AgentType.LAB_ASSISTANT_AGENT, LabAssistantAgent),
+)
+
+# Workflows that simply hand their task data to a single agent
+_SIMPLE_WORKFLOW_AGENTS = {
+    WorkflowType.LOG_SUMMARIZATION: AgentType.LOG_SUMMARIZER,
+    WorkflowType.TOPOLOGY_WORKFLOW: AgentType.TOPOLOGY_DESIGNER,
+    WorkflowType.LAB_ASSISTANT_WORKFLOW: AgentType.LAB_ASSISTANT_AGENT,
+}
+
+class Coordinator:
+    """Central coordinator for the AI agent system. Use `get_coordinator()` to obtain the shared instance."""
 
     def __init__(self):
         if not hasattr(self, "initialized"):
             self.config = get_config()
             self.agent_manager = AgentManager()
-            self.active_workflows = {}
+            self.active_workflows: Dict[WorkflowType, WorkflowState] = {}
             self.logger = logging.getLogger("coordinator")
         
     async def initialize_system(self):
@@ -42,27 +66,18 @@ class Coordinator:
         
     def _register_core_agents(self):
         """Register the core agents required by the system."""
-        from ..agents.log_summarization.log_summarization_agent import LogSummarizationAgent
-
-        self.agent_manager.register_agent(AgentType.LOG_SUMMARIZER, LogSummarizationAgent)
-
-        from ..agents.topology_agent.topology_agent import TopologyAgent
-        self.agent_manager.register_agent(AgentType.TOPOLOGY_DESIGNER, TopologyAgent)
-
-        from ..agents.router.router_agent import RouterAgent
-        self.agent_manager.register_agent(AgentType.ORCHESTRATOR, RouterAgent)
-
-        from ..agents.lab_assistant.lab_assistant_agent import LabAssistantAgent
-        self.agent_manager.register_agent(AgentType.LAB_ASSISTANT_AGENT, LabAssistantAgent)
+        for agent_id, agent_class in _CORE_AGENTS:
+            self.agent_manager.register_agent(agent_id, agent_class)
         
     async def execute_workflow(self, workflow_id: WorkflowType, workflow_data: Dict[str, Any]):
         """Execute a multi-agent workflow."""
-        self.active_workflows[workflow_id] = {"status": "running", "data": {}}
+        # Accept raw values too, e.g. "lab_assistant"
+        workflow_id = WorkflowType(workflow_id)
+        self.active_workflows[workflow_id] = workflow_state = WorkflowState(status="running")
         
         try:
-            if workflow_id == WorkflowType.LOG_SUMMARIZATION:
-                # Example of a specific workflow
-                agent_id = AgentType.LOG_SUMMARIZER
+            agent_id = _SIMPLE_WORKFLOW_AGENTS.get(workflow_id)
+            if agent_id is not None:
                 task_data = workflow_data.get("task_data")
                 
                 self.logger.info(f"Executing workflow {workflow_id} with agent {agent_id}")
@@ -71,28 +86,12 @@ class Coordinator:
                 result = await self._run_agent_task(agent_id, task_data)
                 
                 # Update workflow status
-                self.active_workflows[workflow_id]["status"] = "completed"
-                self.active_workflows[workflow_id]["result"] = result
-
-                return result
-            
-        
-            elif workflow_id == WorkflowType.TOPOLOGY_WORKFLOW:
-                agent_id = AgentType.TOPOLOGY_DESIGNER
-                task_data = workflow_data.get("task_data")
-                
-                self.logger.info(f"Executing workflow {workflow_id} with agent {agent_id}")
-                
-                # Execute the agent task
-                result = await self._run_agent_task(agent_id, task_data)
-                
-                # Update workflow status
-                self.active_workflows[workflow_id]["status"] = "completed"
-                self.active_workflows[workflow_id]["result"] = result
+                workflow_state.status = "completed"
+                workflow_state.result = result
 
                 return result
 
-            elif workflow_id == WorkflowType.ROUTING:
+            if workflow_id == WorkflowType.ROUTING:
                 routing_output = await self._run_agent_task(AgentType.ORCHESTRATOR, {
                     'task_id': AgentTaskType.ROUTING,
                     'input_data': {
@@ -114,26 +113,11 @@ class Coordinator:
                         self.logger.info(f"Routing output: {routing_output}")
                         raise LLMError(f"Routing failed: {routing_output}")
                 return routing_output
-            
-            elif workflow_id == WorkflowType.LAB_ASSISTANT_WORKFLOW.value:
-                agent_id = AgentType.LAB_ASSISTANT_AGENT
-                task_data = workflow_data.get("task_data")
-                
-                self.logger.info(f"Executing workflow {workflow_id} with agent {agent_id}")
-                
-                # Execute the agent task
-                result = await self._run_agent_task(agent_id, task_data)
-                
-                # Update workflow status
-                self.active_workflows[workflow_id]["status"] = "completed"
-                self.active_workflows[workflow_id]["result"] = result
-
-                return result
 
         except Exception as e:
             self.logger.error(f"Workflow {workflow_id} failed: {str(e)}", traceback.format_exc())
-            self.active_workflows[workflow_id]["status"] = "failed"
-            self.active_workflows[workflow_id]["error"] = str(e)
+            workflow_state.status = "failed"
+            workflow_state.error = str(e)
             raise e
             
     async def _run_agent_task(self, agent_id: str, task_data: Dict[str, Any]):
@@ -151,4 +135,18 @@ class Coordinator:
         """Get the status of a workflow."""
         if workflow_id not in self.active_workflows:
             return {"status": "not_found"}
-        return self.active_workflows[workflow_id]
\ No newline at end of file
+        return asdict(self.active_workflows[workflow_id])
+
+
+_COORDINATOR: Optional[Coordinator] = None
+_COORDINATOR_LOCK = threading.Lock()
+
+
+def get_coordinator() -> Coordinator:
+    """Return the process-wide coordinator, creating it on first use."""
+    global _COORDINATOR
+    if _COORDINATOR is None:
+        with _COORDINATOR_LOCK:
+            if _COORDINATOR is None:
+                _COORDINATOR = Coordinator()
+    return _COORDINATOR
@@ -0,0 +1,88 @@
+import sys
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add repository root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bb84_helpers import (
+    QUBIT_STATES,
+    encode_qubit,
+    encode_qubits,
+    measure_qubit,
+    measure_qubits,
+    qubit_states,
+)
+
+
+def test_encode_qubits_matches_scalar_encoder():
+    """Every (bit, basis) pair renders to the same state as encode_qubit."""
+    bits = [0, 1, 0, 1]
+    bases = [0, 0, 1, 1]
+
+    codes = encode_qubits(bits, bases)
+    assert codes.dtype == np.int8
+    assert qubit_states(codes) == [encode_qubit(b, s) for b, s in zip(bits, bases)]
+    assert qubit_states(codes) == list(QUBIT_STATES)
+
+
+def test_matching_bases_recover_bits():
+    """Measuring in Alice's basis returns her bits without drawing randomness."""
+    rng = np.random.default_rng(0)
+    bits = rng.integers(0, 2, size=1000)
+    bases = rng.integers(0, 2, size=1000)
+
+    results = measure_qubits(encode_qubits(bits, bases), bases, bases, rng=rng)
+    assert results.dtype == np.int8
+    assert np.array_equal(results, bits)
+
+
+def test_mismatched_bases_are_random():
+    """Measuring in the other basis gives roughly uniform outcomes."""
+    rng = np.random.default_rng(1)
+    bits = np.zeros(4000, dtype=np.int8)
+    bases = np.zeros(4000, dtype=np.int8)
+
+    results = measure_qubits(encode_qubits(bits, bases), bases, 1 - bases, rng=rng)
+    assert 0.45 < results.mean() < 0.55
+
+
+def test_state_outside_alice_basis_is_random():
+    """A state not in Alice's basis is measured randomly, as in measure_qubit."""
+    rng = np.random.default_rng(2)
+    qubits = encode_qubits(np.ones(4000), np.ones(4000))  # all |-⟩
+    zeros = np.zeros(4000, dtype=np.int8)
+
+    results = measure_qubits(qubits, zeros, zeros, rng=rng)
+    assert 0.45 < results.mean() < 0.55
+
+
+def test_seeded_rng_is_reproducible():
+    """The same generator seed gives the same outcomes."""
+    qubits = encode_qubits([0] * 64, [0] * 64)
+    alice = [0] * 64
+    bob = [1] * 64
+
+    first = measure_qubits(qubits, alice, bob, rng=np.random.default_rng(7))
+    second = measure_qubits(qubits, alice, bob, rng=np.random.default_rng(7))
+    assert np.array_equal(first, second)
+
+
+def test_scalar_measure_matching_basis():
+    """measure_qubit returns the encoded bit when the bases match."""
+    for bit in (0, 1):
+        for basis in (0, 1):
+            assert measure_qubit(encode_qubit(bit, basis), basis, basis) == bit
+
+
+def test_scalar_measure_follows_random_seed():
+    """Random outcomes of measure_qubit are reproducible with random.seed."""
+    random.seed(123)
+    first = [measure_qubit("|0⟩", 0, 1) for _ in range(100)]
+    random.seed(123)
+    second = [measure_qubit("|0⟩", 0, 1) for _ in range(100)]
+    assert first == second
@@ -0,0 +1,129 @@
+import sys
+import os
+
+import pytest
+
+# Add repository root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai_agent.src.agents.topology_agent import qna_cache
+from ai_agent.src.agents.topology_agent.qna_cache import SemanticQnACache, topology_version
+from ai_agent.src.agents.topology_agent.structure import TopologyQnAOutput
+
+
+def make_output(answer: str) -> TopologyQnAOutput:
+    return TopologyQnAOutput(status="answered", answer=answer)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for TTL tests."""
+    now = [1000.0]
+    monkeypatch.setattr(qna_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_exact_question_hits():
+    """An identical embedding returns the cached answer."""
+    cache = SemanticQnACache()
+    cache.put("w1", "v1", [1.0, 0.0, 0.0], make_output("three hosts"))
+
+    hit = cache.get("w1", "v1", [1.0, 0.0, 0.0])
+    assert hit is not None
+    assert hit.answer == "three hosts"
+
+
+def test_similarity_threshold():
+    """Only embeddings at or above the cosine threshold match."""
+    cache = SemanticQnACache(similarity_threshold=0.9)
+    cache.put("w1", "v1", [1.0, 0.0], make_output("cached"))
+
+    # cos = 0.995 and 0.707 respectively; scaling does not matter
+    assert cache.get("w1", "v1", [10.0, 1.0]) is not None
+    assert cache.get("w1", "v1", [1.0, 1.0]) is None
+
+
+def test_best_match_wins():
+    """The most similar entry above the threshold is returned."""
+    cache = SemanticQnACache(similarity_threshold=0.5)
+    cache.put("w1", "v1", [1.0, 0.0], make_output("x axis"))
+    cache.put("w1", "v1", [0.0, 1.0], make_output("y axis"))
+
+    assert cache.get("w1", "v1", [0.2, 1.0]).answer == "y axis"
+    assert cache.get("w1", "v1", [1.0, 0.2]).answer == "x axis"
+
+
+def test_returns_independent_copy():
+    """Mutating a returned answer does not change the cached one."""
+    cache = SemanticQnACache()
+    output = make_output("original")
+    cache.put("w1", "v1", [1.0, 0.0], output)
+    output.answer = "changed after put"
+
+    hit = cache.get("w1", "v1", [1.0, 0.0])
+    hit.answer = "changed after get"
+    assert cache.get("w1", "v1", [1.0, 0.0]).answer == "original"
+
+
+def test_worlds_are_isolated():
+    """Answers cached for one world never match another."""
+    cache = SemanticQnACache()
+    cache.put("w1", "v1", [1.0, 0.0], make_output("w1 answer"))
+
+    assert cache.get("w2", "v1", [1.0, 0.0]) is None
+
+
+def test_version_change_invalidates():
+    """A changed topology version misses and drops the stale entries."""
+    cache = SemanticQnACache()
+    cache.put("w1", "v1", [1.0, 0.0], make_output("old topology"))
+
+    assert cache.get("w1", "v2", [1.0, 0.0]) is None
+    assert "w1" not in cache._entries
+
+
+def test_ttl_expiry(clock):
+    """Entries stop matching once their TTL has elapsed."""
+    cache = SemanticQnACache(ttl_seconds=60)
+    cache.put("w1", "v1", [1.0, 0.0], make_output("fresh"))
+
+    clock[0] += 59
+    assert cache.get("w1", "v1", [1.0, 0.0]) is not None
+    clock[0] += 1
+    assert cache.get("w1", "v1", [1.0, 0.0]) is None
+    assert "w1" not in cache._entries
+
+
+def test_per_world_eviction_drops_oldest():
+    """Each world keeps at most max_entries_per_world entries, oldest evicted first."""
+    cache = SemanticQnACache(max_entries_per_world=2)
+    cache.put("w1", "v1", [1.0, 0.0, 0.0], make_output("first"))
+    cache.put("w1", "v1", [0.0, 1.0, 0.0], make_output("second"))
+    cache.put("w1", "v1", [0.0, 0.0, 1.0], make_output("third"))
+    cache.put("w2", "v1", [1.0, 0.0, 0.0], make_output("other world"))
+
+    assert len(cache._entries["w1"]) == 2
+    assert cache.get("w1", "v1", [1.0, 0.0, 0.0]) is None
+    assert cache.get("w1", "v1", [0.0, 1.0, 0.0]).answer == "second"
+    assert cache.get("w1", "v1", [0.0, 0.0, 1.0]).answer == "third"
+    assert cache.get("w2", "v1", [1.0, 0.0, 0.0]).answer == "other world"
+
+
+def test_zero_norm_embeddings_are_ignored():
+    """A zero embedding is neither stored nor matched."""
+    cache = SemanticQnACache()
+    cache.put("w1", "v1", [0.0, 0.0], make_output("never stored"))
+    assert "w1" not in cache._entries
+
+    cache.put("w1", "v1", [1.0, 0.0], make_output("stored"))
+    assert cache.get("w1", "v1", [0.0, 0.0]) is None
+
+
+def test_topology_version_is_order_independent():
+    """Equal topologies hash alike regardless of key order; any change alters the digest."""
+    a = {"name": "w", "zones": [{"name": "z", "size": [10, 10]}]}
+    b = {"zones": [{"size": [10, 10], "name": "z"}], "name": "w"}
+    changed = {"name": "w", "zones": [{"name": "z", "size": [10, 11]}]}
+
+    assert topology_version(a) == topology_version(b)
+    assert topology_version(a) != topology_version(changed)
@@ -0,0 +1,223 @@
+import re
+import sys
+import os
+from collections import Counter
+
+import pytest
+
+# Add repository root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai_agent.src.agents.validation_agent import world_validation
+from ai_agent.src.agents.validation_agent.world_validation import validate_world_topology_static_logic
+from data.models.topology.world_model import WorldModal
+from data.models.topology.zone_model import ZoneModal
+
+
+# Fixture worlds are plain dicts, shaped like the JSON the agents produce
+
+
+def host(name, type="ClassicalHost", address=None, location=(5, 5)):
+    return {"name": name, "type": type, "address": address, "location": location}
+
+
+def connection(name, from_node, to_node):
+    return {
+        "name": name, "from_node": from_node, "to_node": to_node,
+        "length": 1.0, "loss_per_km": 0.0, "bandwidth": 100, "latency": 1.0,
+    }
+
+
+def network(name, type="CLASSICAL_NETWORK", hosts=(), connections=(), address=None, location=(5, 5)):
+    return {
+        "name": name, "address": address, "type": type, "location": location,
+        "hosts": list(hosts), "connections": list(connections),
+    }
+
+
+def adapter(name, classical=("C", "c1"), quantum=("Q", "q1"), address="adapter-1", location=(5, 5)):
+    return {
+        "name": name, "type": "QUMO", "address": address, "location": location,
+        "classicalNetwork": classical[0], "classicalHost": classical[1],
+        "quantumNetwork": quantum[0], "quantumHost": quantum[1],
+    }
+
+
+def zone(name, networks=(), adapters=(), size=(20, 20), position=(0, 0)):
+    return {
+        "name": name, "type": "SECURE", "size": size, "position": position,
+        "networks": list(networks), "adapters": list(adapters),
+    }
+
+
+def world(zones, size=(100, 100)):
+    return {"name": "fixture", "size": size, "zones": list(zones)}
+
+
+FIXTURE_WORLDS = {
+    "valid": world([
+        zone("Z1", networks=[
+            network("C", hosts=[host("c1", address="10.0.0.1"), host("r1", "ClassicalRouter")],
+                    connections=[connection("c1-r1", "c1", "r1")]),
+            network("Q", "QUANTUM_NETWORK", hosts=[host("q1", "QuantumHost"), host("q2", "QuantumHost")],
+                    connections=[connection("q1-q2", "q1", "q2")]),
+        ], adapters=[adapter("A1")]),
+    ]),
+    "uniqueness": world([
+        zone("Z1", networks=[
+            network("C", address="net-1", hosts=[
+                host("c1", address="10.0.0.1"), host("c1", address="10.0.0.1"), host("c2"),
+            ], connections=[connection("link", "c1", "c2"), connection("link", "c2", "c1")]),
+            network("C2", address="net-1", hosts=[host("c3", address="10.0.0.1")]),
+        ], adapters=[adapter("A1", classical=("C", "c1"), quantum=("C2", "c3")),
+                     adapter("A1", classical=("C", "c2"), quantum=("C2", "c3"))]),
+        zone("Z1", position=(30, 30)),
+    ]),
+    "spatial": world([
+        zone("Wide", size=(150, 0), position=(-5, 10), networks=[
+            network("C", location=(-20, 50), hosts=[
+                host("inside", location=(0, 10)), host("negative", location=(-10, -1)), host("far", location=(90, 90)),
+            ]),
+        ], adapters=[adapter("A1", classical=("C", "inside"), quantum=("C", "far"), location=(-6, 10))]),
+        zone("Neg", size=(10, 10), position=(-3, -3), networks=[
+            network("N", location=(-1, -1), hosts=[host("h", location=(-2, 5))]),
+        ]),
+    ], size=(100, 0)),
+    "references_and_types": world([
+        zone("Z1", networks=[
+            network("C", hosts=[
+                host("c1"), host("qh", "QuantumHost"), host("box", "Zone"), host("ad", "QuantumAdapter"),
+            ], connections=[connection("bad", "c1", "ghost"), connection("self", "c1", "c1")]),
+            network("Q", "QUANTUM_NETWORK", hosts=[host("q1", "QuantumHost"), host("ch", "ClassicalHost")]),
+        ], adapters=[
+            adapter("swapped", classical=("Q", "q1"), quantum=("C", "c1"), address="a1"),
+            adapter("missing", classical=("Nope", "c1"), quantum=("Q", "ghost"), address="a2"),
+            adapter("mistyped", classical=("C", "qh"), quantum=("Q", "ch"), address="a3"),
+        ]),
+    ]),
+    # A repeated network name shadows the earlier network: adapters only
+    # resolve hosts of the last network with that name
+    "duplicate_network_names": world([
+        zone("Z1", networks=[
+            network("C", hosts=[host("first", "QuantumHost"), host("shared")]),
+            network("Q", "QUANTUM_NETWORK", hosts=[host("q1", "QuantumHost")]),
+            network("C", hosts=[host("second"), host("shared", "QuantumRepeater")]),
+        ], adapters=[
+            adapter("to-shadowed", classical=("C", "first"), address="a1"),
+            adapter("to-kept", classical=("C", "second"), address="a2"),
+            adapter("to-both", classical=("C", "shared"), address="a3"),
+        ]),
+    ]),
+}
+
+
+# Errors reported by the original per-category validators for each fixture world.
+# Order is not part of the contract, so results are compared as multisets.
+EXPECTED_ERRORS = {
+    "valid": [],
+    "uniqueness": [
+        "[Adapter 'A1' (idx 0, Zone 'Z1' (idx 0))] 'C2': Referenced quantumNetwork is of type 'CLASSICAL_NETWORK', expected 'QUANTUM_NETWORK'.",
+        "[Adapter 'A1' (idx 0, Zone 'Z1' (idx 0))] 'c3': Referenced quantumHost 'c3' in network 'C2' has type 'ClassicalHost', not a typical quantum type for adapter connection.",
+        "[Adapter 'A1' (idx 1, Zone 'Z1' (idx 0))] 'C2': Referenced quantumNetwork is of type 'CLASSICAL_NETWORK', expected 'QUANTUM_NETWORK'.",
+        "[Adapter 'A1' (idx 1, Zone 'Z1' (idx 0))] 'c3': Referenced quantumHost 'c3' in network 'C2' has type 'ClassicalHost', not a typical quantum type for adapter connection.",
+        "[Uniqueness-Adapter (Zone Z1)] 'A1': Duplicate adapter name within this zone.",
+        "[Uniqueness-AdapterAddress (Zone Z1)] 'A1': Address 'adapter-1' is already in use.",
+        "[Uniqueness-Connection (Network C, Zone Z1)] 'link': Duplicate connection name within this network.",
+        "[Uniqueness-Host (Network C, Zone Z1)] 'c1': Duplicate host name within this network.",
+        "[Uniqueness-HostAddress (Network C, Zone Z1)] 'c1': Address '10.0.0.1' is already in use.",
+        "[Uniqueness-HostAddress (Network C2, Zone Z1)] 'c3': Address '10.0.0.1' is already in use.",
+        "[Uniqueness-NetworkAddress (Zone Z1)] 'C2': Address 'net-1' is already in use.",
+        "[Uniqueness-Zone] 'Z1': Duplicate zone name.",
+    ],
+    "spatial": [
+        "[Adapter 'A1' (idx 0, Zone 'Wide' (idx 0))] 'C': Referenced quantumNetwork is of type 'CLASSICAL_NETWORK', expected 'QUANTUM_NETWORK'.",
+        "[Adapter 'A1' (idx 0, Zone 'Wide' (idx 0))] 'far': Referenced quantumHost 'far' in network 'C' has type 'ClassicalHost', not a typical quantum type for adapter connection.",
+        "[Adapter 'A1' (idx 0, Zone 'Wide' (idx 0))] 'location': Adapter location ((-6.0, 10.0)) is outside its zone boundaries (pos (-5.0, 10.0), size (150.0, 0.0)).",
+        "[Adapter 'A1' (idx 0, Zone 'Wide' (idx 0))] 'location': Adapter location coordinates ((-6.0, 10.0)) must be non-negative.",
+        "[Host 'far' (idx 2, Network 'C' (idx 0, Zone 'Wide' (idx 0)))] 'location': Host location ((90.0, 90.0)) is outside its zone boundaries (pos (-5.0, 10.0), size (150.0, 0.0)).",
+        "[Host 'h' (idx 0, Network 'N' (idx 0, Zone 'Neg' (idx 1)))] 'location': Host location coordinates ((-2.0, 5.0)) must be non-negative.",
+        "[Host 'negative' (idx 1, Network 'C' (idx 0, Zone 'Wide' (idx 0)))] 'location': Host location ((-10.0, -1.0)) is outside its zone boundaries (pos (-5.0, 10.0), size (150.0, 0.0)).",
+        "[Host 'negative' (idx 1, Network 'C' (idx 0, Zone 'Wide' (idx 0)))] 'location': Host location coordinates ((-10.0, -1.0)) must be non-negative.",
+        "[Network 'C' (idx 0, Zone 'Wide' (idx 0))] 'location': Network location ((-20.0, 50.0)) is outside its zone boundaries (pos (-5.0, 10.0), size (150.0, 0.0)).",
+        "[Network 'C' (idx 0, Zone 'Wide' (idx 0))] 'location': Network location coordinates ((-20.0, 50.0)) must be non-negative.",
+        "[Network 'N' (idx 0, Zone 'Neg' (idx 1))] 'location': Network location coordinates ((-1.0, -1.0)) must be non-negative.",
+        "[World 'fixture'] 'size': World size dimensions ((100, 0)) must be positive.",
+        "[Zone 'Neg' (idx 1)] 'boundaries': Zone (pos (-3.0, -3.0), size (10.0, 10.0)) exceeds world boundaries ((100, 0)).",
+        "[Zone 'Neg' (idx 1)] 'position': Zone position coordinates ((-3.0, -3.0)) must be non-negative.",
+        "[Zone 'Wide' (idx 0)] 'boundaries': Zone (pos (-5.0, 10.0), size (150.0, 0.0)) exceeds world boundaries ((100, 0)).",
+        "[Zone 'Wide' (idx 0)] 'position': Zone position coordinates ((-5.0, 10.0)) must be non-negative.",
+        "[Zone 'Wide' (idx 0)] 'size': Zone size dimensions ((150.0, 0.0)) must be positive.",
+    ],
+    "references_and_types": [
+        "[Adapter 'missing' (idx 1, Zone 'Z1' (idx 0))] 'Nope': Referenced classicalNetwork not found in this zone.",
+        "[Adapter 'missing' (idx 1, Zone 'Z1' (idx 0))] 'ghost': Referenced quantumHost not found in quantumNetwork 'Q'.",
+        "[Adapter 'mistyped' (idx 2, Zone 'Z1' (idx 0))] 'ch': Referenced quantumHost 'ch' in network 'Q' has type 'ClassicalHost', not a typical quantum type for adapter connection.",
+        "[Adapter 'mistyped' (idx 2, Zone 'Z1' (idx 0))] 'qh': Referenced classicalHost 'qh' in network 'C' has type 'QuantumHost', not a typical classical type for adapter connection.",
+        "[Adapter 'swapped' (idx 0, Zone 'Z1' (idx 0))] 'C': Referenced quantumNetwork is of type 'CLASSICAL_NETWORK', expected 'QUANTUM_NETWORK'.",
+        "[Adapter 'swapped' (idx 0, Zone 'Z1' (idx 0))] 'Q': Referenced classicalNetwork is of type 'QUANTUM_NETWORK', expected 'CLASSICAL_NETWORK'.",
+        "[Adapter 'swapped' (idx 0, Zone 'Z1' (idx 0))] 'c1': Referenced quantumHost 'c1' in network 'C' has type 'ClassicalHost', not a typical quantum type for adapter connection.",
+        "[Adapter 'swapped' (idx 0, Zone 'Z1' (idx 0))] 'q1': Referenced classicalHost 'q1' in network 'Q' has type 'QuantumHost', not a typical classical type for adapter connection.",
+        "[Connection 'bad' (idx 0, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'ghost': to_node does not refer to a host in this network.",
+        "[Connection 'self' (idx 1, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'c1': Connection cannot connect a node to itself.",
+        "[Host 'box' (idx 2, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'type': Host type 'Zone' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {'ClassicToQuantumConverter', 'ClassicalHost', 'ClassicalRouter', 'InternetExchange'} or QuantumAdapter endpoint.",
+        "[Host 'box' (idx 2, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'type': Host type 'Zone' is not appropriate for a host entity (it's a container type).",
+        "[Host 'ch' (idx 1, Network 'Q' (idx 1, Zone 'Z1' (idx 0)))] 'type': Host type 'ClassicalHost' is not a typical quantum host type for a QUANTUM_NETWORK. Expected one of {'QuantumHost', 'QuantumRepeater', 'QuantumToClassicConverter'} or QuantumAdapter endpoint.",
+        "[Host 'qh' (idx 1, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'type': Host type 'QuantumHost' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {'ClassicToQuantumConverter', 'ClassicalHost', 'ClassicalRouter', 'InternetExchange'} or QuantumAdapter endpoint.",
+    ],
+    "duplicate_network_names": [
+        "[Adapter 'to-both' (idx 2, Zone 'Z1' (idx 0))] 'shared': Referenced classicalHost 'shared' in network 'C' has type 'QuantumRepeater', not a typical classical type for adapter connection.",
+        "[Adapter 'to-shadowed' (idx 0, Zone 'Z1' (idx 0))] 'first': Referenced classicalHost 'first' in network 'C' has type 'QuantumHost', not a typical classical type for adapter connection.",
+        "[Adapter 'to-shadowed' (idx 0, Zone 'Z1' (idx 0))] 'first': Referenced classicalHost not found in classicalNetwork 'C'.",
+        "[Host 'first' (idx 0, Network 'C' (idx 0, Zone 'Z1' (idx 0)))] 'type': Host type 'QuantumHost' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {'ClassicToQuantumConverter', 'ClassicalHost', 'ClassicalRouter', 'InternetExchange'} or QuantumAdapter endpoint.",
+        "[Host 'shared' (idx 1, Network 'C' (idx 2, Zone 'Z1' (idx 0)))] 'type': Host type 'QuantumRepeater' is not a typical classical host type for a CLASSICAL_NETWORK. Expected one of {'ClassicToQuantumConverter', 'ClassicalHost', 'ClassicalRouter', 'InternetExchange'} or QuantumAdapter endpoint.",
+        "[Uniqueness-Network (Zone Z1)] 'C': Duplicate network name within this zone.",
+    ],
+}
+
+
+# Type messages embed a set literal whose order depends on string hashing
+_SET_LITERAL = re.compile(r"\{([^{}]*)\}")
+
+
+def _canonical(message: str) -> str:
+    return _SET_LITERAL.sub(lambda m: "{" + ", ".join(sorted(m.group(1).split(", "))) + "}", message)
+
+
+def build_world(data) -> WorldModal:
+    # model_construct skips the redis_om __init__, which needs a live Redis;
+    # zones are still validated into models
+    return WorldModal.model_construct(
+        name=data["name"], size=tuple(data["size"]), zones=[ZoneModal(**z) for z in data["zones"]]
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_validation_cache():
+    world_validation._validation_cache.clear()
+    yield
+    world_validation._validation_cache.clear()
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURE_WORLDS))
+def test_errors_match_original_validators(name):
+    """The single-pass validator reports exactly the errors of the original validators."""
+    errors = validate_world_topology_static_logic(build_world(FIXTURE_WORLDS[name]))
+    assert Counter(map(_canonical, errors)) == Counter(EXPECTED_ERRORS[name])
+
+
+def test_shadowed_network_hosts_are_not_found():
+    """Adapters cannot reference hosts of a network shadowed by a later one with the same name."""
+    errors = validate_world_topology_static_logic(build_world(FIXTURE_WORLDS["duplicate_network_names"]))
+    not_found = [e for e in errors if "Referenced classicalHost not found" in e]
+    assert len(not_found) == 1
+    assert not_found[0].startswith("[Adapter 'to-shadowed'")
+
+
+def test_cached_result_is_a_copy():
+    """Revalidating an unchanged world gives the same errors without sharing the list."""
+    world = build_world(FIXTURE_WORLDS["references_and_types"])
+    first = validate_world_topology_static_logic(world)
+    first.append("caller mutation")
+    second = validate_world_topology_static_logic(world)
+    assert "caller mutation" not in second
+    assert Counter(second) == Counter(first[:-1])
@@ -1,5 +1,10 @@
 import random
 
+# Known states, indexed by basis * 2 + bit
+QUBIT_STATES = ("|0⟩", "|1⟩", "|+⟩", "|-⟩")
+# State string -> (basis, bit)
+_STATE_TABLE = {state: divmod(code, 2) for code, state in enumerate(QUBIT_STATES)}
+
 def encode_qubit(bit, basis):
     """
     Encode a classical bit into a quantum state based on the chosen basis.
@@ -32,20 +37,70 @@ def measure_qubit(qubit, alice_basis, bob_basis):
         int: Measurement result (0 or 1)
     """
     if alice_basis == bob_basis:
-        # Same basis - Bob gets Alice's original bit
-        if alice_basis == 0:  # Computational basis
-            if qubit == "|0⟩":
-                return 0
-            elif qubit == "|1⟩":
-                return 1
-        else:  # Hadamard basis
-            if qubit == "|+⟩":
-                return 0
-            elif qubit == "|-⟩":
-                return 1
-    else:
-        # Different basis - quantum uncertainty gives random result
-        return random.choice([0, 1])
-    
-    # Fallback for unrecognized qubit states
-    return random.choice([0, 1])
+        state = _STATE_TABLE.get(qubit)
+        if state is not None and state[0] == (alice_basis != 0):
+            # Same basis - Bob gets Alice's original bit
+            return state[1]
+
+    # Different basis (or unrecognized state) - quantum uncertainty gives random result
+    return random.getrandbits(1)
+
+
+def encode_qubits(bits, bases):
+    """
+    Encode a batch of classical bits as qubit state codes.
+
+    Args:
+        bits (array-like): 0/1 classical bits
+        bases (array-like): 0 for computational basis, 1 for Hadamard basis
+
+    Returns:
+        np.ndarray: int8 state codes (basis * 2 + bit), indexing QUBIT_STATES
+    """
+    import numpy as np
+
+    bits = np.asarray(bits, dtype=np.int8)
+    bases = np.asarray(bases, dtype=np.int8)
+    return bases * 2 + bits
+
+def measure_qubits(qubits, alice_bases, bob_bases, rng=None):
+    """
+    Measure a batch of qubit state codes.
+
+    Args:
+        qubits (array-like): state codes from encode_qubits
+        alice_bases (array-like): bases Alice used to encode (0 or 1)
+        bob_bases (array-like): bases Bob uses to measure (0 or 1)
+        rng (np.random.Generator, optional): source of the random outcomes
+
+    Returns:
+        np.ndarray: int8 measurement results (0 or 1)
+    """
+    import numpy as np
+
+    qubits = np.asarray(qubits, dtype=np.int8)
+    alice_bases = np.asarray(alice_bases, dtype=np.int8)
+    bob_bases = np.asarray(bob_bases, dtype=np.int8)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Same basis - Bob gets Alice's original bit
+    results = qubits & 1
+    # Different basis (or state not in Alice's basis) - one batched draw covers every random outcome
+    random_outcome = (alice_bases != bob_bases) | ((qubits >> 1) != alice_bases)
+    results[random_outcome] = rng.integers(0, 2, size=int(random_outcome.sum()), dtype=np.int8)
+    return results
+
+def qubit_states(qubits):
+    """
+    Convert state codes to their string representation.
+
+    Args:
+        qubits (array-like): state codes from encode_qubits
+
+    Returns:
+        list: Quantum state strings, as returned by encode_qubit
+    """
+    import numpy as np
+
+    return [QUBIT_STATES[code] for code in np.asarray(qubits).tolist()]
@@ -0,0 +1,63 @@
+# bb84_kernels.py
+# ===================================
+# Optional Numba kernels for the BB84 sifting and error-estimation loops.
+# Each kernel does its compare, gather and count in one pass with no
+# temporary arrays. When Numba (or NumPy) is not installed the kernels are
+# None and callers use their NumPy / pure-Python paths instead.
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def sift(basis_a, basis_b, outcomes):
+        """
+        Find the indices where both bases agree.
+
+        Args:
+            basis_a, basis_b (np.ndarray): integer basis choices
+            outcomes (np.ndarray): measured bits, aligned with basis_a
+
+        Returns:
+            tuple: (shared indices, outcomes at those indices) as arrays
+        """
+        n = min(len(basis_a), len(basis_b), len(outcomes))
+        shared_idx = np.empty(n, np.int64)
+        shared_bits = np.empty_like(outcomes[:n])
+        k = 0
+        for i in range(n):
+            if basis_a[i] == basis_b[i]:
+                shared_idx[k] = i
+                shared_bits[k] = outcomes[i]
+                k += 1
+        return shared_idx[:k], shared_bits[:k]
+
+    @njit(cache=True)
+    def error_count(sample_bits, sample_idx, outcomes):
+        """
+        Compare a sample of the peer's bits against our outcomes.
+
+        Args:
+            sample_bits (np.ndarray): the peer's bits
+            sample_idx (np.ndarray): index of each sampled bit in outcomes
+            outcomes (np.ndarray): our measured bits
+
+        Returns:
+            tuple: (errors, comparisons), skipping out-of-range indices
+        """
+        n = len(outcomes)
+        errors = 0
+        comparisons = 0
+        for k in range(len(sample_idx)):
+            i = sample_idx[k]
+            if 0 <= i < n:
+                comparisons += 1
+                if outcomes[i] != sample_bits[k]:
+                    errors += 1
+        return errors, comparisons
+else:
+    sift = None
+    error_count = None
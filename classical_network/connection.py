@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from classical_network.node import ClassicalNode
 from classical_network.packet import ClassicDataPacket
 from core.base_classes import Sobject
@@ -5,15 +7,21 @@ from core.enums import SimulationEventType
 from core.exceptions import NotConnectedError
 
 
+# eq=False keeps identity comparison and hashing, which nodes and routing rely on
+@dataclass(slots=True, eq=False)
 class ClassicConnection(Sobject):
-    def __init__(self, node_1: ClassicalNode, node_2: ClassicalNode, bandwidth, latency, status="up", name="", description=""):
-        super().__init__(name, description)
-        self.node_1 = node_1
-        self.node_2 = node_2
-        self.bandwidth = bandwidth
-        self.latency = latency
-        self.status = status
-        
+    node_1: ClassicalNode
+    node_2: ClassicalNode
+    bandwidth: float
+    latency: float
+    status: str = "up"
+    name: str = ""
+    description: str = ""
+
+    def __post_init__(self):
+        # slots=True rebuilds the class, so zero-argument super() cannot be used here
+        Sobject.__init__(self, self.name, self.description)
+
     def __name__(self):
         return f'{self.node_1.name} <-> {self.node_2.name}'
     
@@ -21,11 +29,14 @@ class ClassicConnection(Sobject):
         return self.__name__()
 
     def transmit_packet(self, packet: ClassicDataPacket):
-        if packet.next_hop == self.node_1:
-            self.node_1.write_buffer(packet.hops[-1], packet)
-        elif packet.next_hop == self.node_2:
-            self.node_2.write_buffer(packet.hops[-1], packet)
+        # Nodes are unique simulator objects, so identity decides the receiving side
+        last_hop, next_hop = packet.hops[-1], packet.next_hop
+        if next_hop is self.node_1:
+            self.node_1.write_buffer(last_hop, packet)
+        elif next_hop is self.node_2:
+            self.node_2.write_buffer(last_hop, packet)
         else:
-            raise NotConnectedError(packet.hops[-1], packet.next_hop)
+            raise NotConnectedError(last_hop, next_hop)
 
-        self._send_update(SimulationEventType.PACKET_TRANSMITTED, packet=packet)
+        if self._has_update_subscribers():
+            self._send_update(SimulationEventType.PACKET_TRANSMITTED, packet=packet)
@@ -45,13 +45,14 @@ class ClassicalHost(ClassicalNode):
 
     def forward(self):
         for node_2, buffer in self.buffers.items():
-            while not buffer.empty():
-                packet = buffer.get()
+            popleft = buffer.popleft
+            while buffer:
+                packet = popleft()
 
-                if packet.to_address == self:
+                if packet.to_address is self:
                     self.recive_packet(packet)
                 else:
-                    self.logger.warn(f"Unexpected packet '{packet}' received from {node_2}")
+                    self.logger.warning("Unexpected packet '%s' received from %s", packet, node_2)
 
     def recive_packet(self, packet: ClassicDataPacket):
         self._send_update(SimulationEventType.PACKET_RECEIVED, packet=packet)
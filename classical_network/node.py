@@ -1,5 +1,5 @@
 from __future__ import annotations
-from queue import Queue
+from collections import deque
 from typing import Dict, List, Tuple
 
 from classical_network.packet import ClassicDataPacket
@@ -10,8 +10,6 @@ from core.network import Network
 
 from typing import TYPE_CHECKING
 
-from utils.debug import print_caller
-
 if TYPE_CHECKING:
     from classical_network.connection import ClassicConnection
 
@@ -32,10 +30,22 @@ class ClassicalNode(Node):
 
         self.address = address
         self.connections: List[ClassicConnection] = []
-        self.buffers: Dict[ClassicalNode, Queue[ClassicDataPacket]] = dict()
+        # First connection to each neighbour (peer -> connection), so lookups
+        # involving this node are O(1) instead of a scan of self.connections
+        self._connections_by_peer: Dict[ClassicalNode, ClassicConnection] = dict()
+        # Written by the sending side's connection and drained by forward(); deque
+        # append/popleft are atomic, so a single consumer needs no extra locking.
+        # Drain with popleft rather than swapping in a fresh deque: a producer on
+        # another network's thread may still append to the deque it looked up,
+        # and a packet left unprocessed by a routing error stays queued.
+        self.buffers: Dict[ClassicalNode, deque[ClassicDataPacket]] = dict()
 
-    @print_caller
     def get_connection(self, node_1, node_2):
+        if node_1 is self:
+            return self._connections_by_peer.get(node_2)
+        if node_2 is self:
+            return self._connections_by_peer.get(node_1)
+
         for conn in self.connections:
             if (conn.node_1 == node_1 and conn.node_2 == node_2) or (
                 conn.node_2 == node_1 and conn.node_1 == node_2
@@ -48,10 +58,14 @@ class ClassicalNode(Node):
         other_node = (
             connection.node_2 if connection.node_1 == self else connection.node_1
         )
-        self.buffers[other_node] = Queue()
+        # The internet exchange also records connections between other nodes;
+        # only the ones this node terminates are reachable through it
+        if connection.node_1 is self or connection.node_2 is self:
+            self._connections_by_peer.setdefault(other_node, connection)
+        self.buffers[other_node] = deque()
 
     def write_buffer(self, from_node: "ClassicalNode", packet: ClassicDataPacket):
         if from_node not in self.buffers:
             raise BufferNotAssigned(from_node, self)
 
-        self.buffers[from_node].put_nowait(packet)
+        self.buffers[from_node].append(packet)
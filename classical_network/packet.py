@@ -1,12 +1,34 @@
-from datetime import datetime
-from collections import defaultdict
+from itertools import count
+import time as _time
 from typing import Any
 import uuid
 from classical_network.enum import PacketType
 from core.base_classes import Node, Sobject
 
+# Ids for packets that stay inside this process; starts at 1 so ids are always truthy
+_packet_ids = count(1)
+
+
+class _HeaderValues(list):
+    """Values of a header that was appended more than once."""
+    __slots__ = ()
+
 
 class ClassicDataPacket(Sobject):
+    __slots__ = (
+        "id",
+        "from_address",
+        "to_address",
+        "type",
+        "time",
+        "hops",
+        "protocol",
+        "next_hop",
+        "data",
+        "destination_address",
+        "headers",
+    )
+
     def __init__(
         self,
         data: Any,
@@ -18,13 +40,19 @@ class ClassicDataPacket(Sobject):
         name="",
         description="",
         destination_address: Node = None,
+        external=False,
+        id=None,
     ):
         super().__init__(name, description)
 
         if time == 0:
-            time = datetime.now().timestamp
+            time = _time.time()
 
-        self.id = uuid.uuid4().hex
+        # Packets that leave the process need globally unique ids; an explicit id
+        # (e.g. one received from another process) is kept as-is
+        if id is None:
+            id = uuid.uuid4().hex if external else next(_packet_ids)
+        self.id = id
         self.from_address = from_address
         self.to_address = to_address
         self.type = type
@@ -34,33 +62,68 @@ class ClassicDataPacket(Sobject):
         self.next_hop = to_address
         self.data = data
         self.destination_address = destination_address
-        self.headers = defaultdict(list)
+        # Most packets never carry headers; the dict is created on first append_header.
+        # Each header maps to its value, or to _HeaderValues once it repeats.
+        self.headers = None
+
+    @property
+    def hex_id(self) -> str:
+        """The id as a hex string, formatted only when read."""
+        return f"{self.id:016x}" if isinstance(self.id, int) else str(self.id)
 
     def append_hop(self, hop: Node):
         self.hops.append(hop)
 
     def append_header(self, header:str, value: Any):
-        self.headers[header].append(value)
+        if self.headers is None:
+            self.headers = {header: value}
+        elif header not in self.headers:
+            self.headers[header] = value
+        else:
+            # A repeated header is promoted to a list of its values
+            current = self.headers[header]
+            if not isinstance(current, _HeaderValues):
+                current = self.headers[header] = _HeaderValues((current,))
+            current.append(value)
 
     def get_header(self, header: str) -> Any:
-        return self.headers[header][0] if header in self.headers else None
+        if self.headers is None or header not in self.headers:
+            return None
+        value = self.headers[header]
+        return value[0] if isinstance(value, _HeaderValues) else value
     
     def remove_header(self, header: str, value: Any = None):
-        if value is not None:
-            if value in self.headers[header]:
-                self.headers[header].remove(value)
-        else:
+        if value is None:
+            if self.headers is None:
+                raise KeyError(header)
+            del self.headers[header]
+            return
+
+        if self.headers is None or header not in self.headers:
+            return
+        current = self.headers[header]
+        if isinstance(current, _HeaderValues):
+            if value in current:
+                current.remove(value)
+            if not current:
+                del self.headers[header]
+        elif current == value:
             del self.headers[header]
 
     def to_dict(self):
+        destination_address = self.destination_address
+        headers = self.headers
         dict_str = {
             'type': str(type(self)),
             'from': self.from_address.name,
             'to': self.to_address.name,
-            'hops': list(map(lambda x : x.name,self.hops)),
+            'hops': [hop.name for hop in self.hops],
             'data': str(self.data),
-            'destination_address': self.destination_address.name if self.destination_address else None,
-            'headers': self.headers
+            'destination_address': destination_address.name if destination_address else None,
+            'headers': {
+                header: list(value) if isinstance(value, _HeaderValues) else [value]
+                for header, value in headers.items()
+            } if headers else {}
         }
         
         return dict_str
@@ -1,10 +1,11 @@
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 from classical_network.connection import ClassicConnection
 from classical_network.enum import PacketType
 from classical_network.node import ClassicalNode
 from classical_network.packet import ClassicDataPacket
 from core.base_classes import World, Zone
 from core.enums import NodeType, SimulationEventType
+from core.event import Event
 from core.exceptions import NotConnectedError
 from core.network import Network
 from classical_network.routing import InternetExchange, RouteTable
@@ -31,6 +32,10 @@ class ClassicalRouter(ClassicalNode):
         )
         self.routing_table = RouteTable()
         self.default_gateway = InternetExchange.get_instance()
+        # Events raised during forward() are collected here and delivered in one batch
+        self._pending_events: Optional[List[Event]] = None
+        # to_address -> (gateway route table version, next hop, connection, is_direct)
+        self._route_cache: Dict[ClassicalNode, Tuple[int, ClassicalNode, ClassicConnection, bool]] = {}
         isp_connection = ClassicConnection(self, self.default_gateway, 100, 10)
         self.add_connection(isp_connection)
 
@@ -39,19 +44,33 @@ class ClassicalRouter(ClassicalNode):
 
     def add_connection(self, connection: ClassicConnection):
         super().add_connection(connection)
+        self._route_cache.clear()
 
         self.update_local_routing_table(connection.node_1, connection.node_2)
         self.default_gateway.add_connection(connection)
 
     def forward(self):
-        for node_2, buffer in self.buffers.items():
-            while not buffer.empty():
-                packet = buffer.get()
-
-                if packet.next_hop == self:
-                    self.recive_packet(packet)
-                else:
-                    print(f"Unexpected packet '{packet}' received from {node_2}")
+        self._pending_events = pending_events = []
+        try:
+            for node_2, buffer in self.buffers.items():
+                popleft = buffer.popleft
+                while buffer:
+                    packet = popleft()
+
+                    if packet.next_hop is self:
+                        self.recive_packet(packet)
+                    else:
+                        self.logger.debug("Unexpected packet '%s' received from %s", packet, node_2)
+        finally:
+            self._pending_events = None
+            if pending_events:
+                self.on_update_batch(pending_events)
+
+    def _send_update(self, event_type: SimulationEventType, **kwargs):
+        if self._pending_events is None:
+            super()._send_update(event_type, **kwargs)
+        else:
+            self._pending_events.append(Event(event_type, self, **kwargs))
 
     def recive_packet(self, packet: ClassicDataPacket):
         packet.append_hop(self)
@@ -60,28 +79,37 @@ class ClassicalRouter(ClassicalNode):
             self._send_update(SimulationEventType.PACKET_RECEIVED, packet=packet)
 
     def route_packet(self, packet: ClassicDataPacket):
-        direct_connection = self.get_connection(self, packet.to_address)
+        to_address = packet.to_address
+        version = self.default_gateway.route_table.version
+        route = self._route_cache.get(to_address)
+        if route is None or route[0] != version:
+            route = self._resolve_route(to_address, version)
+            self._route_cache[to_address] = route
+
+        _, next_hop, connection, is_direct = route
+        packet.next_hop = next_hop
+        connection.transmit_packet(packet)
 
-        if direct_connection:
-            packet.next_hop = packet.to_address
-            direct_connection.transmit_packet(packet)
-            return
+        if not is_direct:
+            self._send_update(SimulationEventType.PACKET_ROUTED, packet=packet)
 
-        shortest_path = self.default_gateway.get_path(self, packet.to_address)
+    def _resolve_route(self, to_address: ClassicalNode, version: int):
+        direct_connection = self.get_connection(self, to_address)
 
-        if len(shortest_path) <= 1:
-            raise NotConnectedError(self, packet.to_address)
+        if direct_connection:
+            return version, to_address, direct_connection, True
 
-        next_hop = shortest_path[1]
+        next_hop = self.default_gateway.build_routing_snapshot().get((self, to_address))
+
+        if next_hop is None:
+            raise NotConnectedError(self, to_address)
 
-        packet.next_hop = next_hop
         next_connection = self.get_connection(self, next_hop)
 
         if not next_connection:
             raise NotConnectedError(self, next_hop)
 
-        next_connection.transmit_packet(packet)
-        self._send_update(SimulationEventType.PACKET_ROUTED, packet=packet)
+        return version, next_hop, next_connection, False
 
     def __name__(self):
         return f"Router - '{self.name}'"
@@ -1,8 +1,10 @@
 
 from __future__ import annotations
+from collections import deque
 import threading
 import time
-from typing import List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 try:
     import networkx as nx  # Optional dependency for routing
     _USE_NETWORKX = True
@@ -24,6 +26,11 @@ if TYPE_CHECKING:
 class RouteTable(object):
 
     def __init__(self):
+        # Bumped on every topology change so callers can tell when cached paths are stale
+        self.version = 0
+        self._lock = threading.Lock()
+        # (version it was built for, read-only next-hop table)
+        self._snapshot: Tuple[int, Mapping[Tuple[ClassicalNode, ClassicalNode], ClassicalNode]] = (-1, MappingProxyType({}))
         if _USE_NETWORKX:
             self.network_graph = nx.Graph()
         else:
@@ -72,7 +79,49 @@ class RouteTable(object):
             self.network_graph = _SimpleGraph()
 
     def add_edge(self, from_node: ClassicalNode, to_node: ClassicalNode):
-        self.network_graph.add_edge(from_node, to_node)
+        with self._lock:
+            self.network_graph.add_edge(from_node, to_node)
+            self.version += 1
+
+    def next_hop_snapshot(self) -> Mapping[Tuple[ClassicalNode, ClassicalNode], ClassicalNode]:
+        """
+        Read-only {(source, target): next hop} table over all reachable pairs.
+        It is rebuilt lazily, at most once per topology version, so routing a
+        packet is a single lookup while the topology is unchanged.
+        """
+        version, snapshot = self._snapshot
+        if version == self.version:
+            return snapshot
+
+        with self._lock:
+            version = self.version
+            snapshot = MappingProxyType(self._build_next_hops())
+        self._snapshot = (version, snapshot)
+        return snapshot
+
+    def _build_next_hops(self) -> Dict[Tuple[ClassicalNode, ClassicalNode], ClassicalNode]:
+        # One BFS per source; both graph implementations expose `adj` as node -> neighbours
+        adj = self.network_graph.adj
+        next_hops = {}
+        for source in adj:
+            first_hop = {source: None}
+            queue = deque()
+            for neighbour in adj[source]:
+                if neighbour not in first_hop:
+                    first_hop[neighbour] = neighbour
+                    queue.append(neighbour)
+            while queue:
+                node = queue.popleft()
+                hop = first_hop[node]
+                for neighbour in adj[node]:
+                    if neighbour not in first_hop:
+                        first_hop[neighbour] = hop
+                        queue.append(neighbour)
+
+            del first_hop[source]
+            for target, hop in first_hop.items():
+                next_hops[(source, target)] = hop
+        return next_hops
 
     def get_path(
         self, from_node: ClassicalNode, to_node: ClassicalNode
@@ -101,13 +150,14 @@ class InternetExchange(ClassicalNode):
 
     def forward(self):
         for node_2, buffer in self.buffers.items():
-            while not buffer.empty():
-                packet = buffer.get()
+            popleft = buffer.popleft
+            while buffer:
+                packet = popleft()
                 
-                if packet.next_hop == self:
+                if packet.next_hop is self:
                     self.recive_packet(packet)
                 else:
-                    self.logger.warn(f"Unexpected packet '{packet}' received from {node_2}")
+                    self.logger.warning("Unexpected packet '%s' received from %s", packet, node_2)
                     
 
     def recive_packet(self, packet: ClassicDataPacket):
@@ -150,6 +200,9 @@ class InternetExchange(ClassicalNode):
 
     def get_path(self, from_host, to_host):
         return self.route_table.get_path(from_host, to_host)
+
+    def build_routing_snapshot(self) -> Mapping[Tuple[ClassicalNode, ClassicalNode], ClassicalNode]:
+        return self.route_table.next_hop_snapshot()
     
     def start(self, fps):
         def _start():
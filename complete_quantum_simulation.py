@@ -4,332 +4,18 @@
 # Students just need to call run_complete_quantum_simulation() after implementing BB84.
 
 import sys
-import time
+import threading
 import random
 import os
 import json
 
 def create_enhanced_bridge():
-    """Create the enhanced bridge that properly handles BB84 completion"""
-    
-    enhanced_bridge_code = '''import random
-import json
-
-# Helper functions for quantum operations
-try:
-    import qutip as qt
-except Exception:
-    qt = None
-
-def encode_qubit(bit, basis):
-    """Return a qubit prepared in basis ('Z' or 'X') encoding the given bit."""
-    b = 'Z' if basis in ('Z', 0) else 'X'
-    if qt is not None:
-        if b == 'Z':
-            return qt.basis(2, bit)
-        return (qt.basis(2, 0) + (1 if bit == 0 else -1) * qt.basis(2, 1)).unit()
-    return (b, bit)
-
-def measure_qubit(qubit, alice_basis, bob_basis):
-    """Measure qubit in bob_basis ('Z'/'X' or 0/1)."""
-    b = 'Z' if bob_basis in ('Z', 0) else 'X'
-    if qt is not None and hasattr(qt, 'Qobj') and isinstance(qubit, qt.Qobj):
-        if b == 'Z':
-            proj0 = qt.ket2dm(qt.basis(2, 0))
-        else:
-            proj0 = qt.ket2dm((qt.basis(2, 0) + qt.basis(2, 1)).unit())
-        p0 = qt.expect(proj0, qubit)
-        return 0 if random.random() < p0 else 1
-    if isinstance(qubit, tuple) and len(qubit) == 2:
-        qb_basis, bit = qubit
-        qb_b = 'Z' if qb_basis in ('Z', 0) else 'X'
-        if qb_b == b:
-            return bit
-    return random.choice([0, 1])
-
-class EnhancedStudentImplementationBridge:
-    """Enhanced bridge with proper QKD phase management and completion signals"""
-    
-    def __init__(self, student_alice=None, student_bob=None):
-        # Handle case where simulation instantiates without parameters
-        if student_alice is None or student_bob is None:
-            # Use global instances if available
-            try:
-                global alice, bob
-                self.student_alice = alice if 'alice' in globals() and alice is not None else self._create_dummy_host("Alice")
-                self.student_bob = bob if 'bob' in globals() and bob is not None else self._create_dummy_host("Bob")
-            except:
-                self.student_alice = self._create_dummy_host("Alice")
-                self.student_bob = self._create_dummy_host("Bob")
-        else:
-            self.student_alice = student_alice
-            self.student_bob = student_bob
-            
-        self.host = None  # CRITICAL: Will be set when attached to simulation host
-        self.qkd_phase = "idle"  # Track QKD phase: idle -> sending -> receiving -> reconciling -> error_checking -> complete
-        self.bits_received = 0
-        self.expected_bits = 50  # Default, will be updated from channel
-        print("🔗 Enhanced Bridge created! BB84 implementation with completion signals enabled.")
-    
-    def _create_dummy_host(self, name):
-        """Create a dummy host if student implementations aren't available"""
-        class DummyHost:
-            def __init__(self, name):
-                self.name = name
-                self.alice_bits = []
-                self.alice_bases = []
-                self.encoded_qubits = []
-                self.basis_choices = []
-                self.measurement_outcomes = []
-            
-            def bb84_send_qubits(self, num_qubits):
-                print(f"⚠️ Using dummy implementation for {self.name}")
-                return []
-        
-        return DummyHost(name)
-    
-    def bb84_send_qubits(self, num_qubits):
-        """Send qubits via the simulator using student implementation."""
-        if self.host is None:
-            print("⚠️ Bridge not attached to a simulation host")
-            return False
-            
-        self.qkd_phase = "sending"
-        self.expected_bits = num_qubits
-        print(f"🚀 Starting BB84 protocol with {num_qubits} qubits")
-        
-        # Alice prepares qubits and bases using student implementation
-        encoded_qubits = self.student_alice.bb84_send_qubits(num_qubits)
-        
-        # CRITICAL: Record Alice's bases and bits on the simulation host
-        self.host.basis_choices = list(self.student_alice.alice_bases)
-        self.host.measurement_outcomes = list(self.student_alice.alice_bits)
-        
-        # Send through the actual quantum channel
-        channel = self.host.get_channel()
-        if channel is None:
-            print(f"❌ ERROR: {self.host.name} has no quantum channel to send qubits.")
-            return False
-        
-        print(f"📤 Sending {len(encoded_qubits)} qubits through quantum channel...")
-        for i, q in enumerate(encoded_qubits):
-            self.host.send_qubit(q, channel)
-            if i % 10 == 0:  # Progress indicator
-                print(f"   Sent {i+1}/{len(encoded_qubits)} qubits")
-        
-        print(f"✅ All {len(encoded_qubits)} qubits sent successfully")
-        return True
-    
-    def process_received_qbit(self, qbit, from_channel):
-        """Measure a received qubit using student logic and store results on the host."""
-        if self.host is None:
-            return False
-            
-        if self.qkd_phase == "idle":
-            self.qkd_phase = "receiving"
-            print("📥 Started receiving qubits...")
-            
-        self.bits_received += 1
-        
-        # CRITICAL FIX: Use student's Bob implementation instead of hardcoded logic
-        if hasattr(self.student_bob, 'process_received_qbit'):
-            # Call the student's Bob implementation
-            result = self.student_bob.process_received_qbit(qbit, from_channel)
-            
-            # Update the host's state with Bob's results from student implementation
-            if hasattr(self.student_bob, 'basis_choices') and hasattr(self.student_bob, 'measurement_outcomes'):
-                self.host.basis_choices = list(self.student_bob.basis_choices)
-                self.host.measurement_outcomes = list(self.student_bob.measurement_outcomes)
-            
-            # Progress indicator
-            if self.bits_received % 10 == 0:
-                print(f"   Received {self.bits_received}/{self.expected_bits} qubits")
-            
-            # Check if we've received all expected qubits
-            if self.bits_received >= self.expected_bits:
-                print(f"✅ Received all {self.bits_received} qubits, starting reconciliation...")
-                self.qkd_phase = "ready_for_reconciliation"
-            
-            return result
-        else:
-            # Fallback to hardcoded logic if student implementation is missing
-            print("⚠️ Student Bob implementation missing process_received_qbit, using fallback")
-            
-            # Bob chooses random basis (0=Z, 1=X)
-            bob_basis = random.choice([0, 1])
-            
-            # Infer Alice basis from our simple string encoding
-            if isinstance(qbit, str):
-                alice_basis = 0 if qbit in ('|0⟩', '|1⟩') else 1
-            else:
-                # Default to random if unknown format
-                alice_basis = random.choice([0, 1])
-            
-            outcome = measure_qubit(qbit, alice_basis, bob_basis)
-            self.host.basis_choices.append(bob_basis)
-            self.host.measurement_outcomes.append(outcome)
-            
-            # Progress indicator
-            if self.bits_received % 10 == 0:
-                print(f"   Received {self.bits_received}/{self.expected_bits} qubits")
-            
-            # Check if we've received all expected qubits
-            if self.bits_received >= self.expected_bits:
-                print(f"✅ Received all {self.bits_received} qubits, starting reconciliation...")
-                self.qkd_phase = "ready_for_reconciliation"
-            
-            return True
-        
-    def bb84_reconcile_bases(self, their_bases):
-        """Find matching bases and trigger error rate estimation."""
-        if self.host is None:
-            return False
-            
-        self.qkd_phase = "reconciling"
-        print("🔄 Starting basis reconciliation...")
-        
-        # CRITICAL FIX: Use student's Bob implementation for reconciliation
-        if hasattr(self.student_bob, 'bb84_reconcile_bases'):
-            # Call the student's Bob implementation
-            result = self.student_bob.bb84_reconcile_bases(their_bases)
-            
-            # Update the host's state with Bob's results from student implementation
-            if hasattr(self.student_bob, 'shared_bases_indices') and hasattr(self.student_bob, 'shared_bits'):
-                self.host.shared_bases_indices = list(self.student_bob.shared_bases_indices)
-                shared_bits = list(self.student_bob.shared_bits)
-            else:
-                # Fallback: extract from student's measurement outcomes
-                shared_indices = []
-                for i, (my_basis, their_basis) in enumerate(zip(self.host.basis_choices, their_bases)):
-                    if my_basis == their_basis and i < len(self.host.measurement_outcomes):
-                        shared_indices.append(i)
-                self.host.shared_bases_indices = shared_indices
-                shared_bits = [self.host.measurement_outcomes[i] for i in shared_indices]
-            
-            # Notify peer about shared indices
-            self.host.send_classical_data({
-                'type': 'shared_bases_indices', 
-                'data': self.host.shared_bases_indices
-            })
-            
-            return self.host.shared_bases_indices, shared_bits
-        else:
-            # Fallback to hardcoded logic if student implementation is missing
-            print("⚠️ Student Bob implementation missing bb84_reconcile_bases, using fallback")
-            
-            # Find shared indices where bases match
-            shared_indices = []
-            for i, (my_basis, their_basis) in enumerate(zip(self.host.basis_choices, their_bases)):
-                if my_basis == their_basis and i < len(self.host.measurement_outcomes):
-                    shared_indices.append(i)
-            
-            self.host.shared_bases_indices = shared_indices
-            shared_bits = [self.host.measurement_outcomes[i] for i in shared_indices]
-            
-            print(f"✅ Reconciliation complete: {len(shared_indices)} shared bases out of {len(their_bases)} total")
-            print(f"   Efficiency: {len(shared_indices)/len(their_bases)*100:.1f}%")
-            
-            # Notify peer about shared indices
-            self.host.send_classical_data({
-                'type': 'shared_bases_indices', 
-                'data': shared_indices
-            })
-            
-            return shared_indices, shared_bits
-    
-    def bb84_estimate_error_rate(self, their_bits_sample):
-        """Compute error rate and CRITICAL: send completion signal."""
-        if self.host is None:
-            return False
-            
-        self.qkd_phase = "error_checking"
-        print("🔍 Starting error rate estimation...")
-        
-        # CRITICAL FIX: Use student's Bob implementation for error rate estimation
-        if hasattr(self.student_bob, 'bb84_estimate_error_rate'):
-            # Call the student's Bob implementation
-            error_rate = self.student_bob.bb84_estimate_error_rate(their_bits_sample)
-            
-            print(f"📊 Student error rate estimation complete: {error_rate:.1%}")
-            
-            # Store learning stats
-            if hasattr(self.host, 'learning_stats'):
-                self.host.learning_stats['error_rates'].append(error_rate)
-            
-            # CRITICAL FIX: Send completion signal to notify adapters
-            print("📡 Sending QKD completion signal...")
-        else:
-            # Fallback to hardcoded logic if student implementation is missing
-            print("⚠️ Student Bob implementation missing bb84_estimate_error_rate, using fallback")
-            
-            errors = 0
-            comparisons = 0
-            
-            for bit, idx in their_bits_sample:
-                if 0 <= idx < len(self.host.measurement_outcomes):
-                    comparisons += 1
-                    if self.host.measurement_outcomes[idx] != bit:
-                        errors += 1
-            
-            error_rate = (errors / comparisons) if comparisons > 0 else 0.0
-            
-            print(f"📊 Error rate estimation complete:")
-            print(f"   Sampled {comparisons} bits")
-            print(f"   Found {errors} errors")
-            print(f"   Error rate: {error_rate:.1%}")
-            
-            # Store learning stats
-            if hasattr(self.host, 'learning_stats'):
-                self.host.learning_stats['error_rates'].append(error_rate)
-            
-            # CRITICAL FIX: Send completion signal to notify adapters
-            print("📡 Sending QKD completion signal...")
-        self.host.send_classical_data({'type': 'complete'})
-        
-        # Update phase to complete
-        self.qkd_phase = "complete"
-        print("✅ BB84 PROTOCOL COMPLETE! 🎉")
-        
-        return error_rate
-
-# Wrapper class that matches simulation expectations
-class StudentImplementationBridge:
-    """Bridge wrapper that connects to enhanced implementation"""
-    def __init__(self, host):
-        self.host = host
-        # Create the enhanced bridge
-        self._bridge = EnhancedStudentImplementationBridge()
-        # CRITICAL FIX: Always set the host reference
-        self._bridge.host = host
-        print(f"🔗 Bridge attached to host: {host.name if host else 'Unknown'}")
-    
-    def set_host(self, host):
-        """Set the host reference after creation"""
-        self.host = host
-        self._bridge.host = host
-        print(f"🔗 Bridge host updated: {host.name if host else 'Unknown'}")
-    
-    def bb84_send_qubits(self, num_qubits):
-        return self._bridge.bb84_send_qubits(num_qubits)
-    
-    def process_received_qbit(self, qbit, from_channel):
-        return self._bridge.process_received_qbit(qbit, from_channel)
-    
-    def bb84_reconcile_bases(self, their_bases):
-        return self._bridge.bb84_reconcile_bases(their_bases)
-    
-    def bb84_estimate_error_rate(self, their_bits_sample):
-        return self._bridge.bb84_estimate_error_rate(their_bits_sample)
-'''
-    
-    # Write the enhanced bridge
-    with open("enhanced_student_bridge.py", "w", encoding="utf-8") as f:
-        f.write(enhanced_bridge_code)
+    """Point the simulation at the enhanced bridge that properly handles BB84 completion"""
     
     # Update status to use enhanced bridge
     status = {
         "student_implementation_ready": True,
-        "student_plugin_module": "enhanced_student_bridge",
+        "student_plugin_module": "complete_simulation_bridge",
         "student_plugin_class": "StudentImplementationBridge",
         "implementation_type": "EnhancedNotebookIntegration",
         "methods_implemented": [
@@ -343,7 +29,7 @@ class StudentImplementationBridge:
     with open("student_implementation_status.json", "w", encoding="utf-8") as f:
         json.dump(status, f, indent=2)
     
-    print("✅ Enhanced bridge created with completion signals")
+    print("✅ Enhanced bridge selected with completion signals")
     return True
 
 def disable_server_logging():
@@ -430,13 +116,6 @@ def run_complete_quantum_simulation():
             print("❌ alice and bob not found - make sure you ran Cell 13 first!")
             return False
             
-        # Check for the enhanced bridge file
-        if os.path.exists("enhanced_student_bridge.py"):
-            print("✅ Enhanced bridge files found")
-        else:
-            print("❌ Enhanced bridge files not found")
-            return False
-            
     except Exception as e:
         print(f"❌ Error checking implementation: {e}")
         return False
@@ -445,7 +124,7 @@ def run_complete_quantum_simulation():
     print("\n🔗 STEP 4: Loading enhanced student implementation bridge...")
     try:
         # Import the enhanced bridge
-        from enhanced_student_bridge import StudentImplementationBridge
+        from complete_simulation_bridge import StudentImplementationBridge
         print("✅ Enhanced student implementation bridge loaded")
     except ImportError as e:
         print(f"❌ Could not load enhanced bridge: {e}")
@@ -544,6 +223,8 @@ def run_complete_quantum_simulation():
         'adapters_done': False,
         'completion_signals': []
     }
+    # Set by the completion callbacks so the monitor can wait instead of polling
+    done_evt = threading.Event()
     
     def on_alice_qkd_complete(key):
         qkd_status['alice_done'] = True
@@ -564,6 +245,7 @@ def run_complete_quantum_simulation():
             if alice_key == bob_key:
                 print("🎉 HOST-LEVEL QKD SUCCESS! Keys match perfectly!")
                 qkd_status['completed'] = True
+                done_evt.set()
             else:
                 print("❌ Host-level QKD keys don't match")
     
@@ -651,6 +333,21 @@ def run_complete_quantum_simulation():
     alice_classical.add_quantum_adapter(adapter1)
     bob_classical.add_quantum_adapter(adapter2)
     
+    # Adapters take over each host's qkd_completed_fn; chain onto it so the
+    # monitor wakes as soon as both sides hold a shared key
+    def watch_adapter_key(adapter):
+        on_established = adapter.local_quantum_host.qkd_completed_fn
+        
+        def on_key(key):
+            on_established(key)
+            if adapter1.shared_key and adapter2.shared_key:
+                done_evt.set()
+        
+        adapter.local_quantum_host.qkd_completed_fn = on_key
+    
+    watch_adapter_key(adapter1)
+    watch_adapter_key(adapter2)
+    
     print("✅ Quantum adapters created and connected")
     print(f"   Network topology: {alice_classical.name} → {adapter1.name} ↔ {adapter2.name} ← {bob_classical.name}")
     
@@ -673,53 +370,27 @@ def run_complete_quantum_simulation():
         print("\n🔄 Processing simulation events with enhanced monitoring...")
         print("   Monitoring: Classical routing → QKD initiation → Enhanced BB84 → Completion signals")
         
-        # Enhanced monitoring with multiple completion checks
-        max_iterations = 200  # Increased for thorough monitoring
-        qkd_initiated = False
-        completion_detected = False
+        # Wait for a completion callback rather than polling on a fixed schedule
+        if not done_evt.wait(timeout=20.0):
+            print("⏱️ Timed out waiting for QKD completion")
         
-        for i in range(max_iterations):
-            time.sleep(0.1)  # Allow processing
-            
-            # Check for QKD initiation at adapter level
-            if not qkd_initiated and hasattr(adapter1, 'shared_key') and adapter1.shared_key is not None:
-                qkd_initiated = True
-                print("🔬 QKD process initiated by quantum adapters!")
-                print("   Your enhanced BB84 algorithm is now executing!")
-            
-            # Check for completion signals
-            if len(qkd_status['completion_signals']) > 0 and not completion_detected:
-                completion_detected = True
-                print("📡 Completion signals detected!")
-                for sender, signal in qkd_status['completion_signals']:
-                    print(f"   {sender}: {signal}")
-            
-            # Show progress every 20 iterations
-            if i % 20 == 0:
-                alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
-                bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
-                print(f"   Progress {i}: Alice {alice_measurements}, Bob {bob_measurements} measurements")
-                print(f"   Completion signals: {len(qkd_status['completion_signals'])}")
-            
-            # Check for completion at multiple levels
-            if qkd_status.get('completed', False):
-                print("✅ Host-level QKD completed!")
-                break
-            
-            # Check adapter-level completion with shared keys
-            if (hasattr(adapter1, 'shared_key') and adapter1.shared_key and 
-                hasattr(adapter2, 'shared_key') and adapter2.shared_key):
-                print("🔑 Adapter-level shared keys detected!")
-                qkd_status['adapters_done'] = True
-                break
-            
-            # Check for significant quantum activity + completion signals
-            alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
-            bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
-            if (alice_measurements >= 40 and bob_measurements >= 40 and 
-                len(qkd_status['completion_signals']) > 0):
-                print("📊 Significant quantum communication + completion signals detected!")
-                break
+        alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
+        bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
+        print(f"   Alice {alice_measurements}, Bob {bob_measurements} measurements")
+        print(f"   Completion signals: {len(qkd_status['completion_signals'])}")
+        
+        if qkd_status['completion_signals']:
+            print("📡 Completion signals detected!")
+            for sender, signal in qkd_status['completion_signals']:
+                print(f"   {sender}: {signal}")
+        
+        # Check for completion at multiple levels
+        if qkd_status.get('completed', False):
+            print("✅ Host-level QKD completed!")
+        elif (hasattr(adapter1, 'shared_key') and adapter1.shared_key and 
+              hasattr(adapter2, 'shared_key') and adapter2.shared_key):
+            print("🔑 Adapter-level shared keys detected!")
+            qkd_status['adapters_done'] = True
         
         print("✅ Simulation processing completed with enhanced monitoring")
         
@@ -861,13 +532,6 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
     try:
         print(f"✅ Found alice: {type(alice_instance)}")
         print(f"✅ Found bob: {type(bob_instance)}")
-        
-        # Check for the enhanced bridge file
-        if os.path.exists("enhanced_student_bridge.py"):
-            print("✅ Enhanced bridge files found")
-        else:
-            print("❌ Enhanced bridge files not found")
-            return False
             
     except Exception as e:
         print(f"❌ Error checking implementation: {e}")
@@ -877,7 +541,7 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
     print("\n🔗 STEP 4: Loading enhanced student implementation bridge...")
     try:
         # Import the enhanced bridge
-        from enhanced_student_bridge import StudentImplementationBridge
+        from complete_simulation_bridge import StudentImplementationBridge
         print("✅ Enhanced student implementation bridge loaded")
     except ImportError as e:
         print(f"❌ Could not load enhanced bridge: {e}")
@@ -985,6 +649,8 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
         'adapters_done': False,
         'completion_signals': []
     }
+    # Set by the completion callbacks so the monitor can wait instead of polling
+    done_evt = threading.Event()
     
     def on_alice_qkd_complete(key):
         qkd_status['alice_done'] = True
@@ -1005,6 +671,7 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
             if alice_key == bob_key:
                 print("🎉 HOST-LEVEL QKD SUCCESS! Keys match perfectly!")
                 qkd_status['completed'] = True
+                done_evt.set()
             else:
                 print("❌ Host-level QKD keys don't match")
     
@@ -1102,6 +769,21 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
     alice_classical.add_quantum_adapter(adapter1)
     bob_classical.add_quantum_adapter(adapter2)
     
+    # Adapters take over each host's qkd_completed_fn; chain onto it so the
+    # monitor wakes as soon as both sides hold a shared key
+    def watch_adapter_key(adapter):
+        on_established = adapter.local_quantum_host.qkd_completed_fn
+        
+        def on_key(key):
+            on_established(key)
+            if adapter1.shared_key and adapter2.shared_key:
+                done_evt.set()
+        
+        adapter.local_quantum_host.qkd_completed_fn = on_key
+    
+    watch_adapter_key(adapter1)
+    watch_adapter_key(adapter2)
+    
     print("✅ Quantum adapters created and connected")
     print(f"   Network topology: {alice_classical.name} → {adapter1.name} ↔ {adapter2.name} ← {bob_classical.name}")
     
@@ -1124,53 +806,27 @@ def run_complete_quantum_simulation_with_instances(alice_instance, bob_instance)
         print("\n🔄 Processing simulation events with enhanced monitoring...")
         print("   Monitoring: Classical routing → QKD initiation → Enhanced BB84 → Completion signals")
         
-        # Enhanced monitoring with multiple completion checks
-        max_iterations = 200  # Increased for thorough monitoring
-        qkd_initiated = False
-        completion_detected = False
+        # Wait for a completion callback rather than polling on a fixed schedule
+        if not done_evt.wait(timeout=20.0):
+            print("⏱️ Timed out waiting for QKD completion")
         
-        for i in range(max_iterations):
-            time.sleep(0.1)  # Allow processing
-            
-            # Check for QKD initiation at adapter level
-            if not qkd_initiated and hasattr(adapter1, 'shared_key') and adapter1.shared_key is not None:
-                qkd_initiated = True
-                print("🔬 QKD process initiated by quantum adapters!")
-                print("   Your enhanced BB84 algorithm is now executing!")
-            
-            # Check for completion signals
-            if len(qkd_status['completion_signals']) > 0 and not completion_detected:
-                completion_detected = True
-                print("📡 Completion signals detected!")
-                for sender, signal in qkd_status['completion_signals']:
-                    print(f"   {sender}: {signal}")
-            
-            # Show progress every 20 iterations
-            if i % 20 == 0:
-                alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
-                bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
-                print(f"   Progress {i}: Alice {alice_measurements}, Bob {bob_measurements} measurements")
-                print(f"   Completion signals: {len(qkd_status['completion_signals'])}")
-            
-            # Check for completion at multiple levels
-            if qkd_status.get('completed', False):
-                print("✅ Host-level QKD completed!")
-                break
-            
-            # Check adapter-level completion with shared keys
-            if (hasattr(adapter1, 'shared_key') and adapter1.shared_key and 
-                hasattr(adapter2, 'shared_key') and adapter2.shared_key):
-                print("🔑 Adapter-level shared keys detected!")
-                qkd_status['adapters_done'] = True
-                break
-            
-            # Check for significant quantum activity + completion signals
-            alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
-            bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
-            if (alice_measurements >= 40 and bob_measurements >= 40 and 
-                len(qkd_status['completion_signals']) > 0):
-                print("📊 Significant quantum communication + completion signals detected!")
-                break
+        alice_measurements = len(getattr(alice_quantum, 'measurement_outcomes', []))
+        bob_measurements = len(getattr(bob_quantum, 'measurement_outcomes', []))
+        print(f"   Alice {alice_measurements}, Bob {bob_measurements} measurements")
+        print(f"   Completion signals: {len(qkd_status['completion_signals'])}")
+        
+        if qkd_status['completion_signals']:
+            print("📡 Completion signals detected!")
+            for sender, signal in qkd_status['completion_signals']:
+                print(f"   {sender}: {signal}")
+        
+        # Check for completion at multiple levels
+        if qkd_status.get('completed', False):
+            print("✅ Host-level QKD completed!")
+        elif (hasattr(adapter1, 'shared_key') and adapter1.shared_key and 
+              hasattr(adapter2, 'shared_key') and adapter2.shared_key):
+            print("🔑 Adapter-level shared keys detected!")
+            qkd_status['adapters_done'] = True
         
         print("✅ Simulation processing completed with enhanced monitoring")
         
@@ -0,0 +1,333 @@
+# complete_simulation_bridge.py
+# ===================================
+# Bridge used by complete_quantum_simulation.py: wraps the student's alice/bob
+# BB84 hosts with QKD phase tracking and completion signals
+
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from bb84_kernels import sift, error_count
+
+# Helper functions for quantum operations
+# BB84 only ever uses |0>, |1>, |+> and |->, so a qubit is just its
+# (basis, bit) pair - no state vectors needed
+
+_Z_BASES = ('Z', 0)
+
+def encode_qubit(bit, basis):
+    """Return a qubit prepared in basis ('Z' or 'X') encoding the given bit."""
+    return ('Z' if basis in _Z_BASES else 'X', bit)
+
+def measure_qubit(qubit, alice_basis, bob_basis):
+    """Measure qubit in bob_basis ('Z'/'X' or 0/1)."""
+    if isinstance(qubit, tuple) and len(qubit) == 2:
+        qb_basis, bit = qubit
+        if (qb_basis in _Z_BASES) == (bob_basis in _Z_BASES):
+            return bit
+    # Mismatched basis (or unknown qubit format): the outcome is a coin flip
+    return random.getrandbits(1)
+
+class EnhancedStudentImplementationBridge:
+    """Enhanced bridge with proper QKD phase management and completion signals"""
+    
+    def __init__(self, student_alice=None, student_bob=None):
+        # Handle case where simulation instantiates without parameters
+        if student_alice is None or student_bob is None:
+            # Use global instances if available
+            try:
+                global alice, bob
+                self.student_alice = alice if 'alice' in globals() and alice is not None else self._create_dummy_host("Alice")
+                self.student_bob = bob if 'bob' in globals() and bob is not None else self._create_dummy_host("Bob")
+            except:
+                self.student_alice = self._create_dummy_host("Alice")
+                self.student_bob = self._create_dummy_host("Bob")
+        else:
+            self.student_alice = student_alice
+            self.student_bob = student_bob
+            
+        self.host = None  # CRITICAL: Will be set when attached to simulation host
+        self.qkd_phase = "idle"  # Track QKD phase: idle -> sending -> receiving -> reconciling -> error_checking -> complete
+        self.bits_received = 0
+        self.expected_bits = 50  # Default, will be updated from channel
+        self.verbose = False  # Per-qubit progress prints are slow in notebooks
+        print("🔗 Enhanced Bridge created! BB84 implementation with completion signals enabled.")
+    
+    def _create_dummy_host(self, name):
+        """Create a dummy host if student implementations aren't available"""
+        class DummyHost:
+            def __init__(self, name):
+                self.name = name
+                self.alice_bits = []
+                self.alice_bases = []
+                self.encoded_qubits = []
+                self.basis_choices = []
+                self.measurement_outcomes = []
+            
+            def bb84_send_qubits(self, num_qubits):
+                print(f"⚠️ Using dummy implementation for {self.name}")
+                return []
+        
+        return DummyHost(name)
+    
+    def bb84_send_qubits(self, num_qubits):
+        """Send qubits via the simulator using student implementation."""
+        if self.host is None:
+            print("⚠️ Bridge not attached to a simulation host")
+            return False
+            
+        self.qkd_phase = "sending"
+        self.expected_bits = num_qubits
+        print(f"🚀 Starting BB84 protocol with {num_qubits} qubits")
+        
+        # Alice prepares qubits and bases using student implementation
+        encoded_qubits = self.student_alice.bb84_send_qubits(num_qubits)
+        
+        # CRITICAL: Record Alice's bases and bits on the simulation host
+        self.host.basis_choices = list(self.student_alice.alice_bases)
+        self.host.measurement_outcomes = list(self.student_alice.alice_bits)
+        
+        # Send through the actual quantum channel
+        channel = self.host.get_channel()
+        if channel is None:
+            print(f"❌ ERROR: {self.host.name} has no quantum channel to send qubits.")
+            return False
+        
+        print(f"📤 Sending {len(encoded_qubits)} qubits through quantum channel...")
+        if hasattr(self.host, 'send_qubits'):
+            self.host.send_qubits(tuple(encoded_qubits), channel)
+        else:
+            send = self.host.send_qubit
+            for q in encoded_qubits:
+                send(q, channel)
+        
+        print(f"✅ All {len(encoded_qubits)} qubits sent successfully")
+        return True
+    
+    def process_received_qbit(self, qbit, from_channel):
+        """Measure a received qubit using student logic and store results on the host."""
+        if self.host is None:
+            return False
+            
+        if self.qkd_phase == "idle":
+            self.qkd_phase = "receiving"
+            print("📥 Started receiving qubits...")
+            
+        self.bits_received += 1
+        
+        # CRITICAL FIX: Use student's Bob implementation instead of hardcoded logic
+        if hasattr(self.student_bob, 'process_received_qbit'):
+            # Call the student's Bob implementation
+            result = self.student_bob.process_received_qbit(qbit, from_channel)
+            
+            # Update the host's state with Bob's results from student implementation.
+            # Alias rather than copy: copying on every qubit is O(n^2) over a run, and
+            # re-binding each call still follows a student that swaps in new lists
+            if hasattr(self.student_bob, 'basis_choices') and hasattr(self.student_bob, 'measurement_outcomes'):
+                self.host.basis_choices = self.student_bob.basis_choices
+                self.host.measurement_outcomes = self.student_bob.measurement_outcomes
+            
+            # Progress indicator
+            if self.verbose and self.bits_received % 10 == 0:
+                print(f"   Received {self.bits_received}/{self.expected_bits} qubits")
+            
+            # Check if we've received all expected qubits
+            if self.bits_received >= self.expected_bits:
+                print(f"✅ Received all {self.bits_received} qubits, starting reconciliation...")
+                self.qkd_phase = "ready_for_reconciliation"
+            
+            return result
+        else:
+            # Fallback to hardcoded logic if student implementation is missing
+            print("⚠️ Student Bob implementation missing process_received_qbit, using fallback")
+            
+            # Bob chooses random basis (0=Z, 1=X)
+            bob_basis = random.getrandbits(1)
+            
+            # Infer Alice basis from our simple string encoding
+            if isinstance(qbit, str):
+                alice_basis = 0 if qbit in ('|0⟩', '|1⟩') else 1
+            else:
+                # Default to random if unknown format
+                alice_basis = random.getrandbits(1)
+            
+            outcome = measure_qubit(qbit, alice_basis, bob_basis)
+            self.host.basis_choices.append(bob_basis)
+            self.host.measurement_outcomes.append(outcome)
+            
+            # Progress indicator
+            if self.verbose and self.bits_received % 10 == 0:
+                print(f"   Received {self.bits_received}/{self.expected_bits} qubits")
+            
+            # Check if we've received all expected qubits
+            if self.bits_received >= self.expected_bits:
+                print(f"✅ Received all {self.bits_received} qubits, starting reconciliation...")
+                self.qkd_phase = "ready_for_reconciliation"
+            
+            return True
+        
+    def _sift_shared_bases(self, their_bases):
+        """Return the indices where our basis matches theirs and our bits at those indices."""
+        my_bases = self.host.basis_choices
+        outcomes = self.host.measurement_outcomes
+        n = min(len(my_bases), len(their_bases), len(outcomes))
+        if np is None:
+            shared_indices = [i for i in range(n) if my_bases[i] == their_bases[i]]
+            return shared_indices, [outcomes[i] for i in shared_indices]
+        
+        mine = np.asarray(my_bases[:n])
+        theirs = np.asarray(their_bases[:n])
+        if sift is not None and mine.dtype.kind in 'biu' and theirs.dtype.kind in 'biu':
+            shared_indices, shared_bits = sift(mine, theirs, np.asarray(outcomes[:n], dtype=np.int64))
+        else:
+            # One vectorised compare + gather instead of a Python loop per qubit
+            shared_indices = np.flatnonzero(mine == theirs)
+            shared_bits = np.asarray(outcomes[:n])[shared_indices]
+        return shared_indices.tolist(), shared_bits.tolist()
+    
+    def bb84_reconcile_bases(self, their_bases):
+        """Find matching bases and trigger error rate estimation."""
+        if self.host is None:
+            return False
+            
+        self.qkd_phase = "reconciling"
+        print("🔄 Starting basis reconciliation...")
+        
+        # CRITICAL FIX: Use student's Bob implementation for reconciliation
+        if hasattr(self.student_bob, 'bb84_reconcile_bases'):
+            # Call the student's Bob implementation
+            result = self.student_bob.bb84_reconcile_bases(their_bases)
+            
+            # Update the host's state with Bob's results from student implementation
+            if hasattr(self.student_bob, 'shared_bases_indices') and hasattr(self.student_bob, 'shared_bits'):
+                self.host.shared_bases_indices = list(self.student_bob.shared_bases_indices)
+                shared_bits = list(self.student_bob.shared_bits)
+            else:
+                # Fallback: extract from student's measurement outcomes
+                shared_indices, shared_bits = self._sift_shared_bases(their_bases)
+                self.host.shared_bases_indices = shared_indices
+            
+            # Notify peer about shared indices
+            self.host.send_classical_data({
+                'type': 'shared_bases_indices', 
+                'data': self.host.shared_bases_indices
+            })
+            
+            return self.host.shared_bases_indices, shared_bits
+        else:
+            # Fallback to hardcoded logic if student implementation is missing
+            print("⚠️ Student Bob implementation missing bb84_reconcile_bases, using fallback")
+            
+            # Find shared indices where bases match
+            shared_indices, shared_bits = self._sift_shared_bases(their_bases)
+            self.host.shared_bases_indices = shared_indices
+            
+            print(f"✅ Reconciliation complete: {len(shared_indices)} shared bases out of {len(their_bases)} total")
+            print(f"   Efficiency: {len(shared_indices)/len(their_bases)*100:.1f}%")
+            
+            # Notify peer about shared indices
+            self.host.send_classical_data({
+                'type': 'shared_bases_indices', 
+                'data': shared_indices
+            })
+            
+            return shared_indices, shared_bits
+    
+    def _count_sample_errors(self, their_bits_sample):
+        """Return (errors, comparisons) for the (bit, index) pairs that fall inside our outcomes."""
+        outcomes = self.host.measurement_outcomes
+        if np is None or not their_bits_sample:
+            errors = comparisons = 0
+            for bit, idx in their_bits_sample:
+                if 0 <= idx < len(outcomes):
+                    comparisons += 1
+                    if outcomes[idx] != bit:
+                        errors += 1
+            return errors, comparisons
+        
+        sample = np.asarray(their_bits_sample, dtype=np.int64)
+        bits, idxs = sample[:, 0], sample[:, 1]
+        if error_count is not None:
+            return error_count(bits, idxs, np.asarray(outcomes, dtype=np.int64))
+        valid = (idxs >= 0) & (idxs < len(outcomes))
+        ours = np.asarray(outcomes, dtype=np.int64)[idxs[valid]]
+        return int(np.count_nonzero(ours != bits[valid])), int(np.count_nonzero(valid))
+    
+    def bb84_estimate_error_rate(self, their_bits_sample):
+        """Compute error rate and CRITICAL: send completion signal."""
+        if self.host is None:
+            return False
+            
+        self.qkd_phase = "error_checking"
+        print("🔍 Starting error rate estimation...")
+        
+        # CRITICAL FIX: Use student's Bob implementation for error rate estimation
+        if hasattr(self.student_bob, 'bb84_estimate_error_rate'):
+            # Call the student's Bob implementation
+            error_rate = self.student_bob.bb84_estimate_error_rate(their_bits_sample)
+            
+            print(f"📊 Student error rate estimation complete: {error_rate:.1%}")
+            
+            # Store learning stats
+            if hasattr(self.host, 'learning_stats'):
+                self.host.learning_stats['error_rates'].append(error_rate)
+            
+            # CRITICAL FIX: Send completion signal to notify adapters
+            print("📡 Sending QKD completion signal...")
+        else:
+            # Fallback to hardcoded logic if student implementation is missing
+            print("⚠️ Student Bob implementation missing bb84_estimate_error_rate, using fallback")
+            
+            errors, comparisons = self._count_sample_errors(their_bits_sample)
+            error_rate = (errors / comparisons) if comparisons > 0 else 0.0
+            
+            print(f"📊 Error rate estimation complete:")
+            print(f"   Sampled {comparisons} bits")
+            print(f"   Found {errors} errors")
+            print(f"   Error rate: {error_rate:.1%}")
+            
+            # Store learning stats
+            if hasattr(self.host, 'learning_stats'):
+                self.host.learning_stats['error_rates'].append(error_rate)
+            
+            # CRITICAL FIX: Send completion signal to notify adapters
+            print("📡 Sending QKD completion signal...")
+        self.host.send_classical_data({'type': 'complete'})
+        
+        # Update phase to complete
+        self.qkd_phase = "complete"
+        print("✅ BB84 PROTOCOL COMPLETE! 🎉")
+        
+        return error_rate
+
+# Wrapper class that matches simulation expectations
+class StudentImplementationBridge:
+    """Bridge wrapper that connects to enhanced implementation"""
+    def __init__(self, host):
+        self.host = host
+        # Create the enhanced bridge
+        self._bridge = EnhancedStudentImplementationBridge()
+        # CRITICAL FIX: Always set the host reference
+        self._bridge.host = host
+        print(f"🔗 Bridge attached to host: {host.name if host else 'Unknown'}")
+    
+    def set_host(self, host):
+        """Set the host reference after creation"""
+        self.host = host
+        self._bridge.host = host
+        print(f"🔗 Bridge host updated: {host.name if host else 'Unknown'}")
+    
+    def bb84_send_qubits(self, num_qubits):
+        return self._bridge.bb84_send_qubits(num_qubits)
+    
+    def process_received_qbit(self, qbit, from_channel):
+        return self._bridge.process_received_qbit(qbit, from_channel)
+    
+    def bb84_reconcile_bases(self, their_bases):
+        return self._bridge.bb84_reconcile_bases(their_bases)
+    
+    def bb84_estimate_error_rate(self, their_bits_sample):
+        return self._bridge.bb84_estimate_error_rate(their_bits_sample)
@@ -1,3 +1,6 @@
+import logging
+import logging.handlers
+import queue
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import yaml
@@ -61,3 +64,21 @@ def clear_config_cache():
     """Clear the cached configuration to force reload"""
     global loaded_config
     loaded_config = None
+
+
+def start_logging(logging_config: LoggingConfig) -> logging.handlers.QueueListener:
+    """Route root logging through a queue so formatting and I/O run on a background thread.
+
+    Call ``stop()`` on the returned listener at shutdown to flush pending records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging_config.format))
+
+    root = logging.getLogger()
+    root.setLevel(logging_config.level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
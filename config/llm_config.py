@@ -13,6 +13,12 @@ class LLMConfig(BaseModel):
     max_tokens: Optional[int] = 1000
     retry_attempts: int = 3
 
+    # HTTP connection pool shared by all OpenAI-compatible clients
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    http2: bool = False  # requires the h2 package (httpx[http2])
+
     # LangChain Config
     langchain_api_key: Optional[SecretStr] = None
     langchain_project_name: str = "simulator_agent_dev"
@@ -22,6 +28,19 @@ class LLMConfig(BaseModel):
 class AgentValidationConfig(BaseModel):
     enabled: bool = True
     regenerate_on_invalid: bool = True
+    # Start a second synthesis while validation runs and use it if a retry is
+    # recommended. Saves a round-trip but the retry does not see the feedback.
+    speculative_retry: bool = False
+
+class QnACacheConfig(BaseModel):
+    # Reuse topology QnA answers for semantically similar questions on an unchanged world
+    enabled: bool = False
+    similarity_threshold: float = Field(0.92, ge=0.0, le=1.0)
+    ttl_seconds: int = 3600
+    max_entries_per_world: int = 64
 
 class AgentConfig(BaseModel):
-    agent_validation: AgentValidationConfig
\ No newline at end of file
+    agent_validation: AgentValidationConfig
+    qna_cache: QnACacheConfig = Field(default_factory=QnACacheConfig)
+    # Verbose executor logging and intermediate-step capture, for development only
+    debug: bool = False
\ No newline at end of file
@@ -140,6 +140,25 @@ class Node(Sobject):
     def forward(self):
         pass
 
+    def on_update_batch(self, events):
+        # Same as on_update, but the log file and the manager are looked up once
+        with open("log.txt", "a", encoding="utf-8") as f:
+            f.writelines(f"{self.name} received event {event.data}\n" for event in events)
+
+        if self.on_update_func:
+            for event in events:
+                self.on_update_func(event)
+        else:
+            try:
+                from server.api.simulation.manager import SimulationManager
+                manager = SimulationManager.get_instance()
+                if manager.is_running:
+                    for event in events:
+                        manager.on_update(event)
+            except Exception:
+                # Server stack not available; ignore and continue
+                pass
+
     def on_update(self, event):
         # Temporalty
         with open("log.txt", "a", encoding="utf-8") as f:
@@ -1,11 +1,14 @@
 
+import sys
 import uuid
 import logging
+from typing import List
 from core.enums import SimulationEventType
 from core.event import Event
 
 class Sobject:
-    on_update_func = None
+    # Subclasses that declare their own __slots__ carry no per-instance __dict__
+    __slots__ = ("name", "description", "logger", "on_update_func")
 
     def __init__(self, name="", description="",
         *args,
@@ -15,9 +18,7 @@ class Sobject:
         )  # Assign a unique ID if name is not provided
         self.description = description
         self.logger = self._setup_logger()
-
-        if 'on_update_func' in kwargs:
-            self.on_update_func = kwargs['on_update_func']
+        self.on_update_func = kwargs.get('on_update_func')
         
         
     def set_on_update_func(self, func):
@@ -38,10 +39,26 @@ class Sobject:
 
         return logger
 
+    def _has_update_subscribers(self) -> bool:
+        """Whether an event sent now would reach anyone, so hot paths can skip building it."""
+        if self.on_update_func:
+            return True
+        # Without the server loaded (e.g. notebook runs) nothing is listening
+        manager_module = sys.modules.get("server.api.simulation.manager")
+        if manager_module is None:
+            return False
+        manager = manager_module.SimulationManager._instance
+        return manager is not None and getattr(manager, "is_running", False)
+
     def _send_update(self, event_type: SimulationEventType, **kwargs):
         event = Event(event_type, self, **kwargs)
         self.on_update(event)
 
+    def on_update_batch(self, events: List[Event]):
+        """Deliver events collected over one simulation step, in order."""
+        for event in events:
+            self.on_update(event)
+
     def on_update(self, event: Event):
         if self.on_update_func:
             self.on_update_func(event)
@@ -12,6 +12,14 @@ import json
 import sys
 import importlib.util
 
+def _list_dir(path):
+    """Return the set of entry names in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def check_notebook_integration():
     """Check if notebook integration is working properly"""
     print("🔍 NOTEBOOK INTEGRATION STATUS CHECK")
@@ -19,9 +27,18 @@ def check_notebook_integration():
     
     issues = []
     
+    # One directory read per folder instead of a stat call per file
+    listings = {}
+    def exists(file):
+        directory, name = os.path.split(file)
+        directory = directory or "."
+        if directory not in listings:
+            listings[directory] = _list_dir(directory)
+        return name in listings[directory]
+    
     # 1. Check student implementation status file
     print("1. Checking student implementation status...")
-    if os.path.exists("student_implementation_status.json"):
+    if exists("student_implementation_status.json"):
         try:
             with open("student_implementation_status.json", 'r') as f:
                 status = json.load(f)
@@ -43,7 +60,7 @@ def check_notebook_integration():
     
     # 2. Check student bridge file
     print("\n2. Checking student bridge file...")
-    if os.path.exists("student_impl_bridge.py"):
+    if exists("student_impl_bridge.py"):
         try:
             spec = importlib.util.spec_from_file_location("student_impl_bridge", "student_impl_bridge.py")
             module = importlib.util.module_from_spec(spec)
@@ -85,7 +102,7 @@ def check_notebook_integration():
     print("\n4. Checking simulation files...")
     files = ['main.py', 'start.py', 'quantum_network/interactive_host.py']
     for file in files:
-        if os.path.exists(file):
+        if exists(file):
             print(f"   ✅ {file}: EXISTS")
         else:
             print(f"   ❌ {file}: MISSING")
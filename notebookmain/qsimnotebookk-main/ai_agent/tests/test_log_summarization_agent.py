@@ -89,9 +89,9 @@ async def test_message_processing(log_agent):
     if not log_agent:
         pytest.skip("Log agent not initialized properly.")
 
-    logs = "\n".join(SAMPLE_LOGS)
     """Test direct message processing."""
-    message = {"content": f"Please summarize these logs:\n{''.join(logs)}"}
+    logs_text = "\n".join(SAMPLE_LOGS)
+    message = {"content": f"Please summarize these logs:\n{logs_text}"}
 
     result = await log_agent.process_message(message)
     print("------------------", result)
@@ -1,4 +1,4 @@
-from queue import Queue
+from collections import deque
 from typing import List, Tuple
 
 # qutip is optional here; safe to keep the import if your env has it
@@ -45,7 +45,8 @@ class QuantumAdapter(Node):
         self.type = NodeType.QUANTUM_ADAPTER
         self.classical_network = classical_network
         self.quantum_network = quantum_network
-        self.input_data_buffer = Queue()
+        # Packets held back until QKD yields a key; deque append/popleft are atomic
+        self.input_data_buffer = deque()
 
         # QKD state
         self.shared_key: List[int] | None = None
@@ -122,9 +123,9 @@ class QuantumAdapter(Node):
         self.logger.debug(f"QKD Established {key}")
 
         # Flush buffered packets now that we can decrypt/encrypt
-        while not self.input_data_buffer.empty():
-            packet = self.input_data_buffer.get()
-            self.receive_packet(packet)
+        buffer = self.input_data_buffer
+        while buffer:
+            self.receive_packet(buffer.popleft())
 
     def calculate_distance(self, node1, node2):
         x1, y1 = node1.location
@@ -205,7 +206,7 @@ class QuantumAdapter(Node):
                 print(f"🔍 {self.name}: No shared key, buffering packet")
                 if not self._qkd_in_progress:
                     self.initiate_qkd()
-                self.input_data_buffer.put(packet)
+                self.input_data_buffer.append(packet)
                 return
 
             # 4) If destined to the paired adapter, encrypt then forward
@@ -605,6 +605,13 @@ class InteractiveQuantumHost(QuantumNode):
         channel.transmit_qubit(qubit, self)
         self.qmemory = None
 
+    def send_qubits(self, qubits, channel: QuantumChannel):
+        """Send a batch of qubits through the quantum channel"""
+        transmit = channel.transmit_qubit
+        for qubit in qubits:
+            transmit(qubit, self)
+        self.qmemory = None
+
     def get_channel(self, to_host: QuantumNode = None):
         """Get quantum channel to specified host"""
         if to_host is None:
@@ -5,7 +5,7 @@ from ai_agent.src.consts.agent_type import AgentType
 from fastapi import HTTPException
 
 from ai_agent.src.consts.workflow_type import WorkflowType
-from ai_agent.src.orchestration.coordinator import Coordinator
+from ai_agent.src.orchestration.coordinator import get_coordinator
 from data.models.conversation.conversation_model import MessageRole
 from data.models.conversation.conversation_ops import add_chat_message, create_conversation_metadata, get_conversation_metadata
 from server.api.agent.agent_request import AgentInteractionRequest, AgentRouterRequest
@@ -22,7 +22,7 @@ agent_router = APIRouter(
 
 async def handle_routing_request(message_dict: Dict[str, Any]):
     message = AgentRouterRequest(**message_dict)
-    agent_coordinator = Coordinator()
+    agent_coordinator = get_coordinator()
     response = await agent_coordinator.execute_workflow(WorkflowType.ROUTING, message.model_dump())
     return response
 
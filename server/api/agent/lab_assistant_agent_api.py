@@ -8,7 +8,7 @@ from ai_agent.src.agents.lab_assistant.structures import (
     VibeCodeInput,
 )
 from ai_agent.src.consts.workflow_type import WorkflowType
-from ai_agent.src.orchestration.coordinator import Coordinator
+from ai_agent.src.orchestration.coordinator import get_coordinator
 
 
 async def handle_lab_assistant(message_dict: Dict[str, Any]):
@@ -22,9 +22,9 @@ async def handle_lab_assistant(message_dict: Dict[str, Any]):
     else:
         raise HTTPException("Invalid task ID")
 
-    agent_coordinator = Coordinator()
+    agent_coordinator = get_coordinator()
     response = await agent_coordinator.execute_workflow(
-        WorkflowType.LAB_ASSISTANT_WORKFLOW.value,
+        WorkflowType.LAB_ASSISTANT_WORKFLOW,
         {
             "task_data": {
                 "task_id": task_id,
@@ -11,7 +11,7 @@ import os
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.agents.log_summarization.structures import RealtimeLogSummaryInput
 from ai_agent.src.consts.agent_type import AgentType
-from ai_agent.src.orchestration.coordinator import Coordinator
+from ai_agent.src.orchestration.coordinator import get_coordinator
 from config.config import get_config
 from core.base_classes import World
 from core.enums import SimulationEventType
@@ -38,7 +38,7 @@ class SimulationManager:
     simulation_world: World = None
     logs_to_summarize :List[LogEntryModel]= []
     last_summarized_on: int = None
-    agent_coordinator = Coordinator()
+    agent_coordinator = get_coordinator()
     current_log_summary: List[str] = []
     socket_conn: ConnectionManager = None
     config = get_config()
@@ -194,11 +194,11 @@ class SimulationManager:
     async def _run_direct_log_summarization(self, logs_to_summarize):
         """Run log summarization directly when Celery is not available"""
         try:
-            from ai_agent.src.orchestration.coordinator import Coordinator
+            from ai_agent.src.orchestration.coordinator import get_coordinator
             from ai_agent.src.agents.base.enums import AgentTaskType
             from ai_agent.src.agents.log_summarization.structures import RealtimeLogSummaryInput
             
-            coordinator = Coordinator()
+            coordinator = get_coordinator()
             
             # Create input for realtime log summary
             agent_args = RealtimeLogSummaryInput(
@@ -71,6 +71,9 @@ app = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from config.config import get_config, start_logging
+    log_listener = start_logging(get_config().logging)
+
     # Initialize Redis and AI agents for full functionality
     print("🚀 Starting backend with full AI agent and Redis support...")
     print("   Initializing Redis and AI agents for log summarization")
@@ -94,6 +97,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("🛑 Backend server shutting down...")
+    log_listener.stop()
 
 app = get_app(lifespan=lifespan)
 
@@ -11,14 +11,14 @@ import asyncio
 from ai_agent.src.agents.base.enums import AgentTaskType
 from ai_agent.src.agents.log_summarization.structures import RealtimeLogSummaryInput
 from ai_agent.src.consts.agent_type import AgentType
-from ai_agent.src.orchestration.coordinator import Coordinator
+from ai_agent.src.orchestration.coordinator import get_coordinator
 from config.config import get_config
 
 class MyCelery(Celery):
 
     def on_init(self):
         print("Initializing system...")
-        asyncio.run(Coordinator().initialize_system())
+        asyncio.run(get_coordinator().initialize_system())
         
 
 redis_config = get_config().redis
@@ -45,7 +45,7 @@ def summarize_logs_task(self, simulation_id: str, previous_summary: List[str],
     """Celery task to summarize logs in background"""
     try:
         # Create coordinator instance
-        coordinator = Coordinator()
+        coordinator = get_coordinator()
         
         agent_args = RealtimeLogSummaryInput(
             simulation_id=simulation_id,
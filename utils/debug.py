@@ -1,17 +1,22 @@
 import functools
 import inspect
+import os
 import random
 import sys
 
-ENABLE_DEBUG = False
+# Set QSIM_DEBUG=1 (or true/yes/on) in the environment to trace decorated calls.
+# The flag is read when this module is imported and applied when each function
+# is decorated, so changing ENABLE_DEBUG at runtime has no effect.
+ENABLE_DEBUG = os.environ.get("QSIM_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
 
 def print_caller(func):
+    if not ENABLE_DEBUG:
+        # Leave the function undecorated so it costs nothing
+        return func
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
 
-        if not ENABLE_DEBUG:
-            return func(*args, **kwargs)
-
         # Get the frame of the caller
         frame = sys._getframe(1)
         id = random.randint(0, 1000000)